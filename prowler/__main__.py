@@ -14,6 +14,7 @@ from prowler.config.config import (
     json_ocsf_file_suffix,
 )
 from prowler.lib.banner import print_banner
+from prowler.lib.check.catalog import load_check_catalog
 from prowler.lib.check.check import (
     exclude_checks_to_run,
     exclude_services_to_run,
@@ -42,39 +43,14 @@ from prowler.lib.check.custom_checks_metadata import (
 from prowler.lib.check.models import CheckMetadata
 from prowler.lib.cli.parser import ProwlerArgumentParser
 from prowler.lib.logger import logger, set_logging_config
-from prowler.lib.outputs.asff.asff import ASFF
-from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
-    AWSWellArchitected,
+from prowler.lib.outputs.outputs import (
+    extract_findings_statistics,
+    remove_output_files,
 )
-from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
-from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
-from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
-from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
-from prowler.lib.outputs.compliance.compliance import display_compliance_table
-from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
-from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
-from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
-from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import AWSMitreAttack
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
-    AzureMitreAttack,
-)
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
-from prowler.lib.outputs.csv.csv import CSV
-from prowler.lib.outputs.finding import Finding
-from prowler.lib.outputs.html.html import HTML
-from prowler.lib.outputs.ocsf.ocsf import OCSF
-from prowler.lib.outputs.outputs import extract_findings_statistics
-from prowler.lib.outputs.slack.slack import Slack
-from prowler.lib.outputs.summary_table import display_summary_table
-from prowler.providers.aws.lib.s3.s3 import S3
-from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
-from prowler.providers.aws.models import AWSOutputOptions
-from prowler.providers.azure.models import AzureOutputOptions
+from prowler.lib.profiling.profiling import enable_profiler
+from prowler.lib.scan.checkpoint import ScanCheckpoint
 from prowler.providers.common.provider import Provider
 from prowler.providers.common.quick_inventory import run_provider_quick_inventory
-from prowler.providers.gcp.models import GCPOutputOptions
-from prowler.providers.kubernetes.models import KubernetesOutputOptions
 
 
 def prowler():
@@ -126,6 +102,11 @@ def prowler():
     # Set Logger configuration
     set_logging_config(args.log_level, args.log_file, args.only_logs)
 
+    # Load the precompiled checks and compliance catalog, the custom checks are not part of it
+    check_catalog = None
+    if not checks_folder:
+        check_catalog = load_check_catalog(provider)
+
     if args.list_services:
         print_services(list_services(provider))
         sys.exit()
@@ -136,7 +117,10 @@ def prowler():
 
     # Load checks metadata
     logger.debug("Loading checks metadata from .metadata.json files")
-    bulk_checks_metadata = CheckMetadata.get_bulk(provider)
+    if check_catalog:
+        bulk_checks_metadata = check_catalog.get_bulk_checks_metadata()
+    else:
+        bulk_checks_metadata = CheckMetadata.get_bulk(provider)
 
     if args.list_categories:
         print_categories(list_categories(bulk_checks_metadata))
@@ -146,7 +130,10 @@ def prowler():
     # Load compliance frameworks
     logger.debug("Loading compliance frameworks from .json files")
 
-    bulk_compliance_frameworks = Compliance.get_bulk(provider)
+    if check_catalog:
+        bulk_compliance_frameworks = check_catalog.compliance_frameworks
+    else:
+        bulk_compliance_frameworks = Compliance.get_bulk(provider)
     # Complete checks metadata with the compliance framework specification
     bulk_checks_metadata = update_checks_metadata_with_compliance(
         bulk_compliance_frameworks, bulk_checks_metadata
@@ -194,6 +181,11 @@ def prowler():
         print_checks(provider, sorted(checks_to_execute), bulk_checks_metadata)
         sys.exit()
 
+    # Profile the scan if --profile-report, before the provider creates its sessions
+    profiler = None
+    if args.profile_report:
+        profiler = enable_profiler()
+
     # Provider to scan
     Provider.init_global_provider(args)
     global_provider = Provider.get_global_provider()
@@ -239,20 +231,42 @@ def prowler():
     # Setup Mutelist
     global_provider.mutelist = args.mutelist_file
 
+    # Resume an interrupted scan if --resume
+    checkpoint = None
+    if args.resume:
+        checkpoint = ScanCheckpoint.load(args.resume)
+        if checkpoint.provider != provider:
+            logger.critical(
+                f"The scan {args.resume} was executed with the {checkpoint.provider.upper()} provider, not {provider.upper()}"
+            )
+            sys.exit(1)
+        # The outputs of the interrupted scan are written again with the same name
+        if not args.output_filename:
+            args.output_filename = checkpoint.output_filename
+
     # Setup Output Options
+    # The models of each provider are imported only when it is scanned, since they import its SDK
     if provider == "aws":
+        from prowler.providers.aws.models import AWSOutputOptions
+
         output_options = AWSOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "azure":
+        from prowler.providers.azure.models import AzureOutputOptions
+
         output_options = AzureOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "gcp":
+        from prowler.providers.gcp.models import GCPOutputOptions
+
         output_options = GCPOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "kubernetes":
+        from prowler.providers.kubernetes.models import KubernetesOutputOptions
+
         output_options = KubernetesOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
@@ -262,6 +276,43 @@ def prowler():
         run_provider_quick_inventory(global_provider, args)
         sys.exit()
 
+    # Checkpoint the completed checks to resume the scan if it is interrupted
+    if checkpoint:
+        # The outputs are written again from the findings of the checkpoint, since the
+        # files of the interrupted scan can be incomplete
+        remove_output_files(
+            output_options.output_directory, output_options.output_filename
+        )
+    else:
+        try:
+            checkpoint = ScanCheckpoint.create(provider, output_options.output_filename)
+            logger.info(f"Scan ID: {checkpoint.scan_id}")
+        except Exception as error:
+            # The scan is executed anyway, but it cannot be resumed
+            logger.warning(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    # Compliance Frameworks outputs
+    input_compliance_frameworks = set(output_options.output_modes).intersection(
+        get_available_compliance_frameworks(provider)
+    )
+
+    # Write the findings of each check as soon as it finishes if --stream-outputs
+    streaming_outputs = None
+    if args.stream_outputs:
+        from prowler.lib.outputs.streaming import StreamingOutputs
+
+        streaming_outputs = StreamingOutputs(
+            global_provider,
+            output_options,
+            args.output_formats,
+            {
+                compliance_name: bulk_compliance_frameworks[compliance_name]
+                for compliance_name in input_compliance_frameworks
+            },
+        )
+
     # Execute checks
     findings = []
 
@@ -272,6 +323,9 @@ def prowler():
             custom_checks_metadata,
             args.config_file,
             output_options,
+            parallel_checks=args.parallel_checks,
+            findings_handler=streaming_outputs.write if streaming_outputs else None,
+            checkpoint=checkpoint,
         )
     else:
         logger.error(
@@ -294,8 +348,14 @@ def prowler():
                 )
         else:
             print(f"{Style.BRIGHT}{Fore.GREEN}\nNo findings to fix!{Style.RESET_ALL}\n")
+        if checkpoint:
+            checkpoint.remove()
         sys.exit()
 
+    # The findings were already written, only their summary is kept
+    if streaming_outputs:
+        findings = streaming_outputs.findings
+
     # Extract findings stats
     stats = extract_findings_statistics(findings)
 
@@ -312,6 +372,8 @@ def prowler():
                 else environ["SLACK_CHANNEL_ID"]
             )
             prowler_args = " ".join(sys.argv[1:])
+            from prowler.lib.outputs.slack.slack import Slack
+
             slack = Slack(token, channel, global_provider)
             _ = slack.send(stats, prowler_args)
         else:
@@ -322,281 +384,87 @@ def prowler():
             sys.exit(1)
 
     # Outputs
-    # TODO: this part is needed since the checks generates a Check_Report_XXX and the output uses Finding
-    # This will be refactored for the outputs generate directly the Finding
-    finding_outputs = [
-        Finding.generate_output(global_provider, finding, output_options)
-        for finding in findings
-    ]
-
-    generated_outputs = {"regular": [], "compliance": []}
-
-    if args.output_formats:
-        for mode in args.output_formats:
-            filename = (
-                f"{output_options.output_directory}/"
-                f"{output_options.output_filename}"
-            )
-            if mode == "csv":
-                csv_output = CSV(
-                    findings=finding_outputs,
-                    create_file_descriptor=True,
-                    file_path=f"{filename}{csv_file_suffix}",
-                )
-                generated_outputs["regular"].append(csv_output)
-                # Write CSV Finding Object to file
-                csv_output.batch_write_data_to_file()
-
-            if mode == "json-asff":
-                asff_output = ASFF(
-                    findings=finding_outputs,
-                    create_file_descriptor=True,
-                    file_path=f"{filename}{json_asff_file_suffix}",
-                )
-                generated_outputs["regular"].append(asff_output)
-                # Write ASFF Finding Object to file
-                asff_output.batch_write_data_to_file()
-
-            if mode == "json-ocsf":
-                json_output = OCSF(
-                    findings=finding_outputs,
-                    create_file_descriptor=True,
-                    file_path=f"{filename}{json_ocsf_file_suffix}",
-                )
-                generated_outputs["regular"].append(json_output)
-                json_output.batch_write_data_to_file()
-            if mode == "html":
-                html_output = HTML(
-                    findings=finding_outputs,
-                    create_file_descriptor=True,
-                    file_path=f"{filename}{html_file_suffix}",
-                )
-                generated_outputs["regular"].append(html_output)
-                html_output.batch_write_data_to_file(
-                    provider=global_provider, stats=stats
-                )
-
-    # Compliance Frameworks
-    input_compliance_frameworks = set(output_options.output_modes).intersection(
-        get_available_compliance_frameworks(provider)
-    )
-    if provider == "aws":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = AWSCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_aws":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = AWSMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = AWSENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("aws_well_architected_framework"):
-                # Generate AWS Well-Architected Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                aws_well_architected = AWSWellArchitected(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(aws_well_architected)
-                aws_well_architected.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = AWSISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            elif compliance_name.startswith("kisa"):
-                # Generate KISA-ISMS-P Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                kisa_ismsp = AWSKISAISMSP(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(kisa_ismsp)
-                kisa_ismsp.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "azure":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = AzureCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_azure":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = AzureMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "gcp":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = GCPCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_gcp":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = GCPMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            else:
+    if streaming_outputs:
+        streaming_outputs.close(stats)
+        generated_outputs = streaming_outputs.generated_outputs
+    else:
+        from prowler.lib.outputs.asff.asff import ASFF
+        from prowler.lib.outputs.compliance.compliance_outputs import (
+            get_compliance_output_class,
+        )
+        from prowler.lib.outputs.csv.csv import CSV
+        from prowler.lib.outputs.finding import Finding
+        from prowler.lib.outputs.html.html import HTML
+        from prowler.lib.outputs.ocsf.ocsf import OCSF
+
+        # TODO: this part is needed since the checks generates a Check_Report_XXX and the output uses Finding
+        # This will be refactored for the outputs generate directly the Finding
+        finding_outputs = [
+            Finding.generate_output(global_provider, finding, output_options)
+            for finding in findings
+        ]
+
+        generated_outputs = {"regular": [], "compliance": []}
+
+        if args.output_formats:
+            for mode in args.output_formats:
                 filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "kubernetes":
+                    f"{output_options.output_directory}/"
+                    f"{output_options.output_filename}"
+                )
+                if mode == "csv":
+                    csv_output = CSV(
+                        findings=finding_outputs,
+                        create_file_descriptor=True,
+                        file_path=f"{filename}{csv_file_suffix}",
+                    )
+                    generated_outputs["regular"].append(csv_output)
+                    # Write CSV Finding Object to file
+                    csv_output.batch_write_data_to_file()
+
+                if mode == "json-asff":
+                    asff_output = ASFF(
+                        findings=finding_outputs,
+                        create_file_descriptor=True,
+                        file_path=f"{filename}{json_asff_file_suffix}",
+                    )
+                    generated_outputs["regular"].append(asff_output)
+                    # Write ASFF Finding Object to file
+                    asff_output.batch_write_data_to_file()
+
+                if mode == "json-ocsf":
+                    json_output = OCSF(
+                        findings=finding_outputs,
+                        create_file_descriptor=True,
+                        file_path=f"{filename}{json_ocsf_file_suffix}",
+                    )
+                    generated_outputs["regular"].append(json_output)
+                    json_output.batch_write_data_to_file()
+                if mode == "html":
+                    html_output = HTML(
+                        findings=finding_outputs,
+                        create_file_descriptor=True,
+                        file_path=f"{filename}{html_file_suffix}",
+                    )
+                    generated_outputs["regular"].append(html_output)
+                    html_output.batch_write_data_to_file(
+                        provider=global_provider, stats=stats
+                    )
+
+        # Compliance Frameworks
         for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = KubernetesCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
+            filename = (
+                f"{output_options.output_directory}/compliance/"
+                f"{output_options.output_filename}_{compliance_name}.csv"
+            )
+            compliance_output = get_compliance_output_class(provider, compliance_name)(
+                findings=finding_outputs,
+                compliance=bulk_compliance_frameworks[compliance_name],
+                create_file_descriptor=True,
+                file_path=filename,
+            )
+            generated_outputs["compliance"].append(compliance_output)
+            compliance_output.batch_write_data_to_file()
 
     # AWS Security Hub Integration
     if provider == "aws":
@@ -608,6 +476,8 @@ def prowler():
             if args.output_bucket_no_assume:
                 output_bucket = args.output_bucket_no_assume
                 bucket_session = global_provider.session.original_session
+            from prowler.providers.aws.lib.s3.s3 import S3
+
             s3 = S3(
                 session=bucket_session,
                 bucket_name=output_bucket,
@@ -619,10 +489,12 @@ def prowler():
                 f"{Style.BRIGHT}\nSending findings to AWS Security Hub, please wait...{Style.RESET_ALL}"
             )
 
-            security_hub_regions = (
-                global_provider.get_available_aws_service_regions("securityhub")
-                if not global_provider.identity.audited_regions
-                else global_provider.identity.audited_regions
+            security_hub_regions = global_provider.get_enabled_aws_service_regions(
+                "securityhub"
+            )
+
+            from prowler.providers.aws.lib.security_hub.security_hub import (
+                SecurityHub,
             )
 
             security_hub = SecurityHub(
@@ -651,8 +523,15 @@ def prowler():
                     f"{Style.BRIGHT}{Fore.GREEN}\n{findings_archived_in_security_hub} findings archived in AWS Security Hub!{Style.RESET_ALL}"
                 )
 
+    # The scan is completed, so it does not need to be resumed
+    if checkpoint:
+        checkpoint.remove()
+
     # Display summary table
     if not args.only_logs:
+        from prowler.lib.outputs.compliance.compliance import display_compliance_table
+        from prowler.lib.outputs.summary_table import display_summary_table
+
         display_summary_table(
             findings,
             global_provider,
@@ -684,6 +563,12 @@ def prowler():
                     f"\nDetailed compliance results are in {Fore.YELLOW}{output_options.output_directory}/compliance/{Style.RESET_ALL}\n"
                 )
 
+    # Profile report
+    if profiler:
+        profiler.write_report(args.profile_report)
+        if not args.only_logs:
+            profiler.display_summary(args.profile_report)
+
     # If custom checks were passed, remove the modules
     if checks_folder:
         remove_custom_checks_module(checks_folder, provider)
@@ -66,6 +66,12 @@ default_fixer_config_file_path = (
     f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/fixer_config.yaml"
 )
 encoding_format_utf_8 = "utf-8"
+# Directory to store the precompiled check catalogs
+default_cache_directory = os.environ.get(
+    "PROWLER_CACHE_DIR", f"{pathlib.Path.home()}/.cache/prowler"
+)
+# Directory to store the checkpoints of the scans to resume them with --resume
+default_scan_checkpoints_directory = f"{default_cache_directory}/scans"
 available_output_formats = ["csv", "json-asff", "json-ocsf", "html"]
 
 
@@ -0,0 +1,200 @@
+import atexit
+import base64
+import hashlib
+import json
+import threading
+import zipfile
+from datetime import date, datetime
+
+from prowler.lib.logger import logger
+
+# Archive opened in the current process with --record or --replay
+api_archive = None
+
+API_ARCHIVE_INDEX_FILE = "index.json"
+API_ARCHIVE_OBJECTS_DIRECTORY = "objects"
+
+
+class APIArchiveResponseNotFound(Exception):
+    """Raised when replaying a request that was not recorded in the archive"""
+
+    def __init__(self, request: dict):
+        super().__init__(
+            f"The response of {request['service']}:{request['operation']} in {request['region']} is not in the API archive"
+        )
+        self.request = request
+
+
+class APIArchive:
+    """
+    Compressed, content-addressed archive of the provider API responses of a scan.
+
+    The archive is a zip file with every distinct response stored once in the objects
+    directory, named by the hash of its content, and an index that maps the hash of
+    each request to the hash of its response. In the "record" mode the responses are
+    added while the scan runs and the index is written when the archive is closed; in
+    the "replay" mode the responses are read back so the scan runs without network.
+
+    Attributes:
+        path (str): The path of the archive file.
+        mode (str): "record" or "replay".
+    """
+
+    def __init__(self, path: str, mode: str):
+        """
+        Args:
+            path (str): The path of the archive file.
+            mode (str): "record" to create the archive or "replay" to read it.
+        """
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        if mode == "record":
+            self._zip_file = zipfile.ZipFile(
+                path, "w", compression=zipfile.ZIP_DEFLATED
+            )
+            self._index = {}
+            self._objects = set()
+        elif mode == "replay":
+            self._zip_file = zipfile.ZipFile(path, "r")
+            self._index = json.loads(self._zip_file.read(API_ARCHIVE_INDEX_FILE))
+        else:
+            raise ValueError(f"Invalid API archive mode: {mode}")
+
+    @staticmethod
+    def get_request_key(request: dict) -> str:
+        """
+        Return the hash identifying a request.
+
+        Dates in the request parameters are ignored, since they are usually computed
+        from the current time and they would never match when replaying the scan.
+        """
+        return hashlib.sha256(
+            json.dumps(
+                request, sort_keys=True, default=_request_default, separators=(",", ":")
+            ).encode()
+        ).hexdigest()
+
+    def record(self, request: dict, response: dict) -> None:
+        """
+        Add the response of a request to the archive, keeping the first one if the request is repeated.
+
+        Args:
+            request (dict): The provider, service, region, operation and parameters of the request.
+            response (dict): The response of the request.
+        """
+        try:
+            request_key = self.get_request_key(request)
+            content = json.dumps(
+                response, sort_keys=True, default=_response_default
+            ).encode()
+            object_key = hashlib.sha256(content).hexdigest()
+            with self._lock:
+                if request_key in self._index:
+                    return
+                if object_key not in self._objects:
+                    self._zip_file.writestr(
+                        f"{API_ARCHIVE_OBJECTS_DIRECTORY}/{object_key}.json", content
+                    )
+                    self._objects.add(object_key)
+                self._index[request_key] = object_key
+        except Exception as error:
+            # e.g. streamed responses, they are requested again when replaying
+            logger.warning(
+                f"{request.get('service')}:{request.get('operation')} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def replay(self, request: dict) -> dict:
+        """
+        Return the recorded response of a request.
+
+        Args:
+            request (dict): The provider, service, region, operation and parameters of the request.
+
+        Returns:
+            dict: A new copy of the response, so it can be modified by the caller.
+
+        Raises:
+            APIArchiveResponseNotFound: If the request was not recorded.
+        """
+        object_key = self._index.get(self.get_request_key(request))
+        if not object_key:
+            raise APIArchiveResponseNotFound(request)
+        return json.loads(
+            self._zip_file.read(f"{API_ARCHIVE_OBJECTS_DIRECTORY}/{object_key}.json"),
+            object_hook=_response_object_hook,
+        )
+
+    def close(self) -> None:
+        """Write the index, if recording, and close the archive"""
+        with self._lock:
+            if self._zip_file.fp is None:
+                return
+            if self.mode == "record":
+                self._zip_file.writestr(
+                    API_ARCHIVE_INDEX_FILE, json.dumps(self._index, sort_keys=True)
+                )
+                logger.info(
+                    f"API archive {self.path} written with {len(self._index)} requests and {len(self._objects)} responses"
+                )
+            self._zip_file.close()
+
+
+def open_api_archive(path: str, mode: str) -> APIArchive:
+    """
+    Open the process-wide API archive, closing it at exit so the index of a recording is always written.
+
+    Args:
+        path (str): The path of the archive file.
+        mode (str): "record" or "replay".
+
+    Returns:
+        APIArchive: The archive opened.
+    """
+    global api_archive
+    close_api_archive()
+    api_archive = APIArchive(path, mode)
+    atexit.register(api_archive.close)
+    return api_archive
+
+
+def get_api_archive() -> APIArchive:
+    """Return the process-wide API archive, None if the scan is not recorded nor replayed"""
+    return api_archive
+
+
+def close_api_archive() -> None:
+    """Close the process-wide API archive, if any, so the next sessions do not use it"""
+    global api_archive
+    if api_archive:
+        api_archive.close()
+        api_archive = None
+
+
+def _request_default(value):
+    if isinstance(value, (datetime, date)):
+        return "<date>"
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    raise TypeError(f"Object of type {value.__class__.__name__} is not serializable")
+
+
+def _response_default(value):
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, bytes):
+        return {"__bytes__": base64.b64encode(value).decode()}
+    raise TypeError(f"Object of type {value.__class__.__name__} is not serializable")
+
+
+def _response_object_hook(value: dict):
+    if len(value) == 1:
+        if "__datetime__" in value:
+            return datetime.fromisoformat(value["__datetime__"])
+        if "__date__" in value:
+            return date.fromisoformat(value["__date__"])
+        if "__bytes__" in value:
+            return base64.b64decode(value["__bytes__"])
+    return value
@@ -0,0 +1,152 @@
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass, field
+
+import prowler
+from prowler.config.config import default_cache_directory, prowler_version
+from prowler.lib.logger import logger
+
+# Catalogs loaded in the current process, by provider
+loaded_check_catalogs = {}
+
+
+@dataclass
+class CheckCatalog:
+    """
+    Precompiled catalog of the checks and compliance frameworks of a provider.
+
+    Attributes:
+        provider (str): The provider of the checks.
+        fingerprint (str): The hash of the files the catalog was built from.
+        checks (list[tuple]): The (check_name, check_path) of every check, including the fixers.
+        checks_metadata (dict): The validated CheckMetadata of every check, with the CheckID as the key.
+        compliance_frameworks (dict): The validated Compliance of every framework, with the file name as the key.
+    """
+
+    provider: str
+    fingerprint: str
+    checks: list[tuple] = field(default_factory=list)
+    checks_metadata: dict = field(default_factory=dict)
+    compliance_frameworks: dict = field(default_factory=dict)
+
+    def get_checks(self, service: str = None, include_fixers: bool = False) -> list:
+        """Return the (check_name, check_path) of the checks, in the same format as recover_checks_from_provider"""
+        return [
+            (check_name, check_path)
+            for check_name, check_path in self.checks
+            # Format: /absolute_path/prowler/providers/{provider}/services/{service_name}/{check_name}
+            if (not service or os.path.basename(os.path.dirname(check_path)) == service)
+            and (include_fixers or not check_name.endswith("_fixer"))
+        ]
+
+    def get_bulk_checks_metadata(self) -> dict:
+        """Return a copy of the checks metadata, since it is updated with the compliance and the custom metadata"""
+        return {
+            check_id: metadata.copy(deep=True)
+            for check_id, metadata in self.checks_metadata.items()
+        }
+
+
+def get_catalog_fingerprint(provider: str) -> str:
+    """
+    Return a hash of the provider's checks and compliance files.
+
+    The hash uses the path, size and modification time of every file, so the catalog
+    is rebuilt when a check or framework is added, removed or modified.
+    """
+    fingerprint = hashlib.sha256(f"{prowler_version}:{provider}".encode())
+    prowler_directory = prowler.__path__[0]
+    for directory in (
+        f"{prowler_directory}/providers/{provider}/services",
+        f"{prowler_directory}/compliance/{provider}",
+    ):
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for file_name in sorted(files):
+                if not file_name.endswith((".py", ".json")):
+                    continue
+                file_stat = os.stat(os.path.join(root, file_name))
+                fingerprint.update(
+                    f"{root}/{file_name}:{file_stat.st_size}:{file_stat.st_mtime_ns}".encode()
+                )
+    return fingerprint.hexdigest()
+
+
+def build_check_catalog(provider: str, fingerprint: str) -> CheckCatalog:
+    """Build the catalog walking the provider's packages and validating every metadata and compliance file"""
+    # Imported here since the check models use the loaded catalogs
+    from prowler.lib.check.compliance_models import Compliance
+    from prowler.lib.check.models import CheckMetadata
+    from prowler.lib.check.utils import recover_checks_from_provider
+
+    return CheckCatalog(
+        provider=provider,
+        fingerprint=fingerprint,
+        checks=recover_checks_from_provider(provider, include_fixers=True),
+        checks_metadata=CheckMetadata.get_bulk(provider),
+        compliance_frameworks=Compliance.get_bulk(provider),
+    )
+
+
+def load_check_catalog(
+    provider: str, cache_directory: str = default_cache_directory
+) -> CheckCatalog:
+    """
+    Load the provider's catalog from the cache directory, building it if it is missing or outdated.
+
+    Once loaded, the catalog is used in the current process to recover the checks and their metadata.
+
+    Args:
+        provider (str): The provider name.
+        cache_directory (str): The directory where the catalog is stored.
+
+    Returns:
+        CheckCatalog: The provider's catalog.
+    """
+    # Do not use the current catalog while it is reloaded
+    loaded_check_catalogs.pop(provider, None)
+    fingerprint = get_catalog_fingerprint(provider)
+    catalog_file = f"{cache_directory}/{provider}_check_catalog.pickle"
+    catalog = None
+    try:
+        if os.path.isfile(catalog_file):
+            with open(catalog_file, "rb") as f:
+                cached_catalog = pickle.load(f)
+            if (
+                isinstance(cached_catalog, CheckCatalog)
+                and cached_catalog.fingerprint == fingerprint
+            ):
+                catalog = cached_catalog
+    except Exception as error:
+        logger.warning(
+            f"Unable to read the check catalog {catalog_file}, rebuilding it -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+    if not catalog:
+        logger.debug(f"Building the {provider} check catalog")
+        catalog = build_check_catalog(provider, fingerprint)
+        try:
+            os.makedirs(cache_directory, exist_ok=True)
+            # Write it atomically so concurrent executions never read a partial file
+            temporary_file = f"{catalog_file}.{os.getpid()}.tmp"
+            with open(temporary_file, "wb") as f:
+                pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_file, catalog_file)
+        except Exception as error:
+            logger.warning(
+                f"Unable to store the check catalog in {cache_directory} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    loaded_check_catalogs[provider] = catalog
+    return catalog
+
+
+def get_loaded_check_catalog(provider: str) -> CheckCatalog:
+    """Return the provider's catalog if it was loaded in the current process, None otherwise"""
+    return loaded_check_catalogs.get(provider)
+
+
+def unload_check_catalogs():
+    """Stop using the loaded catalogs in the current process"""
+    loaded_check_catalogs.clear()
@@ -5,11 +5,12 @@ import os
 import re
 import shutil
 import sys
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from types import ModuleType
-from typing import Any
+from typing import Any, Callable, Generator
 
-from alive_progress import alive_bar
 from colorama import Fore, Style
 
 import prowler
@@ -19,6 +20,8 @@ from prowler.lib.check.models import Check
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
 from prowler.lib.outputs.outputs import report
+from prowler.lib.profiling.profiling import get_profiler
+from prowler.lib.scan.checkpoint import ScanCheckpoint
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.common.models import Audit_Metadata
 
@@ -407,7 +410,20 @@ def execute_checks(
     custom_checks_metadata: Any,
     config_file: str,
     output_options: Any,
+    parallel_checks: int = 0,
+    findings_handler: Callable[[list], None] = None,
+    checkpoint: ScanCheckpoint = None,
 ) -> list:
+    """
+    Execute the checks and return their findings.
+
+    If a findings_handler is given, the findings of each check are passed to it as soon as
+    the check finishes and they are not returned, so they can be freed once processed.
+
+    If a checkpoint is given, the findings of each check are stored in it once processed and
+    the checks it already has completed are not executed again, their stored findings are
+    processed instead.
+    """
     # List to store all the check's findings
     all_findings = []
     # Services and checks executed for the Audit Status
@@ -449,53 +465,70 @@ def execute_checks(
     elif hasattr(output_options, "fixer"):
         verbose = output_options.fixer
 
-    # Execution with the --only-logs flag
-    if output_options.only_logs:
-        for check_name in checks_to_execute:
-            # Recover service from check name
-            service = check_name.split("_")[0]
-            try:
-                try:
-                    # Import check module
-                    check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-                    lib = import_check(check_module_path)
-                    # Recover functions from check
-                    check_to_execute = getattr(lib, check_name)
-                    check = check_to_execute()
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                    continue
-                if verbose:
-                    print(
-                        f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity}]{Style.RESET_ALL}"
-                    )
-                check_findings = execute(
-                    check,
-                    global_provider,
-                    custom_checks_metadata,
-                    output_options,
-                )
-                report(check_findings, global_provider, output_options)
-                all_findings.extend(check_findings)
-
-                # Update Audit Status
-                services_executed.add(service)
-                checks_executed.add(check_name)
-                global_provider.audit_metadata = update_audit_metadata(
-                    global_provider.audit_metadata, services_executed, checks_executed
-                )
+    # Checks completed before the scan was interrupted
+    resumed_checks = checkpoint.completed_checks if checkpoint else set()
+
+    def run_check(check_name: str) -> tuple:
+        if check_name in resumed_checks:
+            return None, checkpoint.load_findings(check_name)
+        # Recover service from check name
+        service = check_name.split("_")[0]
+        # Import check module
+        check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
+        lib = import_check(check_module_path)
+        # Recover functions from check
+        check_to_execute = getattr(lib, check_name)
+        check = check_to_execute()
+        check_findings = execute(
+            check,
+            global_provider,
+            custom_checks_metadata,
+            output_options,
+        )
+        return check, check_findings
 
+    def process_check_result(check_name: str, result: tuple, error: Exception):
+        nonlocal check_findings
+        if error:
             # If check does not exists in the provider or is from another provider
-            except ModuleNotFoundError:
+            if isinstance(error, ModuleNotFoundError):
                 logger.error(
                     f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
                 )
-            except Exception as error:
+            else:
                 logger.error(
-                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    f"{check_name} - {error.__class__.__name__}[{traceback.extract_tb(error.__traceback__)[-1].lineno}]: {error}"
                 )
+            return
+        check, check_findings = result
+        # The findings of the resumed checks were already reported
+        if check:
+            if verbose:
+                print(
+                    f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity}]{Style.RESET_ALL}"
+                )
+            report(check_findings, global_provider, output_options)
+        if findings_handler:
+            findings_handler(check_findings)
+        else:
+            all_findings.extend(check_findings)
+        if checkpoint and check:
+            checkpoint.save(check_name, check_findings)
+
+        # Update Audit Status
+        services_executed.add(check_name.split("_")[0])
+        checks_executed.add(check_name)
+        global_provider.audit_metadata = update_audit_metadata(
+            global_provider.audit_metadata, services_executed, checks_executed
+        )
+
+    check_findings = []
+    # Execution with the --only-logs flag
+    if output_options.only_logs:
+        for check_name, result, error in run_checks(
+            checks_to_execute, run_check, parallel_checks
+        ):
+            process_check_result(check_name, result, error)
     else:
         # Prepare your messages
         messages = [f"Config File: {Fore.YELLOW}{config_file}{Style.RESET_ALL}"]
@@ -507,10 +540,25 @@ def execute_checks(
             messages.append(
                 f"Scanning unused services and resources: {Fore.YELLOW}{global_provider.scan_unused_services}{Style.RESET_ALL}"
             )
+        if parallel_checks > 1:
+            messages.append(
+                f"Parallel checks workers: {Fore.YELLOW}{parallel_checks}{Style.RESET_ALL}"
+            )
+        if checkpoint:
+            messages.append(
+                f"Scan ID: {Fore.YELLOW}{checkpoint.scan_id}{Style.RESET_ALL} (use --resume {checkpoint.scan_id} if it is interrupted)"
+            )
+            if resumed_checks:
+                messages.append(
+                    f"Checks completed before the interruption: {Fore.YELLOW}{len(resumed_checks.intersection(checks_to_execute))}{Style.RESET_ALL}"
+                )
         report_title = (
             f"{Style.BRIGHT}Using the following configuration:{Style.RESET_ALL}"
         )
         print_boxes(messages, report_title)
+        # The progress bar is only imported when it is shown
+        from alive_progress import alive_bar
+
         # Default execution
         checks_num = len(checks_to_execute)
         plural_string = "checks"
@@ -528,58 +576,15 @@ def execute_checks(
             stats=False,
             enrich_print=False,
         ) as bar:
-            for check_name in checks_to_execute:
+            for check_name, result, error in run_checks(
+                checks_to_execute, run_check, parallel_checks
+            ):
                 # Recover service from check name
                 service = check_name.split("_")[0]
                 bar.title = (
                     f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
                 )
-                try:
-                    try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                        )
-                        continue
-                    if verbose:
-                        print(
-                            f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity}]{Style.RESET_ALL}"
-                        )
-                    check_findings = execute(
-                        check,
-                        global_provider,
-                        custom_checks_metadata,
-                        output_options,
-                    )
-
-                    report(check_findings, global_provider, output_options)
-
-                    all_findings.extend(check_findings)
-                    services_executed.add(service)
-                    checks_executed.add(check_name)
-                    global_provider.audit_metadata = update_audit_metadata(
-                        global_provider.audit_metadata,
-                        services_executed,
-                        checks_executed,
-                    )
-
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                except Exception as error:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+                process_check_result(check_name, result, error)
                 bar()
             bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
 
@@ -599,6 +604,79 @@ def execute_checks(
     return all_findings
 
 
+def run_checks(
+    checks_to_execute: list,
+    run_check: Callable[[str], Any],
+    parallel_checks: int = 0,
+) -> Generator[tuple[str, Any, Exception], None, None]:
+    """
+    Run the given checks and yield their results in the same order as checks_to_execute.
+
+    If parallel_checks is greater than 1 the checks are executed in a thread pool of that size.
+    Checks are grouped by service and every group is run sequentially by a single worker,
+    so the service client is built just once and different services are scanned concurrently.
+
+    Args:
+        checks_to_execute (list): list of check names to run
+        run_check (Callable[[str], Any]): function that runs a check given its name
+        parallel_checks (int): number of workers, the checks are run sequentially if it is 0 or 1
+
+    Yields:
+        tuple[str, Any, Exception]: the check name, the value returned by run_check and the exception raised, if any
+    """
+    if parallel_checks <= 1:
+        for check_name in checks_to_execute:
+            try:
+                result = run_check(check_name)
+            except Exception as error:
+                yield check_name, None, error
+            else:
+                yield check_name, result, None
+        return
+
+    # Group the checks by service keeping the input order
+    service_checks = {}
+    for check_name in checks_to_execute:
+        service_checks.setdefault(check_name.split("_")[0], []).append(check_name)
+
+    results = {}
+    results_ready = threading.Condition()
+    stop_workers = threading.Event()
+
+    def run_service_checks(check_names: list):
+        for check_name in check_names:
+            # Stop as soon as the scan is interrupted
+            if stop_workers.is_set():
+                return
+            try:
+                result = (check_name, run_check(check_name), None)
+            except BaseException as error:
+                # Every error is stored, including SystemExit, so the main thread never waits forever
+                result = (check_name, None, error)
+            with results_ready:
+                results[check_name] = result
+                results_ready.notify_all()
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(parallel_checks, len(service_checks) or 1)
+    )
+    try:
+        for check_names in service_checks.values():
+            executor.submit(run_service_checks, check_names)
+        # Yield the results following the input order so the outputs are deterministic
+        for check_name in checks_to_execute:
+            with results_ready:
+                results_ready.wait_for(lambda: check_name in results)
+                result = results.pop(check_name)
+            # Errors like SystemExit or KeyboardInterrupt are raised in the main thread
+            if result[2] is not None and not isinstance(result[2], Exception):
+                raise result[2]
+            yield result
+    finally:
+        stop_workers.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def execute(
     check: Check,
     global_provider: Any,
@@ -635,7 +713,12 @@ def execute(
         check_findings = []
         logger.debug(f"Executing check: {check.CheckID}")
         try:
-            check_findings = check.execute()
+            profiler = get_profiler()
+            if profiler:
+                with profiler.profile("check", check.CheckID, "execute"):
+                    check_findings = check.execute()
+            else:
+                check_findings = check.execute()
         except Exception as error:
             if not only_logs:
                 print(
@@ -655,19 +738,13 @@ def execute(
 
         # Before returning the findings, we need to apply the mute list logic
         if hasattr(global_provider, "mutelist") and global_provider.mutelist.mutelist:
-            is_finding_muted_args = {}
+            mute_findings_args = {}
             if global_provider.type == "aws":
-                is_finding_muted_args["aws_account_id"] = (
-                    global_provider.identity.account
-                )
+                mute_findings_args["aws_account_id"] = global_provider.identity.account
             elif global_provider.type == "kubernetes":
-                is_finding_muted_args["cluster"] = global_provider.identity.cluster
+                mute_findings_args["cluster"] = global_provider.identity.cluster
 
-            for finding in check_findings:
-                is_finding_muted_args["finding"] = finding
-                finding.muted = global_provider.mutelist.is_finding_muted(
-                    **is_finding_muted_args
-                )
+            global_provider.mutelist.mute_findings(check_findings, **mute_findings_args)
 
     except ModuleNotFoundError:
         logger.error(
@@ -1,7 +1,6 @@
 import sys
 
 import yaml
-from jsonschema import validate
 
 from prowler.config.config import valid_severities
 from prowler.lib.logger import logger
@@ -80,6 +79,9 @@ custom_checks_metadata_schema = {
 
 def parse_custom_checks_metadata_file(provider: str, parse_custom_checks_metadata_file):
     """parse_custom_checks_metadata_file returns the custom_checks_metadata object if it is valid, otherwise aborts the execution returning the ValidationError."""
+    # jsonschema is slow to import and it is only needed with --custom-checks-metadata-file
+    from jsonschema import validate
+
     try:
         with open(parse_custom_checks_metadata_file) as f:
             custom_checks_metadata = yaml.safe_load(f)["CustomChecksMetadata"][provider]
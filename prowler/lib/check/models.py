@@ -4,9 +4,10 @@ import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
-from pydantic import BaseModel, ValidationError, validator
+from pydantic import BaseModel, PrivateAttr, ValidationError, validator
 
 from prowler.config.config import valid_severities
+from prowler.lib.check.catalog import get_loaded_check_catalog
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
 
@@ -159,26 +160,58 @@ class CheckMetadata(BaseModel):
         return bulk_check_metadata
 
 
+class SharedCheckMetadata(CheckMetadata):
+    """
+    CheckMetadata shared by all the findings of a check.
+
+    Its top-level fields are read-only, while the nested Remediation models must not be modified
+    since they are shared too. Use Check_Report.override_metadata to change a field for a single finding.
+    """
+
+    class Config:
+        allow_mutation = False
+
+
 class Check(ABC, CheckMetadata):
     """Prowler Check"""
 
+    _shared_metadata: SharedCheckMetadata = PrivateAttr(default=None)
+
     def __init__(self, **data):
         """Check's init function. Calls the CheckMetadataModel init."""
-        # Parse the Check's metadata file
-        metadata_file = (
-            os.path.abspath(sys.modules[self.__module__].__file__)[:-3]
-            + ".metadata.json"
+        # Use the already validated metadata from the precompiled catalog if it was loaded
+        # Format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+        module_path = self.__module__.split(".")
+        catalog = (
+            get_loaded_check_catalog(module_path[2])
+            if len(module_path) > 2 and module_path[1] == "providers"
+            else None
         )
-        # Store it to validate them with Pydantic
-        data = CheckMetadata.parse_file(metadata_file).dict()
+        if catalog and self.__class__.__name__ in catalog.checks_metadata:
+            data = catalog.checks_metadata[self.__class__.__name__].dict()
+        else:
+            # Parse the Check's metadata file
+            metadata_file = (
+                os.path.abspath(sys.modules[self.__module__].__file__)[:-3]
+                + ".metadata.json"
+            )
+            # Store it to validate them with Pydantic
+            data = CheckMetadata.parse_file(metadata_file).dict()
         # Calls parents init function
         super().__init__(**data)
         # TODO: verify that the CheckID is the same as the filename and classname
         # to mimic the test done at test_<provider>_checks_metadata_is_valid
 
-    def metadata(self) -> dict:
-        """Return the JSON representation of the check's metadata"""
-        return self.json()
+    def metadata(self) -> SharedCheckMetadata:
+        """
+        Return the check's metadata shared by all of its findings.
+
+        It is built once, the first time it is requested, so any update to the check's
+        metadata (e.g. from the custom checks metadata file) must be done before that.
+        """
+        if self._shared_metadata is None:
+            self._shared_metadata = SharedCheckMetadata(**self.dict())
+        return self._shared_metadata
 
     @abstractmethod
     def execute(self) -> list:
@@ -198,12 +231,31 @@ class Check_Report:
 
     def __init__(self, metadata):
         self.status = ""
-        self.check_metadata = CheckMetadata.parse_raw(metadata)
+        # The check's metadata is shared between its findings, although
+        # its JSON representation is also accepted
+        if isinstance(metadata, CheckMetadata):
+            self.check_metadata = metadata
+        else:
+            self.check_metadata = CheckMetadata.parse_raw(metadata)
         self.status_extended = ""
         self.resource_details = ""
         self.resource_tags = []
         self.muted = False
 
+    def override_metadata(self, **fields):
+        """
+        Override the given metadata fields only for this finding, copying the shared check's metadata.
+
+        Example:
+            report.override_metadata(Severity="high")
+
+        Raises:
+            ValidationError: If any of the new values is not valid.
+        """
+        self.check_metadata = self.check_metadata.__class__(
+            **{**self.check_metadata.dict(), **fields}
+        )
+
 
 @dataclass
 class Check_Report_AWS(Check_Report):
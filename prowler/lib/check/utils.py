@@ -2,6 +2,7 @@ import importlib
 import sys
 from pkgutil import walk_packages
 
+from prowler.lib.check.catalog import get_loaded_check_catalog
 from prowler.lib.logger import logger
 
 
@@ -13,6 +14,12 @@ def recover_checks_from_provider(
 
     Returns a list of tuples with the following format (check_name, check_path)
     """
+    # Use the precompiled catalog if it was loaded instead of walking the provider's packages
+    catalog = get_loaded_check_catalog(provider)
+    if catalog:
+        checks = catalog.get_checks(service, include_fixers)
+        if checks:
+            return checks
     try:
         checks = []
         modules = list_modules(provider, service)
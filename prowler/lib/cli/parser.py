@@ -1,6 +1,6 @@
 import argparse
 import sys
-from argparse import RawTextHelpFormatter
+from argparse import ArgumentTypeError, RawTextHelpFormatter
 
 from dashboard.lib.arguments.arguments import init_dashboard_parser
 from prowler.config.config import (
@@ -13,6 +13,7 @@ from prowler.config.config import (
     finding_statuses,
     valid_severities,
 )
+from prowler.lib.scan.checkpoint import is_valid_scan_id
 from prowler.providers.common.arguments import (
     init_providers_parser,
     validate_provider_arguments,
@@ -183,6 +184,19 @@ Detailed documentation at https://docs.prowler.com
             default=False,
             help="Set the output timestamp format as unix timestamps instead of iso format timestamps (default mode).",
         )
+        common_outputs_parser.add_argument(
+            "--stream-outputs",
+            action="store_true",
+            default=False,
+            help="Write the findings of each check to the outputs as soon as it finishes instead of at the end of the scan, bounding the memory used. Not compatible with --security-hub and --fixer.",
+        )
+        common_outputs_parser.add_argument(
+            "--profile-report",
+            nargs="?",
+            default=None,
+            metavar="FILE",
+            help="Write the time, memory and API calls of each service and check to FILE, in CSV format if it ends with .csv and JSON otherwise, and show the slowest ones after the scan",
+        )
 
     def __init_logging_parser__(self):
         # Logging Options
@@ -280,6 +294,20 @@ Detailed documentation at https://docs.prowler.com
             nargs="?",
             help="Specify external directory with custom checks (each check must have a folder with the required files, see more in https://docs.prowler.cloud/en/latest/tutorials/misc/#custom-checks).",
         )
+        common_checks_parser.add_argument(
+            "--parallel-checks",
+            type=validate_parallel_checks,
+            default=0,
+            metavar="N",
+            help="Execute the checks concurrently using N workers. The checks of the same service are run by the same worker. 0 or 1 execute the checks sequentially, which is the default.",
+        )
+        common_checks_parser.add_argument(
+            "--resume",
+            type=validate_resume_scan_id,
+            default=None,
+            metavar="SCAN_ID",
+            help="Resume an interrupted scan, skipping the checks it completed and writing its outputs with the same name. Use the same arguments as the interrupted scan.",
+        )
 
     def __init_list_checks_parser__(self):
         # List checks options
@@ -378,3 +406,21 @@ Detailed documentation at https://docs.prowler.com
             action="store_true",
             help="Send a summary of the execution with a Slack APP in your channel. Environment variables SLACK_API_TOKEN and SLACK_CHANNEL_NAME are required (see more in https://docs.prowler.cloud/en/latest/tutorials/integrations/#slack).",
         )
+
+
+def validate_resume_scan_id(scan_id: str) -> str:
+    """validate_resume_scan_id validates that there is a checkpoint of the scan to resume"""
+    if not is_valid_scan_id(scan_id):
+        raise ArgumentTypeError(f"There is no interrupted scan with the ID {scan_id}")
+    return scan_id
+
+
+def validate_parallel_checks(parallel_checks: str) -> int:
+    """validate_parallel_checks validates that the number of workers to run the checks is not negative"""
+    try:
+        workers = int(parallel_checks)
+    except ValueError:
+        raise ArgumentTypeError("Parallel checks must be an integer")
+    if workers < 0:
+        raise ArgumentTypeError("Parallel checks must be 0 or a positive integer")
+    return workers
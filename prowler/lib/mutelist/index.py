@@ -0,0 +1,264 @@
+import re
+from typing import Optional
+
+from prowler.lib.logger import logger
+
+# Characters that make a check key a regular expression instead of a check name
+REGEX_METACHARACTERS = set(".^$*+?{}[]\\|()")
+# Constructs that depend on the group numbers, which change when the items are combined
+GROUP_REFERENCE_PATTERN = re.compile(r"\\\d|\(\?P=|\(\?\(")
+
+
+def _compile_item(item) -> Optional[re.Pattern]:
+    """Compile a mutelist item as Mutelist.is_item_matched searches it, None if it is not a valid pattern"""
+    try:
+        if item.startswith("*"):
+            item = ".*" + item[1:]
+        return re.compile(item)
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__} -- Invalid Mutelist item {item!r}: {error}"
+        )
+        return None
+
+
+class ItemMatcher:
+    """
+    Precompiled equivalent of Mutelist.is_item_matched for a list of items.
+
+    The items are searched in order, so an invalid item makes the items after it
+    unreachable, as when is_item_matched fails on it. Without tags, the items are
+    combined in a single alternation regex when their groups allow it.
+
+    Attributes:
+        is_empty (bool): True if there are no items, which never match.
+    """
+
+    def __init__(self, items, tag: bool = False):
+        """
+        Args:
+            items (list): The items of the mutelist, a "*" string for all the tags.
+            tag (bool): If True all the items must match, otherwise any of them.
+        """
+        self.is_empty = not items
+        self._tag = tag
+        self._patterns = []
+        # True if an invalid item is reached before deciding the match
+        self._fails = False
+        for item in items or []:
+            pattern = _compile_item(item)
+            if not pattern:
+                self._fails = True
+                break
+            self._patterns.append(pattern)
+        self._combined_pattern = None
+        if not tag and len(self._patterns) > 1:
+            self._combined_pattern = self._combine(self._patterns)
+
+    @staticmethod
+    def _combine(patterns: list) -> Optional[re.Pattern]:
+        if any(GROUP_REFERENCE_PATTERN.search(pattern.pattern) for pattern in patterns):
+            return None
+        try:
+            return re.compile(
+                "|".join(f"(?:{pattern.pattern})" for pattern in patterns)
+            )
+        except re.error:
+            # e.g. repeated group names or inline global flags
+            return None
+
+    def match(self, finding_items) -> bool:
+        if self.is_empty or not isinstance(finding_items, str):
+            return False
+        if self._tag:
+            if self._fails:
+                return False
+            return all(pattern.search(finding_items) for pattern in self._patterns)
+        if self._combined_pattern:
+            return bool(self._combined_pattern.search(finding_items))
+        return any(pattern.search(finding_items) for pattern in self._patterns)
+
+
+class MutelistEntry:
+    """
+    A check entry of an account of the mutelist, with its items precompiled.
+
+    Attributes:
+        position (int): The position of the entry in the checks of its account.
+        check_key (str): The check name or pattern, with lambda mapped to awslambda.
+    """
+
+    def __init__(self, position: int, check_key: str, check_info: dict):
+        self.position = position
+        self.check_key = re.sub("^lambda", "awslambda", check_key)
+        self._check_matcher = ItemMatcher([self.check_key])
+        self._regions = ItemMatcher(check_info.get("Regions"))
+        self._resources = ItemMatcher(check_info.get("Resources"))
+        # The falsy tags mean all the tags, as in Mutelist.is_muted_in_check
+        self._tags = ItemMatcher(check_info.get("Tags") or "*", tag=True)
+        exceptions = check_info.get("Exceptions")
+        self._has_exceptions = bool(exceptions)
+        if self._has_exceptions:
+            self._excepted_accounts = ItemMatcher(exceptions.get("Accounts", []))
+            self._excepted_regions = ItemMatcher(exceptions.get("Regions", []))
+            self._excepted_resources = ItemMatcher(exceptions.get("Resources", []))
+            self._excepted_tags = ItemMatcher(exceptions.get("Tags", []), tag=True)
+
+    def matches_check(self, check: str) -> bool:
+        return (
+            self.check_key == "*"
+            or self.check_key == check
+            or self._check_matcher.match(check)
+        )
+
+    def is_muted(self, finding_region, finding_resource, finding_tags) -> bool:
+        return (
+            self._regions.match(finding_region)
+            and self._resources.match(finding_resource)
+            and self._tags.match(finding_tags)
+        )
+
+    def is_excepted(
+        self, audited_account, finding_region, finding_resource, finding_tags
+    ) -> bool:
+        """Equivalent of Mutelist.is_excepted with the exceptions of the entry"""
+        if not self._has_exceptions:
+            return False
+        exceptions = (
+            (self._excepted_accounts, audited_account),
+            (self._excepted_regions, finding_region),
+            (self._excepted_resources, finding_resource),
+            (self._excepted_tags, finding_tags),
+        )
+        matched = [matcher.match(value) for matcher, value in exceptions]
+        if not any(matched):
+            return False
+        return all(
+            is_matched or matcher.is_empty
+            for is_matched, (matcher, _) in zip(matched, exceptions)
+        )
+
+
+class MutelistIndex:
+    """
+    The validated mutelist compiled once to mute the findings without walking it for each one.
+
+    The entries of each account are indexed by their check name, and the check names
+    and patterns that apply to a check are resolved once per account and check, so each
+    finding only evaluates the regions, resources, tags and exceptions of its entries.
+
+    A check name matches the checks that contain it, as Mutelist.is_item_matched
+    searches it, so the check names are looked up by every substring of the check with
+    their length, while the keys with wildcards or regular expressions are kept apart
+    and searched for each check.
+    """
+
+    def __init__(self, mutelist: dict):
+        """
+        Args:
+            mutelist (dict): The validated mutelist.
+        """
+        self.mutelist = mutelist
+        # The entries of each account, in the order of the mutelist
+        self._accounts = {}
+        # The entries of each account by check name, and the lengths of the check names
+        self._check_names = {}
+        self._check_name_lengths = {}
+        # The entries of each account with a wildcard or a regular expression
+        self._check_patterns = {}
+        # The entries that apply to each (account, check)
+        self._check_entries = {}
+
+        accounts = mutelist.get("Accounts", {}) if isinstance(mutelist, dict) else {}
+        for account, account_info in accounts.items():
+            entries = [
+                MutelistEntry(position, check_key, check_info)
+                for position, (check_key, check_info) in enumerate(
+                    account_info["Checks"].items()
+                )
+            ]
+            self._accounts[account] = entries
+            check_names = {}
+            check_patterns = []
+            for entry in entries:
+                if REGEX_METACHARACTERS.isdisjoint(entry.check_key):
+                    check_names.setdefault(entry.check_key, []).append(entry)
+                else:
+                    check_patterns.append(entry)
+            self._check_names[account] = check_names
+            self._check_name_lengths[account] = {
+                len(check_name) for check_name in check_names
+            }
+            self._check_patterns[account] = check_patterns
+
+    def get_check_entries(self, account: str, check: str) -> list[MutelistEntry]:
+        """Return the entries of the account that apply to the check, in the order of the mutelist"""
+        key = (account, check)
+        entries = self._check_entries.get(key)
+        if entries is None:
+            entries = [
+                entry
+                for entry in self._check_patterns.get(account, [])
+                if entry.matches_check(check)
+            ]
+            check_names = self._check_names.get(account, {})
+            if isinstance(check, str) and check_names:
+                for length in self._check_name_lengths[account]:
+                    for start in range(len(check) - length + 1):
+                        entries.extend(
+                            check_names.get(check[start : start + length], [])
+                        )
+            # A check name contained several times in the check is added once
+            entries = sorted(
+                {id(entry): entry for entry in entries}.values(),
+                key=lambda entry: entry.position,
+            )
+            self._check_entries[key] = entries
+        return entries
+
+    def get_accounts_entries(
+        self, audited_account: str, check: str
+    ) -> list[list[MutelistEntry]]:
+        """Return the entries that apply to the check of each account of the mutelist that applies to the audited account"""
+        return [
+            self.get_check_entries(account, check)
+            for account in self._accounts
+            if account == audited_account or account == "*"
+        ]
+
+    @staticmethod
+    def is_muted_in_entries(
+        accounts_entries: list,
+        audited_account: str,
+        finding_region: str,
+        finding_resource: str,
+        finding_tags,
+    ) -> bool:
+        """Evaluate the entries returned by get_accounts_entries for a finding"""
+        for entries in accounts_entries:
+            for entry in entries:
+                # An exception stops the evaluation of the next entries of the account
+                if entry.is_excepted(
+                    audited_account, finding_region, finding_resource, finding_tags
+                ):
+                    break
+                if entry.is_muted(finding_region, finding_resource, finding_tags):
+                    return True
+        return False
+
+    def is_muted(
+        self,
+        audited_account: str,
+        check: str,
+        finding_region: str,
+        finding_resource: str,
+        finding_tags,
+    ) -> bool:
+        """Equivalent of Mutelist.is_muted evaluating only the entries that apply to the check"""
+        return self.is_muted_in_entries(
+            self.get_accounts_entries(audited_account, check),
+            audited_account,
+            finding_region,
+            finding_resource,
+            finding_tags,
+        )
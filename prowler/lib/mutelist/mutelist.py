@@ -1,10 +1,13 @@
 import re
 from abc import ABC, abstractmethod
+from typing import Callable
 
 import yaml
 
 from prowler.lib.logger import logger
+from prowler.lib.mutelist.index import MutelistIndex
 from prowler.lib.mutelist.models import mutelist_schema
+from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
 
 class Mutelist(ABC):
@@ -24,12 +27,15 @@ class Mutelist(ABC):
         get_mutelist_file_from_local_file: Retrieves the mutelist file from a local file.
         validate_mutelist: Validates the mutelist against a schema.
         is_muted: Checks if a finding is muted for the audited account, check, region, resource, and tags.
+        mute_findings: Sets if each finding of a batch is muted.
+        get_index: Returns the mutelist compiled to check the findings.
         is_muted_in_check: Checks if a check is muted.
         is_excepted: Checks if the account, region, resource, and tags are excepted based on the exceptions.
     """
 
     _mutelist: dict = {}
     _mutelist_file_path: str = None
+    _index: MutelistIndex = None
 
     MUTELIST_KEY = "Mutelist"
 
@@ -66,6 +72,12 @@ class Mutelist(ABC):
                 f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
             )
 
+    def get_index(self) -> MutelistIndex:
+        """Return the mutelist compiled to check the findings, compiling it again if the mutelist was replaced"""
+        if self._index is None or self._index.mutelist is not self._mutelist:
+            self._index = MutelistIndex(self._mutelist)
+        return self._index
+
     def validate_mutelist(self) -> bool:
         try:
             self._mutelist = mutelist_schema.validate(self._mutelist)
@@ -115,35 +127,89 @@ class Mutelist(ABC):
             finding_resource (str): The resource related to the finding.
             finding_tags: The tags associated with the finding.
 
+        The mutelist is compiled once in an index, see MutelistIndex, which gives the same
+        result as evaluating every account with is_muted_in_check.
+
         Returns:
             bool: True if the finding is muted for the audited account, check, region, resource and tags., otherwise False.
         """
         try:
-            # By default is not muted
-            is_finding_muted = False
-
-            # We always check all the accounts present in the mutelist
-            # if one mutes the finding we set the finding as muted
-            for account in self._mutelist.get("Accounts", []):
-                if account == audited_account or account == "*":
-                    if self.is_muted_in_check(
-                        self._mutelist["Accounts"][account]["Checks"],
-                        audited_account,
-                        check,
-                        finding_region,
-                        finding_resource,
-                        finding_tags,
-                    ):
-                        is_finding_muted = True
-                        break
-
-            return is_finding_muted
+            return self.get_index().is_muted(
+                audited_account,
+                check,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
             )
             return False
 
+    def mute_findings(self, findings: list, **kwargs) -> None:
+        """
+        Set the muted attribute of every finding of the batch.
+
+        The subclasses resolve the entries of the mutelist once per account and check of
+        the batch with _mute_findings, this default evaluates each finding with is_finding_muted.
+
+        Args:
+            findings (list): The findings to mute.
+            kwargs: The arguments of is_finding_muted other than the finding.
+        """
+        for finding in findings:
+            finding.muted = self.is_finding_muted(finding, **kwargs)
+
+    def _mute_findings(self, findings: list, get_finding_scope: Callable) -> None:
+        """
+        Set the muted attribute of every finding of the batch, as is_muted.
+
+        The entries that apply to each (audited account, check) of the batch are resolved
+        once, and the tags string of each resource once, so each finding only evaluates
+        its regions, resources, tags and exceptions.
+
+        Args:
+            findings (list): The findings to mute.
+            get_finding_scope (Callable): Returns the audited account, region and resource of a finding.
+        """
+        try:
+            index = self.get_index()
+            accounts_entries = {}
+            # The tags string of each resource, by the id of its tags that are kept referenced
+            tags_strings = {}
+            for finding in findings:
+                audited_account, finding_region, finding_resource = get_finding_scope(
+                    finding
+                )
+                key = (audited_account, finding.check_metadata.CheckID)
+                entries = accounts_entries.get(key)
+                if entries is None:
+                    entries = index.get_accounts_entries(*key)
+                    accounts_entries[key] = entries
+                if not any(entries):
+                    finding.muted = False
+                    continue
+                resource_tags = finding.resource_tags
+                tags_string = tags_strings.get(id(resource_tags))
+                if tags_string is None:
+                    tags_string = (
+                        resource_tags,
+                        unroll_dict(unroll_tags(resource_tags)),
+                    )
+                    tags_strings[id(resource_tags)] = tags_string
+                finding.muted = index.is_muted_in_entries(
+                    entries,
+                    audited_account,
+                    finding_region,
+                    finding_resource,
+                    tags_string[1],
+                )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+            )
+
     def is_muted_in_check(
         self,
         muted_checks,
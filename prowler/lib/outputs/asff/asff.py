@@ -122,12 +122,15 @@ class ASFF(Output):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def batch_write_data_to_file(self) -> None:
+    def batch_write_data_to_file(self, close_file: bool = True) -> None:
         """
         Writes the findings data to a file in JSON ASFF format.
 
         This method iterates over the findings data stored in the '_data' attribute and writes it to the file descriptor '_file_descriptor' in JSON format. It starts by writing the JSON opening/header '[', then iterates over each finding, dumping it to the file with an indent of 4 spaces. After writing all findings, it writes the closing ']' to complete the JSON array structure. Finally, it closes the file descriptor.
 
+        Args:
+            close_file (bool): Close the JSON array and the file after writing, disable it to write more findings with add_findings.
+
         Returns:
             None
         """
@@ -137,8 +140,9 @@ class ASFF(Output):
                 and not self._file_descriptor.closed
                 and self._data
             ):
-                # Write JSON opening/header [
-                self._file_descriptor.write("[")
+                # Write JSON opening/header [ with the first batch
+                if self._file_descriptor.tell() == 0:
+                    self._file_descriptor.write("[")
 
                 # Write findings
                 for finding in self._data:
@@ -149,6 +153,20 @@ class ASFF(Output):
                     )
                     self._file_descriptor.write(",")
 
+                if close_file:
+                    self.close_file_descriptor()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def close_file_descriptor(self) -> None:
+        """Writes the footer/closing ] of the JSON array and closes the file descriptor"""
+        try:
+            if (
+                getattr(self, "_file_descriptor", None)
+                and not self._file_descriptor.closed
+            ):
                 # Write footer/closing ]
                 if self._file_descriptor.tell() > 0:
                     if self._file_descriptor.tell() != 1:
@@ -34,6 +34,13 @@ class ComplianceOutput(Output):
         file_extension: str = "",
     ) -> None:
         self._data = []
+        self._compliance = compliance
+        # Get the compliance name of the model
+        self._compliance_name = (
+            compliance.Framework + "-" + compliance.Version
+            if compliance.Version
+            else compliance.Framework
+        )
 
         if not file_extension and file_path:
             self._file_extension = "".join(Path(file_path).suffixes)
@@ -41,20 +48,23 @@ class ComplianceOutput(Output):
             self._file_extension = file_extension
 
         if findings:
-            # Get the compliance name of the model
-            compliance_name = (
-                compliance.Framework + "-" + compliance.Version
-                if compliance.Version
-                else compliance.Framework
-            )
-            self.transform(findings, compliance, compliance_name)
+            self.transform(findings, compliance, self._compliance_name)
             if create_file_descriptor:
                 self.create_file_descriptor(file_path)
 
-    def batch_write_data_to_file(self) -> None:
+    def add_findings(self, findings: List[Finding]) -> None:
+        """Replaces the data with the given findings, keeping the manual requirements only in the first batch"""
+        self._data = []
+        self.transform(findings, self._compliance, self._compliance_name)
+        self._data = [row for row in self._data if row.ResourceId != "manual_check"]
+
+    def batch_write_data_to_file(self, close_file: bool = True) -> None:
         """
         Writes the findings data to a CSV file in the specific compliance format.
 
+        Args:
+            - close_file (bool): Close the file after writing, disable it to write more findings with add_findings.
+
         Returns:
             - None
         """
@@ -69,12 +79,15 @@ class ComplianceOutput(Output):
                     fieldnames=[field.upper() for field in self._data[0].dict().keys()],
                     delimiter=";",
                 )
-                csv_writer.writeheader()
+                # The header is written only with the first batch
+                if self._file_descriptor.tell() == 0:
+                    csv_writer.writeheader()
                 for finding in self._data:
                     csv_writer.writerow(
                         {k.upper(): v for k, v in finding.dict().items()}
                     )
-                self._file_descriptor.close()
+                if close_file:
+                    self._file_descriptor.close()
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
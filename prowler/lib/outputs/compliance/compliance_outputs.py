@@ -0,0 +1,59 @@
+from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
+    AWSWellArchitected,
+)
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
+from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
+from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
+from prowler.lib.outputs.compliance.compliance_output import ComplianceOutput
+from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
+from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import AWSMitreAttack
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
+    AzureMitreAttack,
+)
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
+
+
+def get_compliance_output_class(
+    provider: str, compliance_name: str
+) -> type[ComplianceOutput]:
+    """
+    get_compliance_output_class returns the class that writes the compliance framework output.
+
+    Args:
+        provider (str): The provider type, e.g. aws
+        compliance_name (str): The compliance framework, e.g. cis_2.0_aws
+
+    Returns:
+        type[ComplianceOutput]: The compliance output class, GenericCompliance if the framework has no specific format
+    """
+    if provider == "aws":
+        if compliance_name.startswith("cis_"):
+            return AWSCIS
+        elif compliance_name == "mitre_attack_aws":
+            return AWSMitreAttack
+        elif compliance_name.startswith("ens_"):
+            return AWSENS
+        elif compliance_name.startswith("aws_well_architected_framework"):
+            return AWSWellArchitected
+        elif compliance_name.startswith("iso27001_"):
+            return AWSISO27001
+        elif compliance_name.startswith("kisa"):
+            return AWSKISAISMSP
+    elif provider == "azure":
+        if compliance_name.startswith("cis_"):
+            return AzureCIS
+        elif compliance_name == "mitre_attack_azure":
+            return AzureMitreAttack
+    elif provider == "gcp":
+        if compliance_name.startswith("cis_"):
+            return GCPCIS
+        elif compliance_name == "mitre_attack_gcp":
+            return GCPMitreAttack
+    elif provider == "kubernetes":
+        if compliance_name.startswith("cis_"):
+            return KubernetesCIS
+    return GenericCompliance
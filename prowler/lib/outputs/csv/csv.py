@@ -32,8 +32,13 @@ class CSV(Output):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def batch_write_data_to_file(self) -> None:
-        """Writes the findings to a file using the CSV format using the `Output._file_descriptor`."""
+    def batch_write_data_to_file(self, close_file: bool = True) -> None:
+        """
+        Writes the findings to a file using the CSV format using the `Output._file_descriptor`.
+
+        Args:
+            close_file (bool): Close the file after writing, disable it to write more findings with add_findings.
+        """
         try:
             if (
                 getattr(self, "_file_descriptor", None)
@@ -45,10 +50,13 @@ class CSV(Output):
                     fieldnames=self._data[0].keys(),
                     delimiter=";",
                 )
-                csv_writer.writeheader()
+                # The header is written only with the first batch
+                if self._file_descriptor.tell() == 0:
+                    csv_writer.writeheader()
                 for finding in self._data:
                     csv_writer.writerow(finding)
-                self._file_descriptor.close()
+                if close_file:
+                    self._file_descriptor.close()
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -1,6 +1,8 @@
 import html
 import sys
 from io import TextIOWrapper
+from shutil import copyfileobj
+from tempfile import TemporaryFile
 
 from prowler.config.config import (
     html_logo_url,
@@ -85,6 +87,49 @@ class HTML(Output):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def spool_data(self) -> None:
+        """
+        Writes the findings to a temporary file, to write the findings in batches with add_findings.
+
+        The HTML header includes the statistics of all the findings, so the file is written
+        with write_spooled_data_to_file once all the batches are spooled.
+        """
+        try:
+            if self._data:
+                if not getattr(self, "_spool_file", None):
+                    self._spool_file = TemporaryFile(mode="w+")
+                self._spool_file.writelines(self._data)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def write_spooled_data_to_file(self, provider: Provider, stats: dict) -> None:
+        """
+        Writes the spooled findings to a file using the HTML format using the `Output._file_descriptor`.
+
+        Args:
+            provider (Provider): the provider object
+            stats (dict): the statistics of the findings
+        """
+        try:
+            if (
+                getattr(self, "_file_descriptor", None)
+                and not self._file_descriptor.closed
+                and getattr(self, "_spool_file", None)
+            ):
+                HTML.write_header(self._file_descriptor, provider, stats)
+                self._spool_file.seek(0)
+                copyfileobj(self._spool_file, self._file_descriptor)
+                HTML.write_footer(self._file_descriptor)
+                # Close file descriptors
+                self._file_descriptor.close()
+                self._spool_file.close()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
     @staticmethod
     def write_header(
         file_descriptor: TextIOWrapper, provider: Provider, stats: dict
@@ -160,20 +160,41 @@ class OCSF(Output):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def batch_write_data_to_file(self) -> None:
-        """Writes the findings to a file using the OCSF format using the `Output._file_descriptor`."""
+    def batch_write_data_to_file(self, close_file: bool = True) -> None:
+        """
+        Writes the findings to a file using the OCSF format using the `Output._file_descriptor`.
+
+        Args:
+            close_file (bool): Close the JSON array and the file after writing, disable it to write more findings with add_findings.
+        """
         try:
             if (
                 getattr(self, "_file_descriptor", None)
                 and not self._file_descriptor.closed
                 and self._data
             ):
-                self._file_descriptor.write("[")
+                # The JSON array is opened only with the first batch
+                if self._file_descriptor.tell() == 0:
+                    self._file_descriptor.write("[")
                 for finding in self._data:
                     self._file_descriptor.write(
                         finding.json(exclude_none=True, indent=4)
                     )
                     self._file_descriptor.write(",")
+                if close_file:
+                    self.close_file_descriptor()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def close_file_descriptor(self) -> None:
+        """Closes the JSON array, replacing the last comma, and the file descriptor"""
+        try:
+            if (
+                getattr(self, "_file_descriptor", None)
+                and not self._file_descriptor.closed
+            ):
                 if self._file_descriptor.tell() > 0:
                     if self._file_descriptor.tell() != 1:
                         self._file_descriptor.seek(
@@ -22,8 +22,10 @@ class Output(ABC):
         data: Property to access the transformed data.
         file_descriptor: Property to access the file descriptor.
         transform: Abstract method to transform findings into a specific format.
+        add_findings: Method to replace the data with new findings, to write them to the same file in batches.
         batch_write_data_to_file: Abstract method to write data to a file in batches.
         create_file_descriptor: Method to create a file descriptor for writing data to a file.
+        close_file_descriptor: Method to close the file descriptor once all the batches are written.
     """
 
     _data: list
@@ -69,6 +71,11 @@ class Output(ABC):
     def transform(self, findings: List[Finding]):
         raise NotImplementedError
 
+    def add_findings(self, findings: List[Finding]) -> None:
+        """Replaces the data with the given findings, so the written data can be freed"""
+        self._data = []
+        self.transform(findings)
+
     @abstractmethod
     def batch_write_data_to_file(self) -> None:
         raise NotImplementedError
@@ -99,3 +106,16 @@ class Output(ABC):
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
+
+    def close_file_descriptor(self) -> None:
+        """Closes the file descriptor, used after writing the data with batch_write_data_to_file(close_file=False)"""
+        try:
+            if (
+                getattr(self, "_file_descriptor", None)
+                and not self._file_descriptor.closed
+            ):
+                self._file_descriptor.close()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
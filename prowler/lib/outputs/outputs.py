@@ -1,6 +1,15 @@
+import glob
+import os
+
 from colorama import Fore, Style
 
-from prowler.config.config import orange_color
+from prowler.config.config import (
+    csv_file_suffix,
+    html_file_suffix,
+    json_asff_file_suffix,
+    json_ocsf_file_suffix,
+    orange_color,
+)
 from prowler.lib.logger import logger
 
 
@@ -169,3 +178,34 @@ def extract_findings_statistics(findings: list) -> dict:
     stats["all_fails_are_muted"] = all_fails_are_muted
 
     return stats
+
+
+def remove_output_files(output_directory: str, output_filename: str) -> None:
+    """
+    remove_output_files removes the output and compliance files with the given name, since the files are opened to append the findings.
+
+    Example:
+        remove_output_files("output", "prowler-output") -> removes output/prowler-output.csv and output/compliance/prowler-output_cis_2.0_aws.csv
+    """
+    output_files = [
+        f"{output_directory}/{output_filename}{suffix}"
+        for suffix in (
+            csv_file_suffix,
+            json_asff_file_suffix,
+            json_ocsf_file_suffix,
+            html_file_suffix,
+        )
+    ]
+    output_files.extend(
+        glob.glob(
+            f"{glob.escape(output_directory)}/compliance/{glob.escape(output_filename)}_*.csv"
+        )
+    )
+    for output_file in output_files:
+        try:
+            if os.path.isfile(output_file):
+                os.remove(output_file)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
@@ -0,0 +1,145 @@
+from typing import Any, NamedTuple
+
+from prowler.config.config import (
+    csv_file_suffix,
+    html_file_suffix,
+    json_asff_file_suffix,
+    json_ocsf_file_suffix,
+)
+from prowler.lib.check.models import CheckMetadata
+from prowler.lib.logger import logger
+from prowler.lib.outputs.asff.asff import ASFF
+from prowler.lib.outputs.compliance.compliance_outputs import (
+    get_compliance_output_class,
+)
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.html.html import HTML
+from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.providers.common.provider import Provider
+
+
+class FindingSummary(NamedTuple):
+    """The fields of a finding used by the statistics, the summary table and the compliance tables"""
+
+    status: str
+    muted: bool
+    resource_id: str
+    check_metadata: CheckMetadata
+
+
+class StreamingOutputs:
+    """
+    Writes the findings of each check to the output files as soon as the check finishes.
+
+    Only a FindingSummary of each finding is kept, so the findings can be freed once
+    written and the memory used is bounded by the largest check instead of the whole scan.
+
+    Attributes:
+        generated_outputs (dict): The outputs written, with "regular" and "compliance" as the keys.
+        findings (list[FindingSummary]): The summary of every finding written.
+    """
+
+    def __init__(
+        self,
+        provider: Provider,
+        output_options: Any,
+        output_formats: list,
+        compliance_frameworks: dict,
+    ) -> None:
+        """
+        Args:
+            provider (Provider): The provider scanned.
+            output_options (Any): The output options, depending on the provider.
+            output_formats (list): The output formats, e.g. csv, json-ocsf, json-asff or html.
+            compliance_frameworks (dict): The Compliance of the frameworks to write, with the framework name as the key.
+        """
+        self._provider = provider
+        self._output_options = output_options
+        self.generated_outputs = {"regular": [], "compliance": []}
+        self.findings = []
+
+        # The files are created with the first findings, as the batch outputs
+        filename = f"{output_options.output_directory}/{output_options.output_filename}"
+        output_classes = {
+            "csv": (CSV, csv_file_suffix),
+            "json-asff": (ASFF, json_asff_file_suffix),
+            "json-ocsf": (OCSF, json_ocsf_file_suffix),
+            "html": (HTML, html_file_suffix),
+        }
+        self._output_files = []
+        for mode in output_formats or []:
+            if mode in output_classes:
+                output_class, suffix = output_classes[mode]
+                self._output_files.append(
+                    ("regular", output_class, {}, f"{filename}{suffix}")
+                )
+        for compliance_name, compliance in compliance_frameworks.items():
+            self._output_files.append(
+                (
+                    "compliance",
+                    get_compliance_output_class(provider.type, compliance_name),
+                    {"compliance": compliance},
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv",
+                )
+            )
+        self._outputs = {}
+
+    def write(self, check_findings: list) -> None:
+        """
+        Writes the findings of a check to the output files, keeping only their summary.
+
+        Args:
+            check_findings (list): The Check_Report findings of a check.
+        """
+        try:
+            self.findings.extend(
+                FindingSummary(
+                    status=finding.status,
+                    muted=finding.muted,
+                    resource_id=finding.resource_id,
+                    check_metadata=finding.check_metadata,
+                )
+                for finding in check_findings
+            )
+            finding_outputs = [
+                Finding.generate_output(self._provider, finding, self._output_options)
+                for finding in check_findings
+            ]
+            if not finding_outputs:
+                return
+            for output_type, output_class, arguments, file_path in self._output_files:
+                output = self._outputs.get(file_path)
+                if output:
+                    output.add_findings(finding_outputs)
+                else:
+                    output = output_class(
+                        findings=finding_outputs,
+                        create_file_descriptor=True,
+                        file_path=file_path,
+                        **arguments,
+                    )
+                    self._outputs[file_path] = output
+                    self.generated_outputs[output_type].append(output)
+                if isinstance(output, HTML):
+                    output.spool_data()
+                else:
+                    output.batch_write_data_to_file(close_file=False)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def close(self, stats: dict) -> None:
+        """
+        Closes the output files once all the checks are written.
+
+        Args:
+            stats (dict): The statistics of the findings, for the HTML header.
+        """
+        for output in self._outputs.values():
+            if isinstance(output, HTML):
+                output.write_spooled_data_to_file(self._provider, stats)
+            else:
+                output.close_file_descriptor()
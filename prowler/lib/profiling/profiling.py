@@ -0,0 +1,236 @@
+import csv
+import functools
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from typing import Callable
+
+from colorama import Fore, Style
+
+from prowler.lib.logger import logger
+
+try:
+    import resource
+except ImportError:
+    # Not available in Windows, the memory is not profiled
+    resource = None
+
+# Profiler of the current process, enabled with --profile-report
+profiler = None
+
+
+@dataclass
+class ProfileRecord:
+    """
+    Aggregated measures of a profiled stage.
+
+    Attributes:
+        kind (str): "service" for the service constructors and __threading_call__ stages, "check" for the checks and "api" for the API calls made outside of them.
+        name (str): The service class, the check or the API service.
+        stage (str): The method of the service, "execute" for the checks or the API operation.
+        executions (int): The times the stage was executed.
+        duration (float): The wall-clock seconds spent in the stage, including the stages nested in it.
+        memory_delta (int): The KiB the peak memory of the process grew while the stage ran.
+        api_calls (int): The API calls made by the stage, not including the nested stages.
+        retries (int): The retries of those API calls.
+        throttles (int): The throttled attempts of those API calls.
+    """
+
+    kind: str
+    name: str
+    stage: str
+    executions: int = 0
+    duration: float = 0.0
+    memory_delta: int = 0
+    api_calls: int = 0
+    retries: int = 0
+    throttles: int = 0
+
+
+class Profiler:
+    """
+    Records the time, the memory and the API calls of the service stages and the checks.
+
+    Every measure is taken once per stage, not per resource, so it can be left enabled
+    in production. The API calls are attributed to the stage running in the thread that
+    makes them, so the stages running in a thread pool must wrap their calls with attribute_to.
+    """
+
+    def __init__(self):
+        self._records = {}
+        self._lock = threading.Lock()
+        self._scope = threading.local()
+
+    @property
+    def records(self) -> list[ProfileRecord]:
+        with self._lock:
+            return list(self._records.values())
+
+    def get_record(self, kind: str, name: str, stage: str) -> ProfileRecord:
+        with self._lock:
+            record = self._records.get((kind, name, stage))
+            if not record:
+                record = ProfileRecord(kind=kind, name=name, stage=stage)
+                self._records[(kind, name, stage)] = record
+            return record
+
+    @contextmanager
+    def profile(self, kind: str, name: str, stage: str):
+        """Measure the stage and attribute to it the API calls of the current thread while it runs"""
+        record = self.get_record(kind, name, stage)
+        previous_record = getattr(self._scope, "record", None)
+        # A stage calling itself, e.g. the constructor of a service subclass, is measured once
+        if previous_record is record:
+            yield record
+            return
+        self._scope.record = record
+        start_time = time.perf_counter()
+        start_memory = get_peak_memory()
+        try:
+            yield record
+        finally:
+            duration = time.perf_counter() - start_time
+            memory_delta = get_peak_memory() - start_memory
+            self._scope.record = previous_record
+            with self._lock:
+                record.executions += 1
+                record.duration += duration
+                record.memory_delta += memory_delta
+
+    def attribute_to(self, record: ProfileRecord, call: Callable) -> Callable:
+        """Return the call attributing its API calls to the record, to run it in another thread"""
+
+        @functools.wraps(call)
+        def attributed_call(*args, **kwargs):
+            previous_record = getattr(self._scope, "record", None)
+            self._scope.record = record
+            try:
+                return call(*args, **kwargs)
+            finally:
+                self._scope.record = previous_record
+
+        return attributed_call
+
+    def add_api_call(self, service: str, operation: str, retries: int = 0) -> None:
+        """Count an API call of the current thread, made outside of any stage it counts for the API operation"""
+        record = self._get_current_record(service, operation)
+        with self._lock:
+            record.api_calls += 1
+            record.retries += retries
+
+    def add_throttle(self, service: str, operation: str) -> None:
+        """Count a throttled attempt of an API call of the current thread"""
+        record = self._get_current_record(service, operation)
+        with self._lock:
+            record.throttles += 1
+
+    def _get_current_record(self, service: str, operation: str) -> ProfileRecord:
+        return getattr(self._scope, "record", None) or self.get_record(
+            "api", service, operation
+        )
+
+    def write_report(self, file_path: str) -> None:
+        """Write the records to a CSV file if the file_path ends with .csv, otherwise to a JSON file"""
+        try:
+            records = sorted(
+                self.records,
+                key=lambda record: (record.kind, record.name, record.stage),
+            )
+            with open(file_path, "w") as report_file:
+                if file_path.endswith(".csv"):
+                    writer = csv.DictWriter(
+                        report_file,
+                        fieldnames=[field.name for field in fields(ProfileRecord)],
+                    )
+                    writer.writeheader()
+                    for record in records:
+                        writer.writerow(asdict(record))
+                else:
+                    json.dump(
+                        [asdict(record) for record in records], report_file, indent=4
+                    )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def display_summary(self, file_path: str, top: int = 10) -> None:
+        """Print the slowest service stages and checks and the totals of the API calls"""
+        from tabulate import tabulate
+
+        records = self.records
+        for kind, title in (("service", "Service stages"), ("check", "Checks")):
+            kind_records = sorted(
+                (record for record in records if record.kind == kind),
+                key=lambda record: record.duration,
+                reverse=True,
+            )[:top]
+            if not kind_records:
+                continue
+            print(f"\nSlowest {title}:")
+            print(
+                tabulate(
+                    [
+                        {
+                            "Name": record.name,
+                            "Stage": record.stage,
+                            "Duration (s)": round(record.duration, 2),
+                            "Memory (KiB)": record.memory_delta,
+                            "API Calls": record.api_calls,
+                            "Retries": record.retries,
+                            "Throttles": record.throttles,
+                        }
+                        for record in kind_records
+                    ],
+                    headers="keys",
+                    tablefmt="rounded_grid",
+                )
+            )
+        print(
+            f"\nAPI calls: {Fore.YELLOW}{sum(record.api_calls for record in records)}{Style.RESET_ALL}"
+            f" - Retries: {Fore.YELLOW}{sum(record.retries for record in records)}{Style.RESET_ALL}"
+            f" - Throttles: {Fore.YELLOW}{sum(record.throttles for record in records)}{Style.RESET_ALL}"
+        )
+        print(f"Detailed profile report in {Fore.YELLOW}{file_path}{Style.RESET_ALL}")
+
+
+def enable_profiler() -> Profiler:
+    """Enable the profiler of the current process, it must be enabled before creating the provider sessions"""
+    global profiler
+    profiler = Profiler()
+    return profiler
+
+
+def disable_profiler() -> None:
+    global profiler
+    profiler = None
+
+
+def get_profiler() -> Profiler:
+    """Return the profiler of the current process, None if it is not enabled"""
+    return profiler
+
+
+def profile_constructor(init: Callable) -> Callable:
+    """Decorate the constructor of a service to profile it when the profiler is enabled"""
+
+    @functools.wraps(init)
+    def profiled_init(service, *args, **kwargs):
+        if not profiler:
+            return init(service, *args, **kwargs)
+        with profiler.profile("service", service.__class__.__name__, "__init__"):
+            return init(service, *args, **kwargs)
+
+    return profiled_init
+
+
+def get_peak_memory() -> int:
+    """Return the peak resident memory of the process in KiB, 0 if it is not available"""
+    if not resource:
+        return 0
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS returns bytes instead of KiB
+    return peak_memory // 1024 if sys.platform == "darwin" else peak_memory
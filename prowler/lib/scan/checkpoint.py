@@ -0,0 +1,163 @@
+import json
+import os
+import pickle
+import shutil
+from re import fullmatch
+from uuid import uuid4
+
+from prowler.config.config import default_scan_checkpoints_directory
+from prowler.lib.logger import logger
+
+CHECKPOINT_STATE_FILE = "state.json"
+CHECKPOINT_FINDINGS_DIRECTORY = "findings"
+
+
+class ScanCheckpoint:
+    """
+    On-disk state of a scan, to resume it without executing again the checks already completed.
+
+    The findings of each completed check are stored in their own file as soon as the check
+    finishes and the state file, written afterwards, lists the completed checks by service,
+    so a check is only considered completed once all its findings are on disk.
+
+    Attributes:
+        scan_id (str): The identifier of the scan, used to resume it.
+        provider (str): The provider scanned.
+        output_filename (str): The name of the output files, reused when resuming.
+        service_checks_completed (dict[str, set[str]]): The checks completed by service.
+    """
+
+    def __init__(
+        self,
+        scan_id: str,
+        provider: str,
+        output_filename: str = None,
+        service_checks_completed: dict = None,
+        checkpoints_directory: str = default_scan_checkpoints_directory,
+    ):
+        """
+        Args:
+            scan_id (str): The identifier of the scan.
+            provider (str): The provider scanned.
+            output_filename (str): The name of the output files.
+            service_checks_completed (dict[str, set[str]]): The checks already completed by service.
+            checkpoints_directory (str): The directory where the scans are checkpointed.
+        """
+        self.scan_id = scan_id
+        self.provider = provider
+        self.output_filename = output_filename
+        self.service_checks_completed = service_checks_completed or {}
+        self._directory = f"{checkpoints_directory}/{scan_id}"
+
+    @staticmethod
+    def create(
+        provider: str,
+        output_filename: str = None,
+        checkpoints_directory: str = default_scan_checkpoints_directory,
+    ) -> "ScanCheckpoint":
+        """Create the checkpoint of a new scan with a random scan_id"""
+        checkpoint = ScanCheckpoint(
+            str(uuid4()), provider, output_filename, None, checkpoints_directory
+        )
+        checkpoint._write_state()
+        return checkpoint
+
+    @staticmethod
+    def load(
+        scan_id: str,
+        checkpoints_directory: str = default_scan_checkpoints_directory,
+    ) -> "ScanCheckpoint":
+        """
+        Load the checkpoint of an interrupted scan.
+
+        Raises:
+            FileNotFoundError: If there is no checkpoint for the scan_id.
+        """
+        with open(
+            f"{checkpoints_directory}/{scan_id}/{CHECKPOINT_STATE_FILE}"
+        ) as state_file:
+            state = json.load(state_file)
+        return ScanCheckpoint(
+            scan_id=scan_id,
+            provider=state["provider"],
+            output_filename=state["output_filename"],
+            service_checks_completed={
+                service: set(checks)
+                for service, checks in state["service_checks_completed"].items()
+            },
+            checkpoints_directory=checkpoints_directory,
+        )
+
+    @property
+    def completed_checks(self) -> set[str]:
+        completed_checks = set()
+        for checks in self.service_checks_completed.values():
+            completed_checks.update(checks)
+        return completed_checks
+
+    def save(self, check_name: str, check_findings: list) -> None:
+        """
+        Store the findings of a completed check and mark it as completed.
+
+        If the findings cannot be stored the check is not marked, so it is executed again when resuming.
+        """
+        try:
+            findings_directory = f"{self._directory}/{CHECKPOINT_FINDINGS_DIRECTORY}"
+            os.makedirs(findings_directory, exist_ok=True)
+            _write_atomically(
+                f"{findings_directory}/{check_name}.pickle",
+                pickle.dumps(check_findings, protocol=pickle.HIGHEST_PROTOCOL),
+            )
+            self.service_checks_completed.setdefault(
+                check_name.split("_")[0], set()
+            ).add(check_name)
+            self._write_state()
+        except Exception as error:
+            logger.warning(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def load_findings(self, check_name: str) -> list:
+        """Return the findings stored for a completed check"""
+        with open(
+            f"{self._directory}/{CHECKPOINT_FINDINGS_DIRECTORY}/{check_name}.pickle",
+            "rb",
+        ) as findings_file:
+            return pickle.load(findings_file)
+
+    def remove(self) -> None:
+        """Remove the checkpoint once the scan is completed"""
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def _write_state(self) -> None:
+        os.makedirs(self._directory, exist_ok=True)
+        _write_atomically(
+            f"{self._directory}/{CHECKPOINT_STATE_FILE}",
+            json.dumps(
+                {
+                    "provider": self.provider,
+                    "output_filename": self.output_filename,
+                    "service_checks_completed": {
+                        service: sorted(checks)
+                        for service, checks in self.service_checks_completed.items()
+                    },
+                }
+            ).encode(),
+        )
+
+
+def is_valid_scan_id(
+    scan_id: str, checkpoints_directory: str = default_scan_checkpoints_directory
+) -> bool:
+    """is_valid_scan_id returns True if there is a checkpoint for the scan_id"""
+    return bool(fullmatch(r"[0-9a-fA-F-]+", scan_id)) and os.path.isfile(
+        f"{checkpoints_directory}/{scan_id}/{CHECKPOINT_STATE_FILE}"
+    )
+
+
+def _write_atomically(file_path: str, content: bytes) -> None:
+    # The file is replaced at once, so an interruption never leaves it half written
+    temporary_file = f"{file_path}.{os.getpid()}.tmp"
+    with open(temporary_file, "wb") as f:
+        f.write(content)
+    os.replace(temporary_file, file_path)
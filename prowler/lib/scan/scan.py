@@ -1,8 +1,15 @@
+import traceback
 from typing import Generator
 
-from prowler.lib.check.check import execute, import_check, update_audit_metadata
+from prowler.lib.check.check import (
+    execute,
+    import_check,
+    run_checks,
+    update_audit_metadata,
+)
 from prowler.lib.logger import logger
 from prowler.lib.outputs.finding import Finding
+from prowler.lib.scan.checkpoint import ScanCheckpoint
 from prowler.providers.common.models import Audit_Metadata
 from prowler.providers.common.provider import Provider
 
@@ -17,17 +24,33 @@ class Scan:
     _service_checks_to_execute: dict[str, set[str]]
     _service_checks_completed: dict[str, set[str]]
     _progress: float = 0.0
-    _findings: list = []
+    _findings: list
+    _store_findings: bool = True
+    _parallel_checks: int = 0
+    _checkpoint: ScanCheckpoint = None
 
-    def __init__(self, provider: Provider, checks_to_execute: list[str]):
+    def __init__(
+        self,
+        provider: Provider,
+        checks_to_execute: list[str],
+        parallel_checks: int = 0,
+        store_findings: bool = True,
+        checkpoint: ScanCheckpoint = None,
+    ):
         """
         Scan is the class that executes the checks and yields the progress and the findings.
 
         Params:
             provider: Provider -> The provider to scan
             checks_to_execute: list[str] -> The checks to execute
+            parallel_checks: int -> The number of workers to run the checks concurrently, 0 or 1 to run them sequentially
+            store_findings: bool -> Keep the findings of every check in findings, disable it to only get them from scan() and bound the memory used
+            checkpoint: ScanCheckpoint -> Store the completed checks to resume the scan, the checks it already has completed are not executed again
         """
         self._provider = provider
+        self._parallel_checks = parallel_checks
+        self._findings = []
+        self._store_findings = store_findings
         # Remove duplicated checks and sort them
         self._checks_to_execute = sorted(list(set(checks_to_execute)))
 
@@ -39,6 +62,17 @@ class Scan:
         self._service_checks_to_execute = service_checks_to_execute
         self._service_checks_completed = service_checks_completed
 
+        # Resume the checks already completed from the checkpoint
+        self._checkpoint = checkpoint
+        if checkpoint:
+            checkpoint_completed_checks = checkpoint.completed_checks
+            for check_name in self._checks_to_execute:
+                if check_name not in checkpoint_completed_checks:
+                    continue
+                if self._store_findings:
+                    self._findings.extend(checkpoint.load_findings(check_name))
+                self._complete_check(check_name)
+
     @property
     def checks_to_execute(self) -> set[str]:
         return self._checks_to_execute
@@ -65,6 +99,14 @@ class Scan:
     def findings(self) -> list:
         return self._findings
 
+    @property
+    def parallel_checks(self) -> int:
+        return self._parallel_checks
+
+    @property
+    def checkpoint(self) -> ScanCheckpoint:
+        return self._checkpoint
+
     def scan(
         self,
         custom_checks_metadata: dict = {},
@@ -85,6 +127,7 @@ class Scan:
         """
         try:
             checks_to_execute = self.checks_to_execute
+            completed_checks = self.get_completed_checks()
             # Initialize the Audit Metadata
             # TODO: this should be done in the provider class
             # Refactor(Core): Audit manager?
@@ -95,42 +138,51 @@ class Scan:
                 audit_progress=0,
             )
 
-            for check_name in checks_to_execute:
-                try:
-                    # Recover service from check name
-                    service = get_service_name_from_check_name(check_name)
-                    try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                        )
-                        continue
-                    # Execute the check
-                    check_findings = execute(
-                        check,
-                        self._provider,
-                        custom_checks_metadata,
-                        output_options=None,
+            def run_check(check_name: str) -> list:
+                # Recover service from check name
+                service = get_service_name_from_check_name(check_name)
+                # Import check module
+                check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
+                lib = import_check(check_module_path)
+                # Recover functions from check
+                check_to_execute = getattr(lib, check_name)
+                check = check_to_execute()
+                # Execute the check
+                return execute(
+                    check,
+                    self._provider,
+                    custom_checks_metadata,
+                    output_options=None,
+                )
+
+            for check_name, check_findings, error in run_checks(
+                [
+                    check_name
+                    for check_name in checks_to_execute
+                    if check_name not in completed_checks
+                ],
+                run_check,
+                self._parallel_checks,
+            ):
+                # If check does not exists in the provider or is from another provider
+                if isinstance(error, ModuleNotFoundError):
+                    logger.error(
+                        f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
                     )
-
+                    continue
+                elif error:
+                    logger.error(
+                        f"{check_name} - {error.__class__.__name__}[{traceback.extract_tb(error.__traceback__)[-1].lineno}]: {error}"
+                    )
+                    continue
+                try:
                     # Store findings
-                    self._findings.extend(check_findings)
-
-                    # Remove the executed check
-                    self._service_checks_to_execute[service].remove(check_name)
-                    if len(self._service_checks_to_execute[service]) == 0:
-                        self._service_checks_to_execute.pop(service, None)
-                    # Add the completed check
-                    if service not in self._service_checks_completed:
-                        self._service_checks_completed[service] = set()
-                    self._service_checks_completed[service].add(check_name)
-                    self._number_of_checks_completed += 1
+                    if self._store_findings:
+                        self._findings.extend(check_findings)
+                    if self._checkpoint:
+                        self._checkpoint.save(check_name, check_findings)
+
+                    self._complete_check(check_name)
 
                     # This should be done just once all the service's checks are completed
                     # This metadata needs to get to the services not within the provider
@@ -150,11 +202,6 @@ class Scan:
 
                     yield self.progress, findings
 
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                    )
                 except Exception as error:
                     logger.error(
                         f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -164,6 +211,18 @@ class Scan:
                 f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def _complete_check(self, check_name: str) -> None:
+        service = get_service_name_from_check_name(check_name)
+        # Remove the executed check
+        self._service_checks_to_execute[service].remove(check_name)
+        if len(self._service_checks_to_execute[service]) == 0:
+            self._service_checks_to_execute.pop(service, None)
+        # Add the completed check
+        if service not in self._service_checks_completed:
+            self._service_checks_completed[service] = set()
+        self._service_checks_completed[service].add(check_name)
+        self._number_of_checks_completed += 1
+
     def get_completed_services(self) -> set[str]:
         """
         get_completed_services returns the services that have been completed.
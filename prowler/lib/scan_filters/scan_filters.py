@@ -1,13 +1,55 @@
+from bisect import bisect_left
+
 from prowler.lib.logger import logger
 
 
+class AuditResourcesIndex(list):
+    """
+    The resources to audit, indexed once to check if each listed resource is filtered.
+
+    A resource is filtered if it is contained in any of the resources to audit, e.g. the
+    ARN itself, the ARN of a parent path or the name of the resource. The ARNs are looked
+    up in a set, the partial ARNs by prefix in the sorted resources and the names by a
+    substring search over all the resources joined, without building their list string.
+
+    The index is built from the resources it is created with, it is not updated if the
+    list is modified afterwards.
+    """
+
+    def __init__(self, resources: list = ()):
+        super().__init__(resources)
+        self._resources = frozenset(self)
+        self._sorted_resources = sorted(self._resources)
+        # An ARN inside another resource can't be looked up by prefix
+        self._has_inner_arns = any(
+            resource.find("arn:", 1) != -1 for resource in self._resources
+        )
+        self._joined_resources = "\n".join(self._sorted_resources)
+
+    def is_filtered(self, resource: str) -> bool:
+        """Return True if the resource is contained in any of the resources to audit"""
+        if resource in self._resources:
+            return True
+        if resource.startswith("arn:") and not self._has_inner_arns:
+            position = bisect_left(self._sorted_resources, resource)
+            return position < len(self._sorted_resources) and self._sorted_resources[
+                position
+            ].startswith(resource)
+        return resource in self._joined_resources
+
+
 def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     """
     Check if the resource passed as argument is present in the audit_resources.
 
+    The audit_resources of the provider are an AuditResourcesIndex, any other list is
+    searched as a string.
+
     Returns True if it is filtered and False if it does not match the input filters
     """
     try:
+        if isinstance(audit_resources, AuditResourcesIndex):
+            return audit_resources.is_filtered(resource)
         if resource in str(audit_resources):
             return True
         return False
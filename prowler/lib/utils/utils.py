@@ -19,8 +19,6 @@ from time import mktime
 from typing import Optional
 
 from colorama import Style
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import transient_settings
 
 from prowler.config.config import encoding_format_utf_8
 from prowler.lib.logger import logger
@@ -98,6 +96,10 @@ def detect_secrets_scan(
         >>> detect_secrets_scan(file="file.txt")
         {'file.txt': [{'filename': 'file.txt', 'hashed_secret': 'f7c3bc1d808e04732adf679965ccc34ca7ae3441', 'is_verified': False, 'line_number': 1, 'type': 'Secret Keyword'}]}
     """
+    # Imported on the first scan, only the checks looking for secrets need detect-secrets
+    from detect_secrets import SecretsCollection
+    from detect_secrets.settings import transient_settings
+
     try:
         if not file:
             temp_data_file = tempfile.NamedTemporaryFile(delete=False)
@@ -5,6 +5,7 @@ from re import fullmatch
 
 from boto3 import client
 from boto3.session import Session
+from botocore.client import BaseClient
 from botocore.config import Config
 from botocore.credentials import RefreshableCredentials
 from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
@@ -13,10 +14,13 @@ from colorama import Fore, Style
 from pytz import utc
 from tzlocal import get_localzone
 
-from prowler.config.config import aws_services_json_file, get_default_mute_file_path
+from prowler.config.config import get_default_mute_file_path
+from prowler.lib.api_archive.api_archive import get_api_archive, open_api_archive
 from prowler.lib.check.utils import list_modules, recover_checks_from_service
 from prowler.lib.logger import logger
-from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
+from prowler.lib.profiling.profiling import get_profiler
+from prowler.lib.scan_filters.scan_filters import AuditResourcesIndex
+from prowler.lib.utils.utils import print_boxes
 from prowler.providers.aws.config import (
     AWS_REGION_US_EAST_1,
     AWS_STS_GLOBAL_ENDPOINT_REGION,
@@ -37,13 +41,20 @@ from prowler.providers.aws.exceptions.exceptions import (
     AWSProfileNotFoundError,
     AWSSetUpSessionError,
 )
+from prowler.providers.aws.lib.api_archive.api_archive import register_api_archive
 from prowler.providers.aws.lib.arn.arn import parse_iam_credentials_arn
 from prowler.providers.aws.lib.arn.models import ARN
+from prowler.providers.aws.lib.client_cache.client_cache import (
+    AWSClientCache,
+    share_data_loader,
+)
 from prowler.providers.aws.lib.mutelist.mutelist import AWSMutelist
 from prowler.providers.aws.lib.organizations.organizations import (
     get_organizations_metadata,
     parse_organizations_metadata,
 )
+from prowler.providers.aws.lib.profiling.profiling import register_profiling
+from prowler.providers.aws.lib.regions.regions import get_aws_regions_index
 from prowler.providers.aws.models import (
     AWSAssumeRoleConfiguration,
     AWSAssumeRoleInfo,
@@ -86,6 +97,8 @@ class AwsProvider(Provider):
         resource_arn: list[str] = [],
         audit_config: dict = {},
         fixer_config: dict = {},
+        record: str = None,
+        replay: str = None,
     ):
         """
         Initializes the AWS provider.
@@ -105,6 +118,8 @@ class AwsProvider(Provider):
             - resource_arn: A list of ARNs of the resources to audit.
             - audit_config: The audit configuration.
             - fixer_config: The fixer configuration.
+            - record: The path of the archive to record the API responses to.
+            - replay: The path of the archive to replay the API responses from, instead of requesting them.
 
         Raises:
             - ArgumentTypeError: If the input MFA ARN is invalid.
@@ -115,9 +130,18 @@ class AwsProvider(Provider):
         """
         logger.info("Initializing AWS provider ...")
 
+        ######## API Archive
+        # It must be opened before creating the sessions, since their clients record or replay the responses
+        if record or replay:
+            open_api_archive(record or replay, "record" if record else "replay")
+        ########
+
         ######## AWS Session
         logger.info("Generating original session ...")
 
+        # The clients of the services, shared by all of them
+        self._client_cache = AWSClientCache()
+
         # Configure the initial AWS Session using the local credentials: profile or environment variables
         aws_session = self.setup_session(mfa, profile)
         session_config = self.set_session_config(retries_max_attempts)
@@ -249,11 +273,13 @@ class AwsProvider(Provider):
 
         # Parse Scan Tags
         if resource_tags:
-            self._audit_resources = self.get_tagged_resources(resource_tags)
+            self._audit_resources = AuditResourcesIndex(
+                self.get_tagged_resources(resource_tags)
+            )
 
         # Parse Input Resource ARNs
         if resource_arn:
-            self._audit_resources = resource_arn
+            self._audit_resources = AuditResourcesIndex(resource_arn)
 
         # Get Enabled Regions
         self._enabled_regions = self.get_aws_enabled_regions(
@@ -437,7 +463,7 @@ class AwsProvider(Provider):
                 session_credentials = sts_client.get_session_token(
                     **get_session_token_arguments
                 )
-                return Session(
+                session = Session(
                     aws_access_key_id=session_credentials["Credentials"]["AccessKeyId"],
                     aws_secret_access_key=session_credentials["Credentials"][
                         "SecretAccessKey"
@@ -448,9 +474,12 @@ class AwsProvider(Provider):
                     profile_name=profile,
                 )
             else:
-                return Session(
+                session = Session(
                     profile_name=profile,
                 )
+            AwsProvider.register_session_event_handlers(session)
+            share_data_loader(session)
+            return session
         except Exception as error:
             logger.critical(
                 f"AWSSetUpSessionError[{error.__traceback__.tb_lineno}]: {error}"
@@ -460,6 +489,21 @@ class AwsProvider(Provider):
                 file=pathlib.Path(__file__).name,
             )
 
+    @staticmethod
+    def register_session_event_handlers(session: Session) -> None:
+        """
+        Registers the botocore event handlers of the API archive and the profiler, if they are enabled, in the session.
+
+        Args:
+            session (Session): The session, before creating any client with it.
+        """
+        api_archive = get_api_archive()
+        if api_archive:
+            register_api_archive(session, api_archive)
+        profiler = get_profiler()
+        if profiler:
+            register_profiling(session, profiler)
+
     def setup_assumed_session(
         self,
         assumed_role_credentials: AWSCredentials,
@@ -503,10 +547,13 @@ class AwsProvider(Provider):
             assumed_session = BotocoreSession()
             assumed_session._credentials = assumed_refreshable_credentials
             assumed_session.set_config_variable("region", self._identity.profile_region)
-            return Session(
+            session = Session(
                 profile_name=self._identity.profile,
                 botocore_session=assumed_session,
             )
+            self.register_session_event_handlers(session)
+            share_data_loader(session)
+            return session
         except Exception as error:
             logger.critical(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -550,6 +597,8 @@ class AwsProvider(Provider):
                 token=assume_role_response.aws_session_token,
                 expiry_time=assume_role_response.expiration.isoformat(),
             )
+            # The clients created from now on belong to the new credentials
+            self._client_cache.invalidate()
             logger.info("Refreshed Credentials")
 
         return refreshed_credentials
@@ -596,20 +645,10 @@ class AwsProvider(Provider):
         """
         try:
             regional_clients = {}
-            service_regions = self.get_available_aws_service_regions(service)
-
-            # Get the regions enabled for the account and get the intersection with the service available regions
-            if self._enabled_regions:
-                enabled_regions = service_regions.intersection(self._enabled_regions)
-            else:
-                enabled_regions = service_regions
+            enabled_regions = self.get_enabled_aws_service_regions(service)
 
             for region in enabled_regions:
-                regional_client = self._session.current_session.client(
-                    service, region_name=region, config=self._session.session_config
-                )
-                regional_client.region = region
-                regional_clients[region] = regional_client
+                regional_clients[region] = self.get_client(service, region)
 
             return regional_clients
         except Exception as error:
@@ -617,17 +656,29 @@ class AwsProvider(Provider):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def get_available_aws_service_regions(self, service: str) -> set:
-        data = read_aws_regions_file()
-        json_regions = set(
-            data["services"][service]["regions"][self._identity.partition]
+    def get_client(self, service: str, region: str) -> BaseClient:
+        """get_client returns the client of the service in the region, created once with the current session and shared by all the services"""
+        return self._client_cache.get_client(
+            self._session.current_session,
+            service,
+            region,
+            self._session.session_config,
+        )
+
+    def get_available_aws_service_regions(self, service: str) -> frozenset:
+        """get_available_aws_service_regions returns the regions of the service in the partition, only the audited ones if there are audited regions"""
+        return get_aws_regions_index().get_service_regions(
+            service, self._identity.partition, self._identity.audited_regions
+        )
+
+    def get_enabled_aws_service_regions(self, service: str) -> frozenset:
+        """get_enabled_aws_service_regions returns the available regions of the service that are enabled in the account, all of them if the enabled regions are unknown"""
+        return get_aws_regions_index().get_service_regions(
+            service,
+            self._identity.partition,
+            self._identity.audited_regions,
+            self._enabled_regions,
         )
-        if self._identity.audited_regions:
-            # Get common regions between input and json
-            regions = json_regions.intersection(self._identity.audited_regions)
-        else:  # Get all regions from json of the service and partition
-            regions = json_regions
-        return regions
 
     def get_checks_from_input_arn(self) -> set:
         """
@@ -1151,42 +1202,6 @@ class AwsProvider(Provider):
             raise error
 
 
-def read_aws_regions_file() -> dict:
-    """
-    Reads the AWS services JSON file and returns the parsed data as a dictionary.
-
-    Returns:
-        dict: The parsed data from the AWS services JSON file.
-    """
-    # Get JSON locally
-    actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
-    with open_file(f"{actual_directory}/{aws_services_json_file}") as f:
-        data = parse_json_file(f)
-
-    return data
-
-
-def get_aws_available_regions() -> set:
-    """
-    Get the available AWS regions from the AWS services JSON file.
-
-    Returns:
-        set: A set of available AWS regions.
-    """
-    try:
-        data = read_aws_regions_file()
-
-        regions = set()
-        for service in data["services"].values():
-            for partition in service["regions"]:
-                for item in service["regions"][partition]:
-                    regions.add(item)
-        return regions
-    except Exception as error:
-        logger.error(f"{error.__class__.__name__}: {error}")
-        return set()
-
-
 # TODO: This can be moved to another class since it doesn't need self
 def get_aws_region_for_sts(session_region: str, regions: set[str]) -> str:
     # If there is no region passed with -f/--region/--filter-region
@@ -0,0 +1,71 @@
+from boto3.session import Session
+from botocore.awsrequest import AWSResponse
+
+from prowler.lib.api_archive.api_archive import APIArchive
+
+API_ARCHIVE_REQUEST_CONTEXT_KEY = "prowler_api_archive_request"
+
+
+def register_api_archive(session: Session, api_archive: APIArchive) -> None:
+    """
+    Register the botocore event handlers that record or replay the API responses of the clients of a session.
+
+    The handlers must be registered before creating the clients, since each client copies
+    the handlers of its session when it is created.
+
+    Args:
+        session (Session): The boto3 session.
+        api_archive (APIArchive): The archive to record the responses to or to replay them from.
+    """
+    # Registered first so the request is identified before other handlers add generated parameters
+    session.events.register_first(
+        "before-parameter-build",
+        _set_api_archive_request,
+        unique_id="prowler-api-archive-request",
+    )
+    if api_archive.mode == "record":
+        session.events.register(
+            "after-call",
+            _get_record_handler(api_archive),
+            unique_id="prowler-api-archive-record",
+        )
+    else:
+        session.events.register_first(
+            "before-call",
+            _get_replay_handler(api_archive),
+            unique_id="prowler-api-archive-replay",
+        )
+
+
+def _set_api_archive_request(params, model, context, **kwargs):
+    context[API_ARCHIVE_REQUEST_CONTEXT_KEY] = {
+        "provider": "aws",
+        "service": model.service_model.service_name,
+        "region": context.get("client_region"),
+        "operation": model.name,
+        "parameters": params,
+    }
+
+
+def _get_record_handler(api_archive: APIArchive):
+    def record_response(http_response, parsed, context, **kwargs):
+        request = context.get(API_ARCHIVE_REQUEST_CONTEXT_KEY)
+        if request and http_response is not None:
+            api_archive.record(
+                request,
+                {"status_code": http_response.status_code, "parsed": parsed},
+            )
+
+    return record_response
+
+
+def _get_replay_handler(api_archive: APIArchive):
+    def replay_response(context, **kwargs):
+        response = api_archive.replay(context[API_ARCHIVE_REQUEST_CONTEXT_KEY])
+        # Returning the response stops botocore from sending the request
+        return (
+            AWSResponse(None, response["status_code"], {}, None),
+            response["parsed"],
+        )
+
+    return replay_response
@@ -1,9 +1,10 @@
 from argparse import ArgumentTypeError, Namespace
 from re import fullmatch, search
+from zipfile import is_zipfile
 
-from prowler.providers.aws.aws_provider import get_aws_available_regions
 from prowler.providers.aws.config import ROLE_SESSION_NAME
 from prowler.providers.aws.lib.arn.arn import arn_type
+from prowler.providers.aws.lib.regions.regions import get_aws_available_regions
 
 
 def init_parser(self):
@@ -159,6 +160,25 @@ def init_parser(self):
         help="Scan unused services",
     )
 
+    # API Responses Archive
+    api_archive_subparser = aws_parser.add_argument_group("API Responses Archive")
+    api_archive_parser = api_archive_subparser.add_mutually_exclusive_group()
+    api_archive_parser.add_argument(
+        "--record",
+        nargs="?",
+        default=None,
+        metavar="ARCHIVE",
+        help="Record the responses of every AWS API call of the scan to the given archive file",
+    )
+    api_archive_parser.add_argument(
+        "--replay",
+        nargs="?",
+        default=None,
+        metavar="ARCHIVE",
+        type=validate_replay_archive,
+        help="Replay the AWS API responses of an archive recorded with --record, instead of calling the AWS APIs",
+    )
+
     # Prowler Fixer
     prowler_fixer_subparser = aws_parser.add_argument_group("Prowler Fixer")
     prowler_fixer_subparser.add_argument(
@@ -219,9 +239,28 @@ def validate_arguments(arguments: Namespace) -> tuple[bool, str]:
                 "To use -I/--external-id, -T/--session-duration or --role-session-name options -R/--role option is needed",
             )
 
+    # The streamed findings are not kept to send them to Security Hub or fix them
+    if getattr(arguments, "stream_outputs", False) and (
+        arguments.security_hub or arguments.fixer
+    ):
+        return (
+            False,
+            "--stream-outputs cannot be used with --security-hub or --fixer",
+        )
+
     return (True, "")
 
 
+def validate_replay_archive(archive_path: str) -> str:
+    """validate_replay_archive validates that the input archive_path is an archive recorded with --record"""
+    if is_zipfile(archive_path):
+        return archive_path
+    else:
+        raise ArgumentTypeError(
+            f"{archive_path} is not an API archive recorded with --record"
+        )
+
+
 def validate_bucket(bucket_name: str) -> str:
     """validate_bucket validates that the input bucket_name is valid"""
     if search("(?!(^xn--|.+-s3alias$))^[a-z0-9][a-z0-9-]{1,61}[a-z0-9]$", bucket_name):
@@ -0,0 +1,85 @@
+import threading
+
+from boto3.session import Session
+from botocore.client import BaseClient
+from botocore.config import Config
+
+# The botocore loader shared by the sessions of the process, see share_data_loader
+_shared_data_loader = None
+_shared_data_loader_lock = threading.Lock()
+
+
+def share_data_loader(session: Session) -> None:
+    """
+    Make the session load the service models and endpoint rulesets with the loader shared by every session.
+
+    The loader caches the files it parses, so sharing it means each service model is
+    only parsed once per process, for the original session, the assumed role sessions
+    and the sessions of the clients created afterwards. The first session shares its own.
+
+    Args:
+        session (Session): The boto3 session, before creating any client with it.
+    """
+    global _shared_data_loader
+    with _shared_data_loader_lock:
+        if _shared_data_loader is None:
+            _shared_data_loader = session._session.get_component("data_loader")
+        else:
+            session._session.register_component("data_loader", _shared_data_loader)
+
+
+class AWSClientCache:
+    """
+    Thread-safe cache of the boto3 clients of the provider by service and region.
+
+    A cached client is only reused while it was created with the current session and
+    session config of the provider and in the current credentials generation, which is
+    increased with invalidate when the credentials are rotated.
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._generation = 0
+        # Reentrant since creating a client can refresh the credentials, which invalidates
+        self._lock = threading.RLock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def invalidate(self) -> None:
+        """Start a new credentials generation, the clients created before are not reused"""
+        with self._lock:
+            self._generation += 1
+            self._clients = {}
+
+    def get_client(
+        self, session: Session, service: str, region: str, config: Config = None
+    ) -> BaseClient:
+        """
+        Return the client of the service in the region, creating it the first time.
+
+        Args:
+            session (Session): The current session of the provider.
+            service (str): The service name, e.g. ec2.
+            region (str): The region name.
+            config (Config): The session config of the provider.
+
+        Returns:
+            BaseClient: The client, with its region in the region attribute.
+        """
+        key = (service, region)
+        with self._lock:
+            generation = self._generation
+            cached = self._clients.get(key)
+            if (
+                cached is not None
+                and cached[0] is session
+                and cached[1] is config
+                and cached[2] == generation
+            ):
+                return cached[3]
+            client = session.client(service, region_name=region, config=config)
+            client.region = region
+            self._clients[key] = (session, config, generation, client)
+            return client
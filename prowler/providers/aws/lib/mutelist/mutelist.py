@@ -56,6 +56,16 @@ class AWSMutelist(Mutelist):
             unroll_dict(unroll_tags(finding.resource_tags)),
         )
 
+    def mute_findings(
+        self,
+        findings: list[Check_Report_AWS],
+        aws_account_id: str,
+    ) -> None:
+        self._mute_findings(
+            findings,
+            lambda finding: (aws_account_id, finding.region, finding.resource_id),
+        )
+
     def get_mutelist_file_from_s3(self, aws_session: Session = None):
         try:
             bucket = self._mutelist_file_path.split("/")[2]
@@ -0,0 +1,57 @@
+from boto3.session import Session
+
+from prowler.lib.profiling.profiling import Profiler
+
+# Error codes botocore retries as throttling errors
+THROTTLING_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "TransactionInProgressException",
+    "RequestLimitExceeded",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "RequestThrottled",
+    "SlowDown",
+    "PriorRequestNotComplete",
+    "EC2ThrottledException",
+}
+
+
+def register_profiling(session: Session, profiler: Profiler) -> None:
+    """
+    Register the botocore event handlers that count the API calls, retries and throttles of the clients of a session.
+
+    The handlers must be registered before creating the clients, since each client copies
+    the handlers of its session when it is created.
+
+    Args:
+        session (Session): The boto3 session.
+        profiler (Profiler): The profiler to count the API calls in.
+    """
+
+    def count_api_call(parsed, model, **kwargs):
+        profiler.add_api_call(
+            model.service_model.service_name,
+            model.name,
+            retries=(parsed or {}).get("ResponseMetadata", {}).get("RetryAttempts", 0),
+        )
+
+    # Emitted after each attempt of an API call, before deciding to retry it
+    def count_throttle(response, operation, **kwargs):
+        if response is not None:
+            error_code = (response[1] or {}).get("Error", {}).get("Code")
+            if error_code in THROTTLING_ERROR_CODES:
+                profiler.add_throttle(
+                    operation.service_model.service_name, operation.name
+                )
+
+    session.events.register(
+        "after-call", count_api_call, unique_id="prowler-profiling-api-call"
+    )
+    session.events.register_first(
+        "needs-retry", count_throttle, unique_id="prowler-profiling-throttle"
+    )
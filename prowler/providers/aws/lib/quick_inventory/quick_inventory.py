@@ -24,17 +24,11 @@ def quick_inventory(provider: AwsProvider, args):
         global_resources = []
         total_resources_per_region = {}
         iam_was_scanned = False
-        # If not inputed regions, check all of them
+        # If not inputed regions, check all the enabled ones where the Resource Groups Tagging API is available
         if not provider.identity.audited_regions:
-            # EC2 client for describing all regions
-            ec2_client = provider.session.current_session.client(
-                "ec2", region_name=provider.identity.profile_region
+            provider.identity.audited_regions = list(
+                provider.get_enabled_aws_service_regions("resourcegroupstaggingapi")
             )
-            # Get all the available regions
-            provider.identity.audited_regions = [
-                region["RegionName"]
-                for region in ec2_client.describe_regions()["Regions"]
-            ]
 
         with alive_bar(
             total=len(provider.identity.audited_regions),
@@ -0,0 +1,114 @@
+import os
+import pathlib
+from functools import lru_cache
+from types import MappingProxyType
+
+from prowler.config.config import aws_services_json_file
+from prowler.lib.logger import logger
+from prowler.lib.utils.utils import open_file, parse_json_file
+
+
+def read_aws_regions_file() -> dict:
+    """
+    Reads the AWS services JSON file and returns the parsed data as a dictionary.
+
+    Returns:
+        dict: The parsed data from the AWS services JSON file.
+    """
+    # Get JSON locally
+    aws_provider_directory = pathlib.Path(
+        os.path.dirname(os.path.realpath(__file__))
+    ).parents[1]
+    with open_file(f"{aws_provider_directory}/{aws_services_json_file}") as f:
+        data = parse_json_file(f)
+
+    return data
+
+
+class AWSRegionsIndex:
+    """
+    The AWS regions of each service and partition, from the AWS services JSON file.
+
+    The regions are frozensets and the services read-only mappings, so the index is
+    shared by every service of the process. The regions of a service audited and
+    enabled in the account are computed once for each combination.
+
+    Attributes:
+        services (MappingProxyType): The regions of each partition of each service.
+        regions (frozenset): The regions of every service and partition.
+    """
+
+    def __init__(self, data: dict):
+        """
+        Args:
+            data (dict): The parsed AWS services JSON file.
+        """
+        self.services = MappingProxyType(
+            {
+                service: MappingProxyType(
+                    {
+                        partition: frozenset(regions)
+                        for partition, regions in service_info["regions"].items()
+                    }
+                )
+                for service, service_info in data["services"].items()
+            }
+        )
+        self.regions = frozenset(
+            region
+            for partitions in self.services.values()
+            for regions in partitions.values()
+            for region in regions
+        )
+        # The regions of each (service, partition, audited regions, enabled regions)
+        self._service_regions = {}
+
+    def get_service_regions(
+        self,
+        service: str,
+        partition: str,
+        audited_regions=None,
+        enabled_regions=None,
+    ) -> frozenset:
+        """
+        Return the regions of the service in the partition, intersected with the audited
+        regions and the regions enabled in the account when they are not empty.
+
+        Raises:
+            KeyError: If the service or the partition is not in the AWS services JSON file.
+        """
+        key = (
+            service,
+            partition,
+            frozenset(audited_regions or ()),
+            frozenset(enabled_regions or ()),
+        )
+        regions = self._service_regions.get(key)
+        if regions is None:
+            regions = self.services[service][partition]
+            if key[2]:
+                regions = regions & key[2]
+            if key[3]:
+                regions = regions & key[3]
+            self._service_regions[key] = regions
+        return regions
+
+
+@lru_cache(maxsize=None)
+def get_aws_regions_index() -> AWSRegionsIndex:
+    """Return the AWS regions index, read from the AWS services JSON file once per process"""
+    return AWSRegionsIndex(read_aws_regions_file())
+
+
+def get_aws_available_regions() -> set:
+    """
+    Get the available AWS regions from the AWS services JSON file.
+
+    Returns:
+        set: A set of available AWS regions.
+    """
+    try:
+        return set(get_aws_regions_index().regions)
+    except Exception as error:
+        logger.error(f"{error.__class__.__name__}: {error}")
+        return set()
@@ -1,6 +1,8 @@
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from prowler.lib.logger import logger
+from prowler.lib.profiling.profiling import get_profiler, profile_constructor
 from prowler.providers.aws.aws_provider import AwsProvider
 
 # TODO: review the following code
@@ -12,6 +14,53 @@ from prowler.providers.aws.aws_provider import AwsProvider
 MAX_WORKERS = 10
 
 
+class ServiceCollection:
+    """
+    Service attribute populated by a collection method the first time it is read.
+
+    Declaring the attributes of a service this way means only the data read by the
+    audited checks is fetched. The collection method runs once, holding the service
+    lock, and it can populate more than one attribute (e.g. security_groups and
+    regions_with_sgs). Its thread pool reads the attributes while they are populated,
+    so the collection method has to read the collections it depends on before calling
+    __threading_call__.
+
+    Usage:
+        class EC2(AWSService):
+            instances = ServiceCollection("_collect_instances")
+
+            def _collect_instances(self):
+                self.instances = []
+                self.__threading_call__(self._describe_instances)
+    """
+
+    def __init__(self, collector: str):
+        self.collector = collector
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, service, owner=None):
+        if service is None:
+            return self
+        if self.name not in service._collected_attributes and not getattr(
+            service._collector_thread, "active", False
+        ):
+            service.__collect__(self.collector)
+        try:
+            return service.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(
+                f"{service.__class__.__name__} has no attribute '{self.name}', '{self.collector}' did not populate it"
+            )
+
+    def __set__(self, service, value):
+        service.__dict__[self.name] = value
+        # Values assigned outside of the collection method are not collected again
+        if self.collector not in service._running_collectors:
+            service._collected_attributes.add(self.name)
+
+
 class AWSService:
     """The AWSService class offers a parent class for each AWS Service to generate:
     - AWS Regional Clients
@@ -23,6 +72,12 @@ class AWSService:
 
     failed_checks = set()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Profile the constructor of every service with --profile-report
+        if "__init__" in cls.__dict__:
+            cls.__init__ = profile_constructor(cls.__init__)
+
     @classmethod
     def set_failed_check(cls, check_id=None, arn=None):
         if check_id is not None and arn is not None:
@@ -62,10 +117,50 @@ class AWSService:
         # We cannot include this within an else because some services needs both the regional_clients
         # and a single client like S3
         self.region = provider.get_default_region(self.service)
-        self.client = self.session.client(self.service, self.region)
+        self.client = provider.get_client(self.service, self.region)
+
+        # Collections already fetched and the collection methods running
+        self._collected_attributes = set()
+        self._running_collectors = set()
+        self._collection_lock = threading.RLock()
+        # The threads of the pool read the collections while they are populated
+        self._collector_thread = threading.local()
 
         # Thread pool for __threading_call__
-        self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        self.thread_pool = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, initializer=self.__init_collector_thread__
+        )
+
+    def __init_collector_thread__(self):
+        self._collector_thread.active = True
+
+    def __collect__(self, collector: str):
+        """Run the collection method once, marking all the attributes it populates as collected"""
+        attributes = {
+            name
+            for service_class in type(self).__mro__
+            for name, value in vars(service_class).items()
+            if isinstance(value, ServiceCollection) and value.collector == collector
+        }
+        with self._collection_lock:
+            if (
+                collector in self._running_collectors
+                or attributes <= self._collected_attributes
+            ):
+                return
+            self._running_collectors.add(collector)
+            try:
+                profiler = get_profiler()
+                if profiler:
+                    with profiler.profile(
+                        "service", self.__class__.__name__, collector
+                    ):
+                        getattr(self, collector)()
+                else:
+                    getattr(self, collector)()
+            finally:
+                self._running_collectors.discard(collector)
+                self._collected_attributes.update(attributes)
 
     def __get_session__(self):
         return self.session
@@ -91,6 +186,16 @@ class AWSService:
                 f"{self.service.upper()} - Starting threads for '{call_name}' function to process {item_count} items..."
             )
 
+        profiler = get_profiler()
+        if profiler:
+            with profiler.profile(
+                "service", self.__class__.__name__, call.__name__
+            ) as record:
+                self.__run_in_thread_pool__(profiler.attribute_to(record, call), items)
+        else:
+            self.__run_in_thread_pool__(call, items)
+
+    def __run_in_thread_pool__(self, call, items):
         # Submit tasks to the thread pool
         futures = [self.thread_pool.submit(call, item) for item in items]
 
@@ -22,10 +22,10 @@ class acm_certificates_expiration_check(Check):
                     report.status = "FAIL"
                     if certificate.expiration_days < 0:
                         report.status_extended = f"ACM Certificate {certificate.id} for {certificate.name} has expired ({abs(certificate.expiration_days)} days ago)."
-                        report.check_metadata.Severity = "high"
+                        report.override_metadata(Severity="high")
                     else:
                         report.status_extended = f"ACM Certificate {certificate.id} for {certificate.name} is about to expire in {certificate.expiration_days} days."
-                        report.check_metadata.Severity = "medium"
+                        report.override_metadata(Severity="medium")
 
                     report.resource_id = certificate.id
                     report.resource_details = certificate.name
@@ -27,7 +27,7 @@ class documentdb_cluster_cloudwatch_log_export(Check):
                     or "profiler" in cluster.cloudwatch_logs
                 ):
                     report.status = "FAIL"
-                    report.check_metadata.Severity = "low"
+                    report.override_metadata(Severity="low")
                     report.status_extended = f"DocumentDB Cluster {cluster.id} is only shipping {' '.join(cluster.cloudwatch_logs)} to CloudWatch Logs. Recommended to ship both Audit and Profiler logs."
 
             findings.append(report)
@@ -28,12 +28,11 @@ class ec2_instance_port_kafka_exposed_to_internet(Check):
                             ):
                                 # The port is open, now check if the instance is in a public subnet with a public IP
                                 report.status = "FAIL"
-                                (
-                                    report.status_extended,
-                                    report.check_metadata.Severity,
-                                ) = get_instance_public_status(
+                                status_extended, severity = get_instance_public_status(
                                     vpc_client.vpc_subnets, instance, "Kafka"
                                 )
+                                report.status_extended = status_extended
+                                report.override_metadata(Severity=severity)
                                 is_open_port = True
                                 break
                         if is_open_port:
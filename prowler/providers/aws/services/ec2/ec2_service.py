@@ -7,51 +7,112 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.lib.service.service import AWSService, ServiceCollection
 
 
 ################## EC2
 class EC2(AWSService):
+    # Fetched the first time they are read, so only the collections of the audited checks are requested
+    instances = ServiceCollection("_collect_instances")
+    security_groups = ServiceCollection("_collect_security_groups")
+    regions_with_sgs = ServiceCollection("_collect_security_groups")
+    network_interfaces = ServiceCollection("_collect_security_groups")
+    network_acls = ServiceCollection("_collect_network_acls")
+    snapshots = ServiceCollection("_collect_snapshots")
+    volumes_with_snapshots = ServiceCollection("_collect_snapshots")
+    regions_with_snapshots = ServiceCollection("_collect_snapshots")
+    images = ServiceCollection("_collect_images")
+    volumes = ServiceCollection("_collect_volumes")
+    attributes_for_regions = ServiceCollection("_collect_attributes_for_regions")
+    ebs_encryption_by_default = ServiceCollection("_collect_ebs_encryption_by_default")
+    elastic_ips = ServiceCollection("_collect_elastic_ips")
+    ebs_block_public_access_snapshots_states = ServiceCollection(
+        "_collect_ebs_block_public_access_snapshots_states"
+    )
+    instance_metadata_defaults = ServiceCollection(
+        "_collect_instance_metadata_defaults"
+    )
+    launch_templates = ServiceCollection("_collect_launch_templates")
+    vpn_endpoints = ServiceCollection("_collect_vpn_endpoints")
+    transit_gateways = ServiceCollection("_collect_transit_gateways")
+
     def __init__(self, provider):
         # Call AWSService's __init__
         super().__init__(__class__.__name__, provider)
         self.account_arn_template = f"arn:{self.audited_partition}:ec2:{self.region}:{self.audited_account}:account"
+
+    def _collect_instances(self):
         self.instances = []
         self.__threading_call__(self._describe_instances)
         self.__threading_call__(self._get_instance_user_data, self.instances)
+
+    def _collect_security_groups(self):
+        # The network interfaces are added to their security groups
         self.security_groups = {}
         self.regions_with_sgs = []
         self.__threading_call__(self._describe_security_groups)
+        self.network_interfaces = {}
+        self.__threading_call__(self._describe_network_interfaces)
+
+    def _collect_network_acls(self):
         self.network_acls = {}
         self.__threading_call__(self._describe_network_acls)
+
+    def _collect_snapshots(self):
         self.snapshots = []
         self.volumes_with_snapshots = {}
         self.regions_with_snapshots = {}
         self.__threading_call__(self._describe_snapshots)
         self.__threading_call__(self._determine_public_snapshots, self.snapshots)
-        self.network_interfaces = {}
-        self.__threading_call__(self._describe_network_interfaces)
+
+    def _collect_images(self):
         self.images = []
         self.__threading_call__(self._describe_images)
+
+    def _collect_volumes(self):
         self.volumes = []
         self.__threading_call__(self._describe_volumes)
+
+    def _collect_attributes_for_regions(self):
+        # Fetch the resources before starting the threads
+        self.__collect__("_collect_instances")
+        self.__collect__("_collect_snapshots")
+        self.__collect__("_collect_volumes")
         self.attributes_for_regions = {}
         self.__threading_call__(self._get_resources_for_regions)
+
+    def _collect_ebs_encryption_by_default(self):
+        self.__collect__("_collect_attributes_for_regions")
         self.ebs_encryption_by_default = []
         self.__threading_call__(self._get_ebs_encryption_settings)
+
+    def _collect_elastic_ips(self):
         self.elastic_ips = []
         self.__threading_call__(self._describe_ec2_addresses)
+
+    def _collect_ebs_block_public_access_snapshots_states(self):
+        self.__collect__("_collect_attributes_for_regions")
         self.ebs_block_public_access_snapshots_states = []
         self.__threading_call__(self._get_snapshot_block_public_access_state)
+
+    def _collect_instance_metadata_defaults(self):
+        self.__collect__("_collect_attributes_for_regions")
         self.instance_metadata_defaults = []
         self.__threading_call__(self._get_instance_metadata_defaults)
+
+    def _collect_launch_templates(self):
+        self.__collect__("_collect_security_groups")
         self.launch_templates = []
         self.__threading_call__(self._describe_launch_templates)
         self.__threading_call__(
             self._describe_launch_template_versions, self.launch_templates
         )
+
+    def _collect_vpn_endpoints(self):
         self.vpn_endpoints = {}
         self.__threading_call__(self._describe_vpn_endpoints)
+
+    def _collect_transit_gateways(self):
         self.transit_gateways = {}
         self.__threading_call__(self._describe_transit_gateways)
 
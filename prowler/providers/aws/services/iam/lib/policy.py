@@ -1,7 +1,7 @@
 from ipaddress import ip_address, ip_network
 
 from prowler.lib.logger import logger
-from prowler.providers.aws.aws_provider import read_aws_regions_file
+from prowler.providers.aws.lib.regions.regions import get_aws_regions_index
 
 
 def is_policy_cross_account(policy: dict, audited_account: str) -> bool:
@@ -499,6 +499,6 @@ def is_valid_aws_service(service):
     Returns:
         bool: True if the service is valid, False otherwise.
     """
-    if service in read_aws_regions_file()["services"]:
+    if service in get_aws_regions_index().services:
         return True
     return False
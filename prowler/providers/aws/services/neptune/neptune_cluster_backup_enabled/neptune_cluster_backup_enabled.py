@@ -23,7 +23,7 @@ class neptune_cluster_backup_enabled(Check):
             else:
                 if cluster.backup_retention_period > 0:
                     report.status = "FAIL"
-                    report.check_metadata.Severity = "low"
+                    report.override_metadata(Severity="low")
                     report.status_extended = f"Neptune Cluster {cluster.name} has backup enabled with retention period {cluster.backup_retention_period} days. Recommended to increase the backup retention period to a minimum of 7 days."
 
             findings.append(report)
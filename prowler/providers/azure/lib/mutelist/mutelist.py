@@ -15,3 +15,16 @@ class AzureMutelist(Mutelist):
             finding.resource_name,
             unroll_dict(unroll_tags(finding.resource_tags)),
         )
+
+    def mute_findings(
+        self,
+        findings: list[Check_Report_Azure],
+    ) -> None:
+        self._mute_findings(
+            findings,
+            lambda finding: (
+                finding.subscription,
+                finding.location,
+                finding.resource_name,
+            ),
+        )
@@ -187,6 +187,8 @@ class Provider(ABC):
                         arguments.resource_arn,
                         audit_config,
                         fixer_config,
+                        arguments.record,
+                        arguments.replay,
                     )
                 elif "azure" in provider_class_name.lower():
                     provider_class(
@@ -16,3 +16,13 @@ class KubernetesMutelist(Mutelist):
             finding.resource_name,
             unroll_dict(unroll_tags(finding.resource_tags)),
         )
+
+    def mute_findings(
+        self,
+        findings: list[Check_Report_Kubernetes],
+        cluster: str,
+    ) -> None:
+        self._mute_findings(
+            findings,
+            lambda finding: (cluster, finding.namespace, finding.resource_name),
+        )
@@ -0,0 +1,114 @@
+import zipfile
+from datetime import datetime, timezone
+
+import pytest
+
+from prowler.lib.api_archive.api_archive import (
+    APIArchive,
+    APIArchiveResponseNotFound,
+    close_api_archive,
+    get_api_archive,
+    open_api_archive,
+)
+
+
+def generate_request(region: str = "eu-west-1", parameters: dict = {}) -> dict:
+    return {
+        "provider": "aws",
+        "service": "ec2",
+        "region": region,
+        "operation": "DescribeInstances",
+        "parameters": parameters,
+    }
+
+
+class TestAPIArchive:
+    def test_record_and_replay(self, tmp_path):
+        archive_path = f"{tmp_path}/scan.zip"
+        response = {
+            "Reservations": [],
+            "LaunchTime": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "UserData": b"\x00data",
+        }
+        archive = APIArchive(archive_path, "record")
+        archive.record(generate_request(), response)
+        archive.close()
+
+        archive = APIArchive(archive_path, "replay")
+        assert archive.replay(generate_request()) == response
+        assert archive.replay(generate_request()) is not archive.replay(
+            generate_request()
+        )
+        archive.close()
+
+    def test_record_stores_each_response_once(self, tmp_path):
+        archive_path = f"{tmp_path}/scan.zip"
+        archive = APIArchive(archive_path, "record")
+        archive.record(generate_request("eu-west-1"), {"Reservations": []})
+        archive.record(generate_request("us-east-1"), {"Reservations": []})
+        archive.record(generate_request("eu-west-2"), {"Reservations": [{}]})
+        archive.close()
+
+        with zipfile.ZipFile(archive_path) as zip_file:
+            objects = [
+                name for name in zip_file.namelist() if name.startswith("objects/")
+            ]
+        assert len(objects) == 2
+
+    def test_record_keeps_the_first_response(self, tmp_path):
+        archive_path = f"{tmp_path}/scan.zip"
+        archive = APIArchive(archive_path, "record")
+        archive.record(generate_request(), {"Reservations": []})
+        archive.record(generate_request(), {"Reservations": [{}]})
+        archive.close()
+
+        archive = APIArchive(archive_path, "replay")
+        assert archive.replay(generate_request()) == {"Reservations": []}
+
+    def test_record_not_serializable_response(self, tmp_path):
+        archive_path = f"{tmp_path}/scan.zip"
+        archive = APIArchive(archive_path, "record")
+        archive.record(generate_request(), {"Body": object()})
+        archive.close()
+
+        archive = APIArchive(archive_path, "replay")
+        with pytest.raises(APIArchiveResponseNotFound):
+            archive.replay(generate_request())
+
+    def test_replay_request_not_recorded(self, tmp_path):
+        archive_path = f"{tmp_path}/scan.zip"
+        archive = APIArchive(archive_path, "record")
+        archive.record(generate_request(), {"Reservations": []})
+        archive.close()
+
+        archive = APIArchive(archive_path, "replay")
+        with pytest.raises(APIArchiveResponseNotFound):
+            archive.replay(generate_request(parameters={"MaxResults": 5}))
+
+    def test_request_key_ignores_dates(self):
+        assert APIArchive.get_request_key(
+            generate_request(parameters={"StartTime": datetime(2024, 1, 1)})
+        ) == APIArchive.get_request_key(
+            generate_request(parameters={"StartTime": datetime(2024, 5, 1)})
+        )
+        assert APIArchive.get_request_key(
+            generate_request(parameters={"MaxResults": 5})
+        ) != APIArchive.get_request_key(generate_request(parameters={"MaxResults": 6}))
+
+    def test_invalid_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            APIArchive(f"{tmp_path}/scan.zip", "delete")
+
+    def test_open_api_archive(self, tmp_path):
+        first_archive = open_api_archive(f"{tmp_path}/first.zip", "record")
+        second_archive = open_api_archive(f"{tmp_path}/second.zip", "record")
+
+        assert get_api_archive() is second_archive
+        # The previous archive is closed with its index
+        with zipfile.ZipFile(first_archive.path) as zip_file:
+            assert "index.json" in zip_file.namelist()
+
+        close_api_archive()
+        assert get_api_archive() is None
+        with zipfile.ZipFile(second_archive.path) as zip_file:
+            assert "index.json" in zip_file.namelist()
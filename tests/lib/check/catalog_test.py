@@ -0,0 +1,124 @@
+import os
+
+import pytest
+from mock import patch
+
+from prowler.lib.check.catalog import (
+    CheckCatalog,
+    get_catalog_fingerprint,
+    get_loaded_check_catalog,
+    load_check_catalog,
+    unload_check_catalogs,
+)
+from prowler.lib.check.compliance_models import Compliance
+from prowler.lib.check.models import CheckMetadata
+from prowler.lib.check.utils import recover_checks_from_provider
+
+
+@pytest.fixture(autouse=True)
+def unload_catalogs():
+    yield
+    unload_check_catalogs()
+
+
+class TestCheckCatalog:
+    def test_load_check_catalog(self, tmp_path):
+        catalog = load_check_catalog("kubernetes", cache_directory=str(tmp_path))
+
+        assert get_loaded_check_catalog("kubernetes") is catalog
+        assert os.path.isfile(f"{tmp_path}/kubernetes_check_catalog.pickle")
+        assert catalog.fingerprint == get_catalog_fingerprint("kubernetes")
+        assert (
+            catalog.checks_metadata.keys()
+            == CheckMetadata.get_bulk("kubernetes").keys()
+        )
+        assert (
+            catalog.compliance_frameworks.keys()
+            == Compliance.get_bulk("kubernetes").keys()
+        )
+
+    def test_load_check_catalog_from_cache(self, tmp_path):
+        catalog = load_check_catalog("kubernetes", cache_directory=str(tmp_path))
+        unload_check_catalogs()
+
+        with patch(
+            "prowler.lib.check.catalog.build_check_catalog"
+        ) as build_check_catalog:
+            cached_catalog = load_check_catalog(
+                "kubernetes", cache_directory=str(tmp_path)
+            )
+            build_check_catalog.assert_not_called()
+
+        assert cached_catalog.checks == catalog.checks
+        assert cached_catalog.checks_metadata == catalog.checks_metadata
+
+    def test_load_check_catalog_outdated(self, tmp_path):
+        load_check_catalog("kubernetes", cache_directory=str(tmp_path))
+
+        with patch(
+            "prowler.lib.check.catalog.get_catalog_fingerprint",
+            return_value="new-fingerprint",
+        ):
+            catalog = load_check_catalog("kubernetes", cache_directory=str(tmp_path))
+
+        assert catalog.fingerprint == "new-fingerprint"
+        assert catalog.checks_metadata
+
+    def test_load_check_catalog_corrupted(self, tmp_path):
+        with open(f"{tmp_path}/kubernetes_check_catalog.pickle", "wb") as f:
+            f.write(b"not a catalog")
+
+        catalog = load_check_catalog("kubernetes", cache_directory=str(tmp_path))
+
+        assert catalog.fingerprint == get_catalog_fingerprint("kubernetes")
+        assert catalog.checks_metadata
+
+    def test_get_checks(self):
+        catalog = CheckCatalog(
+            provider="aws",
+            fingerprint="fingerprint",
+            checks=[
+                (
+                    "s3_bucket_public",
+                    "/prowler/providers/aws/services/s3/s3_bucket_public",
+                ),
+                (
+                    "s3_bucket_public_fixer",
+                    "/prowler/providers/aws/services/s3/s3_bucket_public",
+                ),
+                (
+                    "ec2_instance_public_ip",
+                    "/prowler/providers/aws/services/ec2/ec2_instance_public_ip",
+                ),
+            ],
+        )
+
+        assert [check for check, _ in catalog.get_checks()] == [
+            "s3_bucket_public",
+            "ec2_instance_public_ip",
+        ]
+        assert [check for check, _ in catalog.get_checks("s3", True)] == [
+            "s3_bucket_public",
+            "s3_bucket_public_fixer",
+        ]
+        assert catalog.get_checks("iam") == []
+
+    def test_recover_checks_from_provider_with_catalog(self, tmp_path):
+        catalog = load_check_catalog("kubernetes", cache_directory=str(tmp_path))
+
+        with patch("prowler.lib.check.utils.list_modules") as list_modules:
+            checks = recover_checks_from_provider("kubernetes")
+            list_modules.assert_not_called()
+
+        assert checks == catalog.get_checks()
+
+    def test_get_bulk_checks_metadata_is_a_copy(self, tmp_path):
+        catalog = load_check_catalog("kubernetes", cache_directory=str(tmp_path))
+        check_id = next(iter(catalog.checks_metadata))
+
+        bulk_checks_metadata = catalog.get_bulk_checks_metadata()
+        bulk_checks_metadata[check_id].Severity = "low"
+        bulk_checks_metadata[check_id].Compliance = ["compliance"]
+
+        assert bulk_checks_metadata[check_id] is not catalog.checks_metadata[check_id]
+        assert catalog.checks_metadata[check_id].Compliance is None
@@ -1,11 +1,15 @@
 import json
 import os
 import pathlib
+import sys
+import threading
+import time
 from importlib.machinery import FileFinder
 from logging import ERROR
 from pkgutil import ModuleInfo
 from unittest import mock
 
+import pytest
 from boto3 import client
 from mock import Mock, patch
 from moto import mock_aws
@@ -21,6 +25,7 @@ from prowler.lib.check.check import (
     parse_checks_from_file,
     parse_checks_from_folder,
     remove_custom_checks_module,
+    run_checks,
     update_audit_metadata,
 )
 from prowler.lib.check.models import load_check_metadata
@@ -29,6 +34,8 @@ from prowler.lib.check.utils import (
     recover_checks_from_provider,
     recover_checks_from_service,
 )
+from prowler.lib.profiling.profiling import disable_profiler, enable_profiler
+from prowler.lib.scan.checkpoint import ScanCheckpoint
 from prowler.providers.aws.aws_provider import AwsProvider
 from prowler.providers.aws.services.accessanalyzer.accessanalyzer_service import (
     Analyzer,
@@ -834,6 +841,32 @@ class TestCheck:
             )
             assert len(findings) == 1
 
+    def test_execute_profiled(self):
+        finding = Mock()
+        finding.status = "PASS"
+        check = Mock()
+        check.CheckID = "accessanalyzer_enabled"
+        check.execute = Mock(return_value=[finding])
+
+        profiler = enable_profiler()
+        try:
+            findings = execute(
+                check=check,
+                global_provider=set_mocked_aws_provider(
+                    expected_checks=["accessanalyzer_enabled"]
+                ),
+                custom_checks_metadata=None,
+                output_options=None,
+            )
+        finally:
+            disable_profiler()
+
+        assert findings == [finding]
+        assert (
+            profiler.get_record("check", "accessanalyzer_enabled", "execute").executions
+            == 1
+        )
+
     def test_execute_with_filtering_status(self):
         accessanalyzer_client = mock.MagicMock
         accessanalyzer_client.region = AWS_REGION_US_EAST_1
@@ -970,3 +1003,170 @@ class TestCheck:
             assert caplog.record_tuples == [
                 ("root", 40, f"Check '{checks[0]}' was not found for the AWS provider")
             ]
+
+    def test_execute_checks_findings_handler(self):
+        findings = [mock.MagicMock(), mock.MagicMock()]
+        checks = ["accessanalyzer_enabled", "accessanalyzer_enabled_without_findings"]
+
+        provider = mock.MagicMock()
+        provider.type = "aws"
+
+        output_options = mock.MagicMock()
+        output_options.only_logs = True
+        output_options.verbose = False
+
+        handled_findings = []
+        with patch("prowler.lib.check.check.import_check"), patch(
+            "prowler.lib.check.check.execute", return_value=findings
+        ), patch("prowler.lib.check.check.report"):
+            assert (
+                execute_checks(
+                    checks,
+                    provider,
+                    custom_checks_metadata=None,
+                    config_file=None,
+                    output_options=output_options,
+                    findings_handler=handled_findings.append,
+                )
+                == []
+            )
+
+        assert handled_findings == [findings, findings]
+        assert provider.audit_metadata.completed_checks == 2
+
+    def test_execute_checks_resume_from_checkpoint(self, tmp_path):
+        checks = ["accessanalyzer_enabled", "ec2_instance_public_ip"]
+        provider = mock.MagicMock()
+        provider.type = "aws"
+
+        output_options = mock.MagicMock()
+        output_options.only_logs = True
+        output_options.verbose = False
+
+        # The scan was interrupted after the first check
+        checkpoint = ScanCheckpoint.create("aws", checkpoints_directory=str(tmp_path))
+        checkpoint.save("accessanalyzer_enabled", ["restored-finding"])
+
+        with patch("prowler.lib.check.check.import_check"), patch(
+            "prowler.lib.check.check.execute", return_value=["new-finding"]
+        ) as execute_mock, patch("prowler.lib.check.check.report") as report_mock:
+            findings = execute_checks(
+                checks,
+                provider,
+                custom_checks_metadata=None,
+                config_file=None,
+                output_options=output_options,
+                checkpoint=checkpoint,
+            )
+
+        assert findings == ["restored-finding", "new-finding"]
+        execute_mock.assert_called_once()
+        report_mock.assert_called_once()
+        assert provider.audit_metadata.completed_checks == 2
+        assert ScanCheckpoint.load(
+            checkpoint.scan_id, str(tmp_path)
+        ).completed_checks == set(checks)
+
+    def test_run_checks_sequential(self):
+        checks = ["s3_bucket_public", "ec2_instance_public_ip", "iam_root_mfa"]
+
+        results = list(run_checks(checks, lambda check_name: check_name.upper()))
+
+        assert results == [
+            ("s3_bucket_public", "S3_BUCKET_PUBLIC", None),
+            ("ec2_instance_public_ip", "EC2_INSTANCE_PUBLIC_IP", None),
+            ("iam_root_mfa", "IAM_ROOT_MFA", None),
+        ]
+
+    def test_run_checks_parallel_keeps_order(self):
+        checks = [
+            "s3_bucket_public",
+            "ec2_instance_public_ip",
+            "s3_bucket_versioning",
+            "iam_root_mfa",
+        ]
+
+        def run_check(check_name):
+            # Make the first checks the slowest ones
+            time.sleep(0.05 if check_name.startswith("s3") else 0)
+            return check_name
+
+        results = list(run_checks(checks, run_check, parallel_checks=4))
+
+        assert [check_name for check_name, _, _ in results] == checks
+        assert [result for _, result, _ in results] == checks
+
+    def test_run_checks_parallel_groups_by_service(self):
+        checks = [
+            "ec2_instance_public_ip",
+            "s3_bucket_public",
+            "ec2_securitygroup_default_restrict_traffic",
+            "s3_bucket_versioning",
+        ]
+
+        results = list(
+            run_checks(
+                checks,
+                lambda _: threading.current_thread().name,
+                parallel_checks=2,
+            )
+        )
+
+        threads = {check_name: thread for check_name, thread, _ in results}
+        assert (
+            threads["ec2_instance_public_ip"]
+            == threads["ec2_securitygroup_default_restrict_traffic"]
+        )
+        assert threads["s3_bucket_public"] == threads["s3_bucket_versioning"]
+        assert threading.current_thread().name not in threads.values()
+
+    def test_run_checks_parallel_error(self):
+        checks = ["ec2_instance_public_ip", "s3_bucket_public"]
+        error = ModuleNotFoundError()
+
+        def run_check(check_name):
+            if check_name == "s3_bucket_public":
+                raise error
+            return check_name
+
+        results = list(run_checks(checks, run_check, parallel_checks=2))
+
+        assert results == [
+            ("ec2_instance_public_ip", "ec2_instance_public_ip", None),
+            ("s3_bucket_public", None, error),
+        ]
+
+    def test_run_checks_parallel_system_exit(self):
+        checks = ["ec2_instance_public_ip", "s3_bucket_public"]
+
+        def run_check(check_name):
+            if check_name == "s3_bucket_public":
+                sys.exit(1)
+            return check_name
+
+        results = run_checks(checks, run_check, parallel_checks=2)
+
+        assert next(results) == (
+            "ec2_instance_public_ip",
+            "ec2_instance_public_ip",
+            None,
+        )
+        with pytest.raises(SystemExit):
+            next(results)
+
+    def test_run_checks_parallel_stop(self):
+        checks = [f"s3_check_{index}" for index in range(20)]
+        executed_checks = []
+
+        def run_check(check_name):
+            time.sleep(0.01)
+            executed_checks.append(check_name)
+            return check_name
+
+        results = run_checks(checks, run_check, parallel_checks=2)
+        assert next(results)[0] == "s3_check_0"
+        # Stopping the consumer does not wait for the remaining checks
+        results.close()
+        time.sleep(0.1)
+
+        assert len(executed_checks) < len(checks)
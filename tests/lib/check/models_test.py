@@ -1,6 +1,52 @@
 from unittest import mock
 
-from prowler.lib.check.models import CheckMetadata
+import pytest
+from pydantic import ValidationError
+
+from prowler.lib.check.models import Check, Check_Report_AWS, CheckMetadata
+
+mock_metadata = CheckMetadata(
+    Provider="aws",
+    CheckID="accessanalyzer_enabled",
+    CheckTitle="Check 1",
+    CheckType=["type1"],
+    ServiceName="service1",
+    SubServiceName="subservice1",
+    ResourceIdTemplate="template1",
+    Severity="high",
+    ResourceType="resource1",
+    Description="Description 1",
+    Risk="risk1",
+    RelatedUrl="url1",
+    Remediation={
+        "Code": {
+            "CLI": "cli1",
+            "NativeIaC": "native1",
+            "Other": "other1",
+            "Terraform": "terraform1",
+        },
+        "Recommendation": {"Text": "text1", "Url": "url1"},
+    },
+    Categories=["categoryone"],
+    DependsOn=["dependency1"],
+    RelatedTo=["related1"],
+    Notes="notes1",
+    Compliance=[],
+)
+
+
+class accessanalyzer_enabled(Check):
+    def execute(self):
+        return [Check_Report_AWS(self.metadata()) for _ in range(2)]
+
+
+@pytest.fixture
+def check():
+    with mock.patch(
+        "prowler.lib.check.models.CheckMetadata.parse_file",
+        return_value=mock_metadata,
+    ):
+        yield accessanalyzer_enabled()
 
 
 class TestCheckMetada:
@@ -54,3 +100,49 @@ class TestCheckMetada:
         mock_load_metadata.assert_called_once_with(
             "/path/to/accessanalyzer_enabled/accessanalyzer_enabled.metadata.json"
         )
+
+
+class TestCheck:
+    def test_metadata_is_shared(self, check):
+        metadata = check.metadata()
+
+        assert check.metadata() is metadata
+        assert metadata.CheckID == "accessanalyzer_enabled"
+        assert metadata.Severity == "high"
+
+    def test_check_report_shares_metadata(self, check):
+        findings = check.execute()
+
+        assert findings[0].check_metadata is check.metadata()
+        assert findings[1].check_metadata is check.metadata()
+
+    def test_check_report_from_json(self):
+        finding = Check_Report_AWS(mock_metadata.json())
+
+        assert finding.check_metadata == mock_metadata
+        assert finding.check_metadata is not mock_metadata
+
+    def test_override_metadata(self, check):
+        finding, sibling_finding = check.execute()
+
+        finding.override_metadata(Severity="LOW")
+
+        assert finding.check_metadata.Severity == "low"
+        assert finding.check_metadata.CheckID == "accessanalyzer_enabled"
+        assert check.metadata().Severity == "high"
+        assert sibling_finding.check_metadata.Severity == "high"
+        assert sibling_finding.check_metadata is check.metadata()
+
+    def test_override_metadata_invalid_severity(self, check):
+        finding = check.execute()[0]
+
+        with pytest.raises(ValidationError):
+            finding.override_metadata(Severity="urgent")
+        assert finding.check_metadata.Severity == "high"
+
+    def test_shared_metadata_is_read_only(self, check):
+        finding = check.execute()[0]
+
+        with pytest.raises(TypeError):
+            finding.check_metadata.Severity = "low"
+        assert check.metadata().Severity == "high"
@@ -0,0 +1,88 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Bounds of the CLI startup, well above the current values to not fail in slow machines
+# or when the tests run in parallel, the number of modules is the deterministic bound
+MAX_IMPORT_TIME = 10
+MAX_IMPORTED_MODULES = 700
+
+PROVIDER_SDKS = {
+    "aws": {"boto3", "botocore"},
+    "azure": {"azure", "msgraph", "msal"},
+    "gcp": {"googleapiclient"},
+    "kubernetes": {"kubernetes"},
+}
+FEATURE_PACKAGES = {
+    "alive_progress",
+    "detect_secrets",
+    "py_ocsf_models",
+    "slack_sdk",
+    "tabulate",
+}
+
+# Imports the CLI and runs it in a clean interpreter, printing the modules imported
+CLI_IMPORTS_SCRIPT = """
+import json
+import sys
+import time
+
+start_time = time.perf_counter()
+from prowler.__main__ import prowler
+
+import_time = time.perf_counter() - start_time
+sys.argv = ["prowler"] + sys.argv[1:]
+if len(sys.argv) > 1:
+    try:
+        prowler()
+    except SystemExit:
+        pass
+print(json.dumps({"import_time": import_time, "modules": sorted(sys.modules)}))
+"""
+
+
+def get_cli_imports(*arguments, cache_directory: str = None) -> dict:
+    environment = dict(os.environ)
+    if cache_directory:
+        environment["PROWLER_CACHE_DIR"] = cache_directory
+    process = subprocess.run(
+        [sys.executable, "-c", CLI_IMPORTS_SCRIPT, *arguments],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env=environment,
+    )
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+def get_imported_packages(modules: list) -> set:
+    return {module.split(".")[0] for module in modules}
+
+
+class Test_CLI_Imports:
+    def test_import_cli(self):
+        cli_imports = get_cli_imports()
+        imported_packages = get_imported_packages(cli_imports["modules"])
+
+        assert cli_imports["import_time"] < MAX_IMPORT_TIME
+        assert len(cli_imports["modules"]) < MAX_IMPORTED_MODULES
+        for sdk_packages in PROVIDER_SDKS.values():
+            assert not sdk_packages & imported_packages
+        assert not FEATURE_PACKAGES & imported_packages
+
+    @pytest.mark.parametrize("provider", PROVIDER_SDKS.keys())
+    def test_list_checks_only_imports_the_provider(self, provider, tmp_path):
+        arguments = (provider, "--list-checks", "--no-banner")
+        # The first execution builds the check catalog, which imports the check packages
+        get_cli_imports(*arguments, cache_directory=str(tmp_path))
+        cli_imports = get_cli_imports(*arguments, cache_directory=str(tmp_path))
+        imported_packages = get_imported_packages(cli_imports["modules"])
+
+        assert len(cli_imports["modules"]) < MAX_IMPORTED_MODULES
+        for sdk_provider, sdk_packages in PROVIDER_SDKS.items():
+            if sdk_provider != provider:
+                assert not sdk_packages & imported_packages
+        assert not FEATURE_PACKAGES & imported_packages
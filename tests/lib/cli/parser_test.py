@@ -1,5 +1,6 @@
 import uuid
 from argparse import ArgumentTypeError
+from zipfile import ZipFile
 
 import pytest
 from mock import patch
@@ -365,6 +366,16 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.unix_timestamp
 
+    def test_root_parser_stream_outputs(self):
+        command = [prowler_command, "--stream-outputs"]
+        parsed = self.parser.parse(command)
+        assert parsed.stream_outputs
+
+    def test_root_parser_stream_outputs_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert not parsed.stream_outputs
+
     def test_logging_parser_only_logs_set(self):
         command = [prowler_command, "--only-logs"]
         parsed = self.parser.parse(command)
@@ -537,6 +548,56 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.checks_folder == filename
 
+    def test_checks_parser_parallel_checks(self):
+        argument = "--parallel-checks"
+        workers = "8"
+        command = [prowler_command, argument, workers]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == 8
+
+    def test_checks_parser_parallel_checks_negative(self, capsys):
+        command = [prowler_command, "--parallel-checks", "-1"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_checks_parser_parallel_checks_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == 0
+
+    def test_checks_parser_resume(self):
+        scan_id = str(uuid.uuid4())
+        command = [prowler_command, "--resume", scan_id]
+        with patch("prowler.lib.cli.parser.is_valid_scan_id", return_value=True):
+            parsed = self.parser.parse(command)
+        assert parsed.resume == scan_id
+
+    def test_checks_parser_resume_not_found(self):
+        command = [prowler_command, "--resume", str(uuid.uuid4())]
+        with patch(
+            "prowler.lib.cli.parser.is_valid_scan_id", return_value=False
+        ), pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_checks_parser_resume_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.resume is None
+
+    def test_outputs_parser_profile_report(self):
+        command = [prowler_command, "--profile-report", "profile.csv"]
+        parsed = self.parser.parse(command)
+        assert parsed.profile_report == "profile.csv"
+
+    def test_outputs_parser_profile_report_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.profile_report is None
+
     def test_checks_parser_services_short(self):
         argument = "-s"
         service_1 = "iam"
@@ -1084,6 +1145,52 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.fixer
 
+    def test_aws_parser_stream_outputs_with_fixer(self):
+        command = [prowler_command, "--stream-outputs", "--fixer"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_aws_parser_stream_outputs_with_security_hub(self):
+        command = [prowler_command, "--stream-outputs", "--security-hub"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_aws_parser_record(self):
+        command = [prowler_command, "--record", "scan.zip"]
+        parsed = self.parser.parse(command)
+        assert parsed.record == "scan.zip"
+        assert not parsed.replay
+
+    def test_aws_parser_replay(self, tmp_path):
+        archive_path = f"{tmp_path}/scan.zip"
+        with ZipFile(archive_path, "w") as archive:
+            archive.writestr("index.json", "{}")
+        command = [prowler_command, "--replay", archive_path]
+        parsed = self.parser.parse(command)
+        assert parsed.replay == archive_path
+        assert not parsed.record
+
+    def test_aws_parser_replay_not_an_archive(self, tmp_path):
+        command = [prowler_command, "--replay", f"{tmp_path}/scan.zip"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_aws_parser_record_and_replay(self, tmp_path):
+        archive_path = f"{tmp_path}/scan.zip"
+        with ZipFile(archive_path, "w") as archive:
+            archive.writestr("index.json", "{}")
+        command = [prowler_command, "--record", "new.zip", "--replay", archive_path]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
     def test_aws_parser_config_file(self):
         argument = "--config-file"
         config_file = "./test-config.yaml"
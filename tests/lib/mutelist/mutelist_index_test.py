@@ -0,0 +1,199 @@
+from random import Random
+
+from prowler.lib.mutelist.index import ItemMatcher, MutelistIndex
+from prowler.lib.mutelist.mutelist import Mutelist
+
+AUDITED_ACCOUNT = "123456789012"
+
+CHECKS = [
+    "ec2_instance_public_ip",
+    "ec2_instance_imdsv2_enabled",
+    "ec2_securitygroup_allow_ingress_from_internet_to_all_ports",
+    "s3_bucket_public_access",
+    "s3_bucket_level_public_access_block",
+    "awslambda_function_url_public",
+    "iam_role_administratoraccess_policy",
+]
+CHECK_KEYS = CHECKS + [
+    "*",
+    "ec2_*",
+    "s3_bucket_public",
+    "instance",
+    "lambda_function_url_public",
+    ".*public.*",
+    "iam_(role|user)_.*",
+    "[invalid",
+]
+REGIONS = ["us-east-1", "eu-west-1", "eu-west-2", ""]
+REGION_ITEMS = ["*", "us-east-1", "eu-west-.*", "eu-west-1", "ap-.*"]
+RESOURCES = ["i-123", "i-456", "bucket-prod", "bucket-dev", "role/admin", ""]
+RESOURCE_ITEMS = ["*", "i-123", "bucket-.*", "prod", "role/.*", "(invalid"]
+TAGS = ["", "environment=dev", "environment=prod | team=security", "team=security"]
+TAG_ITEMS = ["environment=dev", "team=security", "environment=prod|team=ops"]
+
+
+class MutelistForTest(Mutelist):
+    def is_finding_muted(self) -> bool:
+        return False
+
+
+def is_muted_without_index(mutelist: Mutelist, *finding) -> bool:
+    """Evaluate every account of the mutelist, as is_muted did before the index"""
+    for account, account_info in mutelist.mutelist["Accounts"].items():
+        if account == finding[0] or account == "*":
+            if mutelist.is_muted_in_check(account_info["Checks"], *finding):
+                return True
+    return False
+
+
+def generate_mutelist(random: Random) -> dict:
+    accounts = {}
+    for account in random.sample([AUDITED_ACCOUNT, "*", "999999999999"], 2):
+        checks = {}
+        for check_key in random.sample(CHECK_KEYS, 5):
+            check_info = {
+                "Regions": random.sample(REGION_ITEMS, random.randint(1, 2)),
+                "Resources": random.sample(RESOURCE_ITEMS, random.randint(1, 2)),
+            }
+            if random.random() < 0.5:
+                check_info["Tags"] = random.sample(TAG_ITEMS, random.randint(0, 2))
+            if random.random() < 0.5:
+                check_info["Exceptions"] = {
+                    key: random.sample(items, random.randint(0, 2))
+                    for key, items in (
+                        ("Accounts", [AUDITED_ACCOUNT, "999999999999"]),
+                        ("Regions", REGION_ITEMS),
+                        ("Resources", RESOURCE_ITEMS),
+                        ("Tags", TAG_ITEMS),
+                    )
+                    if random.random() < 0.5
+                }
+            checks[check_key] = check_info
+        accounts[account] = {"Checks": checks}
+    return {"Accounts": accounts}
+
+
+class Test_MutelistIndex:
+    def test_is_muted_same_as_without_index(self):
+        random = Random(0)
+        for _ in range(200):
+            mutelist = MutelistForTest(mutelist_content=generate_mutelist(random))
+            for _ in range(50):
+                finding = (
+                    random.choice([AUDITED_ACCOUNT, "999999999999"]),
+                    random.choice(CHECKS),
+                    random.choice(REGIONS),
+                    random.choice(RESOURCES),
+                    random.choice(TAGS),
+                )
+                assert mutelist.is_muted(*finding) == is_muted_without_index(
+                    mutelist, *finding
+                ), (mutelist.mutelist, finding)
+
+    def test_exception_stops_the_next_entries(self):
+        mutelist = MutelistForTest(
+            mutelist_content={
+                "Accounts": {
+                    "*": {
+                        "Checks": {
+                            "ec2_*": {
+                                "Regions": ["*"],
+                                "Resources": ["*"],
+                                "Exceptions": {"Resources": ["i-123"]},
+                            },
+                            "ec2_instance_public_ip": {
+                                "Regions": ["*"],
+                                "Resources": ["*"],
+                            },
+                        }
+                    }
+                }
+            }
+        )
+
+        assert not mutelist.is_muted(
+            AUDITED_ACCOUNT, "ec2_instance_public_ip", "us-east-1", "i-123", ""
+        )
+        assert mutelist.is_muted(
+            AUDITED_ACCOUNT, "ec2_instance_public_ip", "us-east-1", "i-456", ""
+        )
+
+    def test_get_check_entries(self):
+        index = MutelistIndex(
+            {
+                "Accounts": {
+                    "*": {
+                        "Checks": {
+                            "s3_bucket_public_access": {
+                                "Regions": ["*"],
+                                "Resources": ["*"],
+                            },
+                            "lambda_*": {"Regions": ["*"], "Resources": ["*"]},
+                            "public_access": {"Regions": ["*"], "Resources": ["*"]},
+                        }
+                    }
+                }
+            }
+        )
+
+        # The check names match the checks that contain them
+        assert [
+            entry.check_key
+            for entry in index.get_check_entries("*", "s3_bucket_public_access")
+        ] == ["s3_bucket_public_access", "public_access"]
+        assert [
+            entry.check_key
+            for entry in index.get_check_entries(
+                "*", "s3_bucket_level_public_access_block"
+            )
+        ] == ["public_access"]
+        assert [
+            entry.check_key
+            for entry in index.get_check_entries("*", "awslambda_function_url_public")
+        ] == ["awslambda_*"]
+        assert index.get_check_entries("123456789012", "s3_bucket_public_access") == []
+
+    def test_get_index_compiled_again_when_mutelist_replaced(self):
+        mutelist = MutelistForTest(
+            mutelist_content={
+                "Accounts": {
+                    "*": {"Checks": {"*": {"Regions": ["*"], "Resources": ["*"]}}}
+                }
+            }
+        )
+        index = mutelist.get_index()
+
+        assert mutelist.get_index() is index
+        mutelist._mutelist = {}
+        assert mutelist.get_index() is not index
+        assert not mutelist.is_muted(AUDITED_ACCOUNT, "check", "region", "id", "")
+
+
+class Test_ItemMatcher:
+    def test_match_any_item(self):
+        matcher = ItemMatcher(["eu-west-.*", "*-east-1"])
+
+        assert matcher.match("eu-west-1")
+        assert matcher.match("us-east-1")
+        assert not matcher.match("ap-south-1")
+        assert not matcher.match(None)
+
+    def test_match_all_tags(self):
+        matcher = ItemMatcher(["environment=dev", "team=security|team=ops"], tag=True)
+
+        assert matcher.match("environment=dev | team=ops")
+        assert not matcher.match("environment=dev")
+
+    def test_match_empty(self):
+        assert not ItemMatcher([]).match("eu-west-1")
+        assert not ItemMatcher(None, tag=True).match("")
+
+    def test_match_invalid_item(self):
+        # The items before the invalid one are still matched, as when searching them in order
+        matcher = ItemMatcher(["i-123", "[invalid", "i-456"])
+
+        assert matcher.match("i-123")
+        assert not matcher.match("i-456")
+        assert not ItemMatcher(["environment=dev", "[invalid"], tag=True).match(
+            "environment=dev"
+        )
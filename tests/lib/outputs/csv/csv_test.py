@@ -118,6 +118,26 @@ class TestCSV:
 
         assert content == expected_csv
 
+    def test_batch_write_data_to_file_in_batches(self):
+        mock_file = StringIO()
+
+        output = CSV([generate_finding_output(resource_uid="resource-1")])
+        output._file_descriptor = mock_file
+        output.batch_write_data_to_file(close_file=False)
+        output.add_findings([generate_finding_output(resource_uid="resource-2")])
+        output.batch_write_data_to_file(close_file=False)
+
+        mock_file.seek(0)
+        rows = mock_file.read().splitlines()
+        assert len(rows) == 3
+        assert rows[0].startswith("AUTH_METHOD;")
+        assert ";resource-1;" in rows[1]
+        assert ";resource-2;" in rows[2]
+        assert len(output.data) == 1
+
+        output.close_file_descriptor()
+        assert mock_file.closed
+
     def test_batch_write_data_to_file_without_findings(self):
         assert not hasattr(CSV([]), "_file_descriptor")
 
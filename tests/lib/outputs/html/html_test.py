@@ -491,6 +491,29 @@ class TestHTML:
         args = sys.argv[1:]
         assert content == get_aws_html_header(args) + pass_html_finding + html_footer
 
+    def test_write_spooled_data_to_file(self):
+        mock_file = StringIO()
+        output = HTML([generate_finding_output()])
+        output._file_descriptor = mock_file
+        output.spool_data()
+        output.add_findings([generate_finding_output()])
+        output.spool_data()
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+
+        with patch.object(mock_file, "close", return_value=None):
+            output.write_spooled_data_to_file(provider, html_stats)
+
+        mock_file.seek(0)
+        content = mock_file.read()
+        args = sys.argv[1:]
+        assert (
+            content
+            == get_aws_html_header(args)
+            + pass_html_finding
+            + pass_html_finding
+            + html_footer
+        )
+
     def test_batch_write_data_to_file_without_findings(self):
         assert not hasattr(HTML([]), "_file_descriptor")
 
@@ -189,6 +189,25 @@ class TestOCSF:
 
         assert json.loads(content) == expected_json_output
 
+    def test_batch_write_data_to_file_in_batches(self):
+        mock_file = StringIO()
+
+        output = OCSF([generate_finding_output(resource_uid="resource-1")])
+        output._file_descriptor = mock_file
+        output.batch_write_data_to_file(close_file=False)
+        output.add_findings([generate_finding_output(resource_uid="resource-2")])
+        output.batch_write_data_to_file(close_file=False)
+
+        with patch.object(mock_file, "close", return_value=None):
+            output.close_file_descriptor()
+
+        mock_file.seek(0)
+        content = json.loads(mock_file.read())
+        assert [finding["resources"][0]["uid"] for finding in content] == [
+            "resource-1",
+            "resource-2",
+        ]
+
     def test_batch_write_data_to_file_without_findings(self):
         assert not hasattr(OCSF([]), "_file_descriptor")
 
@@ -7,6 +7,7 @@ from mock import MagicMock
 from prowler.config.config import orange_color
 from prowler.lib.outputs.outputs import (
     extract_findings_statistics,
+    remove_output_files,
     report,
     set_report_color,
 )
@@ -21,6 +22,24 @@ from prowler.lib.outputs.utils import (
 
 
 class TestOutputs:
+    def test_remove_output_files(self, tmp_path):
+        (tmp_path / "compliance").mkdir()
+        output_files = [
+            tmp_path / "prowler-output.csv",
+            tmp_path / "prowler-output.ocsf.json",
+            tmp_path / "compliance" / "prowler-output_cis_2.0_aws.csv",
+        ]
+        other_files = [
+            tmp_path / "other-output.csv",
+            tmp_path / "compliance" / "other-output_cis_2.0_aws.csv",
+        ]
+        for file in output_files + other_files:
+            file.write_text("content")
+
+        remove_output_files(str(tmp_path), "prowler-output")
+
+        assert not any(file.exists() for file in output_files)
+        assert all(file.exists() for file in other_files)
 
     def test_set_report_color(self):
         test_status = ["PASS", "FAIL", "MANUAL"]
@@ -0,0 +1,122 @@
+import json
+from unittest import mock
+
+from mock import patch
+
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.lib.outputs.outputs import extract_findings_statistics
+from prowler.lib.outputs.streaming import FindingSummary, StreamingOutputs
+from tests.lib.outputs.compliance.fixtures import NIST_800_53_REVISION_4_AWS
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+
+
+def generate_check_finding(status: str, resource_id: str):
+    finding = mock.MagicMock()
+    finding.status = status
+    finding.muted = False
+    finding.resource_id = resource_id
+    finding.check_metadata.Severity = "high"
+    return finding
+
+
+def generate_output(provider, finding, output_options):
+    return generate_finding_output(
+        status=finding.status,
+        resource_uid=finding.resource_id,
+        compliance={"NIST-800-53-Revision-4": "ac_2_4"},
+    )
+
+
+@patch(
+    "prowler.lib.outputs.streaming.Finding.generate_output",
+    new=generate_output,
+)
+class TestStreamingOutputs:
+    def get_streaming_outputs(self, tmp_path):
+        provider = mock.MagicMock()
+        provider.type = "aws"
+        output_options = mock.MagicMock()
+        output_options.output_directory = str(tmp_path)
+        output_options.output_filename = "prowler-output"
+        (tmp_path / "compliance").mkdir()
+        return StreamingOutputs(
+            provider,
+            output_options,
+            ["csv", "json-ocsf"],
+            {"nist_800_53_revision_4_aws": NIST_800_53_REVISION_4_AWS},
+        )
+
+    def test_write_in_batches(self, tmp_path):
+        streaming_outputs = self.get_streaming_outputs(tmp_path)
+
+        streaming_outputs.write([generate_check_finding("PASS", "resource-1")])
+        streaming_outputs.write([])
+        streaming_outputs.write(
+            [
+                generate_check_finding("FAIL", "resource-2"),
+                generate_check_finding("FAIL", "resource-3"),
+            ]
+        )
+        stats = extract_findings_statistics(streaming_outputs.findings)
+        streaming_outputs.close(stats)
+
+        assert [finding.resource_id for finding in streaming_outputs.findings] == [
+            "resource-1",
+            "resource-2",
+            "resource-3",
+        ]
+        assert all(
+            isinstance(finding, FindingSummary)
+            for finding in streaming_outputs.findings
+        )
+        assert stats["total_pass"] == 1
+        assert stats["total_fail"] == 2
+        assert stats["resources_count"] == 3
+
+        assert [
+            output.__class__
+            for output in streaming_outputs.generated_outputs["regular"]
+        ] == [CSV, OCSF]
+        assert [
+            output.__class__
+            for output in streaming_outputs.generated_outputs["compliance"]
+        ] == [GenericCompliance]
+        for output_type in streaming_outputs.generated_outputs.values():
+            for output in output_type:
+                assert output.file_descriptor.closed
+
+        with open(f"{tmp_path}/prowler-output.csv") as f:
+            rows = f.read().splitlines()
+        assert len(rows) == 4
+        assert rows[0].startswith("AUTH_METHOD;")
+
+        with open(f"{tmp_path}/prowler-output.ocsf.json") as f:
+            ocsf_findings = json.load(f)
+        assert [finding["status_code"] for finding in ocsf_findings] == [
+            "PASS",
+            "FAIL",
+            "FAIL",
+        ]
+
+        with open(
+            f"{tmp_path}/compliance/prowler-output_nist_800_53_revision_4_aws.csv"
+        ) as f:
+            compliance_rows = f.read().splitlines()
+        # Header, one row per finding and the manual requirement just once
+        assert len(compliance_rows) == 5
+        assert sum("manual_check" in row for row in compliance_rows) == 1
+
+    def test_write_without_findings(self, tmp_path):
+        streaming_outputs = self.get_streaming_outputs(tmp_path)
+
+        streaming_outputs.write([])
+        streaming_outputs.close(extract_findings_statistics([]))
+
+        assert streaming_outputs.findings == []
+        assert streaming_outputs.generated_outputs == {
+            "regular": [],
+            "compliance": [],
+        }
+        assert list(tmp_path.glob("prowler-output*")) == []
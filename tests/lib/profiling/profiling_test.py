@@ -0,0 +1,132 @@
+import csv
+import json
+import threading
+
+import pytest
+
+from prowler.lib.profiling.profiling import (
+    Profiler,
+    disable_profiler,
+    enable_profiler,
+    get_profiler,
+    profile_constructor,
+)
+
+
+@pytest.fixture
+def profiler():
+    yield enable_profiler()
+    disable_profiler()
+
+
+class TestProfiler:
+    def test_profile(self):
+        profiler = Profiler()
+
+        with profiler.profile("check", "s3_bucket_public", "execute"):
+            profiler.add_api_call("s3", "ListBuckets", retries=2)
+            with profiler.profile("service", "S3", "_get_bucket_policy"):
+                profiler.add_api_call("s3", "GetBucketPolicy")
+                profiler.add_throttle("s3", "GetBucketPolicy")
+            profiler.add_api_call("s3", "ListBuckets")
+        with profiler.profile("check", "s3_bucket_public", "execute"):
+            pass
+
+        check_record = profiler.get_record("check", "s3_bucket_public", "execute")
+        service_record = profiler.get_record("service", "S3", "_get_bucket_policy")
+        assert check_record.executions == 2
+        assert check_record.api_calls == 2
+        assert check_record.retries == 2
+        assert check_record.throttles == 0
+        assert check_record.duration >= service_record.duration
+        assert service_record.executions == 1
+        assert service_record.api_calls == 1
+        assert service_record.throttles == 1
+        assert check_record.memory_delta >= 0
+
+    def test_api_calls_outside_of_stages(self):
+        profiler = Profiler()
+
+        profiler.add_api_call("sts", "GetCallerIdentity")
+
+        assert profiler.get_record("api", "sts", "GetCallerIdentity").api_calls == 1
+
+    def test_attribute_to(self):
+        profiler = Profiler()
+
+        with profiler.profile("service", "EC2", "_describe_instances") as record:
+            thread = threading.Thread(
+                target=profiler.attribute_to(
+                    record, lambda: profiler.add_api_call("ec2", "DescribeInstances")
+                )
+            )
+            thread.start()
+            thread.join()
+
+        assert record.api_calls == 1
+        assert profiler.get_record("api", "ec2", "DescribeInstances").api_calls == 0
+
+    def test_write_report_json(self, tmp_path):
+        profiler = Profiler()
+        with profiler.profile("check", "s3_bucket_public", "execute"):
+            profiler.add_api_call("s3", "ListBuckets")
+
+        profiler.write_report(f"{tmp_path}/profile.json")
+
+        with open(f"{tmp_path}/profile.json") as report_file:
+            report = json.load(report_file)
+        assert len(report) == 1
+        assert report[0]["kind"] == "check"
+        assert report[0]["name"] == "s3_bucket_public"
+        assert report[0]["api_calls"] == 1
+
+    def test_write_report_csv(self, tmp_path):
+        profiler = Profiler()
+        with profiler.profile("check", "s3_bucket_public", "execute"):
+            pass
+        profiler.add_api_call("sts", "GetCallerIdentity")
+
+        profiler.write_report(f"{tmp_path}/profile.csv")
+
+        with open(f"{tmp_path}/profile.csv") as report_file:
+            rows = list(csv.DictReader(report_file))
+        assert [(row["kind"], row["name"], row["stage"]) for row in rows] == [
+            ("api", "sts", "GetCallerIdentity"),
+            ("check", "s3_bucket_public", "execute"),
+        ]
+
+    def test_display_summary(self, capsys):
+        profiler = Profiler()
+        with profiler.profile("service", "S3", "__init__"):
+            profiler.add_api_call("s3", "ListBuckets", retries=1)
+
+        profiler.display_summary("profile.json")
+
+        output = capsys.readouterr().out
+        assert "Slowest Service stages" in output
+        assert "Slowest Checks" not in output
+        assert "profile.json" in output
+
+    def test_profile_constructor(self, profiler):
+        class Service:
+            @profile_constructor
+            def __init__(self, value):
+                self.value = value
+
+        class SubService(Service):
+            @profile_constructor
+            def __init__(self, value):
+                super().__init__(value)
+
+        assert get_profiler() is profiler
+        assert SubService(1).value == 1
+        assert profiler.get_record("service", "SubService", "__init__").executions == 1
+
+    def test_profile_constructor_disabled(self):
+        class Service:
+            @profile_constructor
+            def __init__(self, value):
+                self.value = value
+
+        assert get_profiler() is None
+        assert Service(1).value == 1
@@ -0,0 +1,60 @@
+import os
+import threading
+
+from prowler.lib.scan.checkpoint import ScanCheckpoint, is_valid_scan_id
+
+
+class TestScanCheckpoint:
+    def test_create(self, tmp_path):
+        checkpoint = ScanCheckpoint.create(
+            "aws", "prowler-output", checkpoints_directory=str(tmp_path)
+        )
+
+        assert is_valid_scan_id(checkpoint.scan_id, str(tmp_path))
+        loaded_checkpoint = ScanCheckpoint.load(checkpoint.scan_id, str(tmp_path))
+        assert loaded_checkpoint.provider == "aws"
+        assert loaded_checkpoint.output_filename == "prowler-output"
+        assert loaded_checkpoint.completed_checks == set()
+
+    def test_save(self, tmp_path):
+        checkpoint = ScanCheckpoint.create("aws", checkpoints_directory=str(tmp_path))
+        checkpoint.save("s3_bucket_public", ["finding-1", "finding-2"])
+        checkpoint.save("s3_bucket_versioning", [])
+        checkpoint.save("ec2_instance_public_ip", ["finding-3"])
+
+        loaded_checkpoint = ScanCheckpoint.load(checkpoint.scan_id, str(tmp_path))
+        assert loaded_checkpoint.service_checks_completed == {
+            "s3": {"s3_bucket_public", "s3_bucket_versioning"},
+            "ec2": {"ec2_instance_public_ip"},
+        }
+        assert loaded_checkpoint.load_findings("s3_bucket_public") == [
+            "finding-1",
+            "finding-2",
+        ]
+        assert loaded_checkpoint.load_findings("s3_bucket_versioning") == []
+
+    def test_save_findings_not_serializable(self, tmp_path):
+        checkpoint = ScanCheckpoint.create("aws", checkpoints_directory=str(tmp_path))
+        checkpoint.save("s3_bucket_public", [threading.Lock()])
+
+        # The check is executed again when resuming
+        assert checkpoint.completed_checks == set()
+        assert (
+            ScanCheckpoint.load(checkpoint.scan_id, str(tmp_path)).completed_checks
+            == set()
+        )
+
+    def test_remove(self, tmp_path):
+        checkpoint = ScanCheckpoint.create("aws", checkpoints_directory=str(tmp_path))
+        checkpoint.save("s3_bucket_public", ["finding-1"])
+
+        checkpoint.remove()
+
+        assert not is_valid_scan_id(checkpoint.scan_id, str(tmp_path))
+        assert os.listdir(tmp_path) == []
+
+    def test_is_valid_scan_id(self, tmp_path):
+        assert not is_valid_scan_id(
+            "8b6c5d0e-0a41-4a4f-9b7b-2f1c1d1e4a3f", str(tmp_path)
+        )
+        assert not is_valid_scan_id("../../etc", str(tmp_path))
@@ -3,6 +3,7 @@ from unittest import mock
 import pytest
 from mock import MagicMock, patch
 
+from prowler.lib.scan.checkpoint import ScanCheckpoint
 from prowler.lib.scan.scan import Scan, get_service_checks_to_execute
 from tests.lib.outputs.fixtures.fixtures import generate_finding_output
 from tests.providers.aws.utils import set_mocked_aws_provider
@@ -241,3 +242,129 @@ class TestScan:
         }
         assert scan.findings == mock_execute.side_effect()
         mock_logger.error.assert_not_called()
+
+    @patch("importlib.import_module")
+    def test_scan_without_storing_findings(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_logger,
+        mock_generate_output,
+    ):
+        mock_check_class = MagicMock()
+        mock_import_module.return_value = MagicMock(
+            accessanalyzer_enabled=mock_check_class
+        )
+        mock_global_provider.type = "aws"
+
+        scan = Scan(
+            mock_global_provider, ["accessanalyzer_enabled"], store_findings=False
+        )
+        results = list(scan.scan({}))
+
+        assert len(results) == 1
+        assert results[0][1] == mock_execute.side_effect()
+        assert scan.findings == []
+        # The findings are not shared between scans
+        assert Scan(mock_global_provider, ["accessanalyzer_enabled"]).findings == []
+        mock_logger.error.assert_not_called()
+
+    @patch("importlib.import_module")
+    def test_scan_parallel_checks(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_logger,
+        mock_generate_output,
+    ):
+        mock_import_module.return_value = MagicMock()
+
+        checks_to_execute = {
+            "accessanalyzer_enabled",
+            "accessanalyzer_enabled_without_findings",
+            "ec2_instance_public_ip",
+        }
+        mock_global_provider.type = "aws"
+
+        scan = Scan(mock_global_provider, checks_to_execute, parallel_checks=2)
+        results = list(scan.scan({}))
+
+        assert scan.parallel_checks == 2
+        assert mock_execute.call_count == 3
+        assert [progress for progress, _ in results] == [
+            pytest.approx(100 / 3),
+            pytest.approx(200 / 3),
+            100.0,
+        ]
+        assert scan.service_checks_completed == {
+            "accessanalyzer": {
+                "accessanalyzer_enabled",
+                "accessanalyzer_enabled_without_findings",
+            },
+            "ec2": {"ec2_instance_public_ip"},
+        }
+        assert scan.service_checks_to_execute == {}
+        mock_logger.error.assert_not_called()
+
+    @patch("importlib.import_module")
+    def test_scan_with_checkpoint(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_logger,
+        mock_generate_output,
+        tmp_path,
+    ):
+        mock_import_module.return_value = MagicMock()
+        mock_global_provider.type = "aws"
+        checks_to_execute = ["accessanalyzer_enabled", "ec2_instance_public_ip"]
+
+        checkpoint = ScanCheckpoint.create("aws", checkpoints_directory=str(tmp_path))
+        scan = Scan(mock_global_provider, checks_to_execute, checkpoint=checkpoint)
+        list(scan.scan({}))
+
+        assert scan.checkpoint is checkpoint
+        checkpoint = ScanCheckpoint.load(
+            checkpoint.scan_id, checkpoints_directory=str(tmp_path)
+        )
+        assert checkpoint.completed_checks == set(checks_to_execute)
+        assert checkpoint.load_findings("ec2_instance_public_ip") == [finding]
+
+    @patch("importlib.import_module")
+    def test_scan_resume_from_checkpoint(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_logger,
+        mock_generate_output,
+        tmp_path,
+    ):
+        mock_import_module.return_value = MagicMock()
+        mock_global_provider.type = "aws"
+        checks_to_execute = ["accessanalyzer_enabled", "ec2_instance_public_ip"]
+
+        # The scan was interrupted after the first check
+        checkpoint = ScanCheckpoint.create("aws", checkpoints_directory=str(tmp_path))
+        checkpoint.save("accessanalyzer_enabled", [finding])
+
+        scan = Scan(
+            mock_global_provider,
+            checks_to_execute,
+            checkpoint=ScanCheckpoint.load(
+                checkpoint.scan_id, checkpoints_directory=str(tmp_path)
+            ),
+        )
+        assert scan.progress == 50.0
+        assert scan.findings == [finding]
+
+        results = list(scan.scan({}))
+
+        assert mock_execute.call_count == 1
+        assert [progress for progress, _ in results] == [100.0]
+        assert len(scan.findings) == 2
+        assert scan.service_checks_completed == {
+            "accessanalyzer": {"accessanalyzer_enabled"},
+            "ec2": {"ec2_instance_public_ip"},
+        }
+        assert scan.service_checks_to_execute == {}
+        mock_logger.error.assert_not_called()
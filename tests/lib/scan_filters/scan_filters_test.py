@@ -1,4 +1,7 @@
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import (
+    AuditResourcesIndex,
+    is_resource_filtered,
+)
 
 
 class Test_Scan_Filters:
@@ -15,3 +18,56 @@ class Test_Scan_Filters:
         )
         assert is_resource_filtered("test_bucket", audit_resources)
         assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+    def test_is_resource_filtered_index(self):
+        audit_resources = AuditResourcesIndex(
+            [
+                "arn:aws:iam::123456789012:user/test_user",
+                "arn:aws:s3:::test_bucket",
+                "arn:aws:s3:::test_bucket_logs/prefix",
+            ]
+        )
+        assert is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test_user", audit_resources
+        )
+        assert not is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test1", audit_resources
+        )
+        assert is_resource_filtered("test_bucket", audit_resources)
+        assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+        # Partial ARNs and names are contained in the resources to audit
+        assert is_resource_filtered("arn:aws:s3:::test_bucket_logs", audit_resources)
+        assert is_resource_filtered("user/test_user", audit_resources)
+        assert not is_resource_filtered("arn:aws:s3:::other_bucket", audit_resources)
+        assert not is_resource_filtered("other_bucket", audit_resources)
+
+    def test_is_resource_filtered_index_inner_arn(self):
+        audit_resources = AuditResourcesIndex(
+            ["arn:aws:states:us-east-1:123456789012:execution:arn:aws:s3:::bucket"]
+        )
+        assert is_resource_filtered("arn:aws:s3:::bucket", audit_resources)
+        assert not is_resource_filtered("arn:aws:s3:::other", audit_resources)
+
+    def test_is_resource_filtered_index_same_as_list(self):
+        resources = [
+            "arn:aws:iam::123456789012:role/admin",
+            "arn:aws:iam::123456789012:role/admin-readonly",
+            "arn:aws:ec2:us-east-1:123456789012:instance/i-123",
+            "arn:aws:s3:::bucket",
+        ]
+        audit_resources = AuditResourcesIndex(resources)
+
+        assert audit_resources == resources
+        for resource in (
+            "arn:aws:iam::123456789012:role/admin",
+            "arn:aws:iam::123456789012:role/adm",
+            "arn:aws:iam::123456789012:role/admins",
+            "arn:aws:ec2:us-east-1:123456789012:instance/i-1234",
+            "arn:aws:ec2:us-east-1",
+            "instance/i-123",
+            "i-456",
+            "bucket",
+        ):
+            assert is_resource_filtered(
+                resource, audit_resources
+            ) == is_resource_filtered(resource, resources)
@@ -16,11 +16,9 @@ from pytest import raises
 from tzlocal import get_localzone
 
 from prowler.config.config import load_and_validate_config_file
-from prowler.providers.aws.aws_provider import (
-    AwsProvider,
-    get_aws_available_regions,
-    get_aws_region_for_sts,
-)
+from prowler.lib.api_archive.api_archive import close_api_archive
+from prowler.lib.scan_filters.scan_filters import AuditResourcesIndex
+from prowler.providers.aws.aws_provider import AwsProvider, get_aws_region_for_sts
 from prowler.providers.aws.config import (
     AWS_STS_GLOBAL_ENDPOINT_REGION,
     BOTO3_USER_AGENT_EXTRA,
@@ -33,6 +31,10 @@ from prowler.providers.aws.exceptions.exceptions import (
 )
 from prowler.providers.aws.lib.arn.models import ARN
 from prowler.providers.aws.lib.mutelist.mutelist import AWSMutelist
+from prowler.providers.aws.lib.regions.regions import (
+    AWSRegionsIndex,
+    get_aws_available_regions,
+)
 from prowler.providers.aws.models import (
     AWSAssumeRoleInfo,
     AWSCallerIdentity,
@@ -260,6 +262,34 @@ class TestAWSProvider:
         assert aws_provider.audit_config == {}
         assert aws_provider.session.current_session.region_name == AWS_REGION_US_EAST_1
 
+    def test_aws_provider_record_and_replay(self, tmp_path):
+        archive_path = f"{tmp_path}/scan.zip"
+        try:
+            with mock_aws():
+                recorded_provider = AwsProvider(record=archive_path)
+                recorded_provider.session.current_session.client("s3").create_bucket(
+                    Bucket="bucket"
+                )
+                recorded_buckets = recorded_provider.session.current_session.client(
+                    "s3"
+                ).list_buckets()["Buckets"]
+            close_api_archive()
+
+            # Without the mock, the provider is set up with the recorded responses
+            replayed_provider = AwsProvider(replay=archive_path)
+            assert replayed_provider.identity == recorded_provider.identity
+            assert (
+                replayed_provider._enabled_regions == recorded_provider._enabled_regions
+            )
+            assert (
+                replayed_provider.session.current_session.client("s3").list_buckets()[
+                    "Buckets"
+                ]
+                == recorded_buckets
+            )
+        finally:
+            close_api_archive()
+
     @mock_aws
     def test_aws_provider_organizations_delegated_administrator(self):
         organizations_client = client("organizations", region_name=AWS_REGION_EU_WEST_1)
@@ -783,6 +813,18 @@ aws:
 
         assert len(response.keys()) == 30
 
+    @mock_aws
+    def test_generate_regional_clients_reuses_clients(self):
+        aws_provider = AwsProvider()
+        regional_clients = aws_provider.generate_regional_clients("ec2")
+
+        assert aws_provider.generate_regional_clients("ec2") == regional_clients
+        assert (
+            aws_provider.get_client("ec2", AWS_REGION_EU_WEST_1)
+            is regional_clients[AWS_REGION_EU_WEST_1]
+        )
+        assert regional_clients[AWS_REGION_EU_WEST_1].region == AWS_REGION_EU_WEST_1
+
     @mock_aws
     def test_generate_regional_clients_with_enabled_regions(self):
 
@@ -904,34 +946,36 @@ aws:
         )
 
         with patch(
-            "prowler.providers.aws.aws_provider.parse_json_file",
-            return_value={
-                "services": {
-                    "ec2": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                                "ca-central-1",
-                                "eu-central-1",
-                                "eu-central-2",
-                                "eu-north-1",
-                                "eu-south-1",
-                                "eu-south-2",
-                                AWS_REGION_EU_WEST_1,
-                                "eu-west-2",
-                                "eu-west-3",
-                                "me-central-1",
-                                "me-south-1",
-                                "sa-east-1",
-                                AWS_REGION_US_EAST_1,
-                                "us-east-2",
-                                "us-west-1",
-                                "us-west-2",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_index",
+            return_value=AWSRegionsIndex(
+                {
+                    "services": {
+                        "ec2": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                    "ca-central-1",
+                                    "eu-central-1",
+                                    "eu-central-2",
+                                    "eu-north-1",
+                                    "eu-south-1",
+                                    "eu-south-2",
+                                    AWS_REGION_EU_WEST_1,
+                                    "eu-west-2",
+                                    "eu-west-3",
+                                    "me-central-1",
+                                    "me-south-1",
+                                    "sa-east-1",
+                                    AWS_REGION_US_EAST_1,
+                                    "us-east-2",
+                                    "us-west-1",
+                                    "us-west-2",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert aws_provider.get_available_aws_service_regions("ec2") == {
                 AWS_REGION_US_EAST_1
@@ -943,34 +987,36 @@ aws:
         aws_provider = AwsProvider()
 
         with patch(
-            "prowler.providers.aws.aws_provider.parse_json_file",
-            return_value={
-                "services": {
-                    "ec2": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                                "ca-central-1",
-                                "eu-central-1",
-                                "eu-central-2",
-                                "eu-north-1",
-                                "eu-south-1",
-                                "eu-south-2",
-                                AWS_REGION_EU_WEST_1,
-                                "eu-west-2",
-                                "eu-west-3",
-                                "me-central-1",
-                                "me-south-1",
-                                "sa-east-1",
-                                AWS_REGION_US_EAST_1,
-                                "us-east-2",
-                                "us-west-1",
-                                "us-west-2",
-                            ],
+            "prowler.providers.aws.aws_provider.get_aws_regions_index",
+            return_value=AWSRegionsIndex(
+                {
+                    "services": {
+                        "ec2": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                    "ca-central-1",
+                                    "eu-central-1",
+                                    "eu-central-2",
+                                    "eu-north-1",
+                                    "eu-south-1",
+                                    "eu-south-2",
+                                    AWS_REGION_EU_WEST_1,
+                                    "eu-west-2",
+                                    "eu-west-3",
+                                    "me-central-1",
+                                    "me-south-1",
+                                    "sa-east-1",
+                                    AWS_REGION_US_EAST_1,
+                                    "us-east-2",
+                                    "us-west-1",
+                                    "us-west-2",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert len(aws_provider.get_available_aws_service_regions("ec2")) == 17
 
@@ -1015,6 +1061,7 @@ aws:
         )
 
         tagged_resources = aws_provider.audit_resources
+        assert isinstance(tagged_resources, AuditResourcesIndex)
         assert len(tagged_resources) == 2
         assert image_arn in tagged_resources
         assert instance_arn in tagged_resources
@@ -1033,6 +1080,7 @@ aws:
         )
 
         assert aws_provider.audit_resources == [AWS_ACCOUNT_ARN]
+        assert isinstance(aws_provider.audit_resources, AuditResourcesIndex)
 
     @mock_aws
     def test_validate_credentials_commercial_partition_with_regions(self):
@@ -1560,24 +1608,26 @@ aws:
 
     def test_get_aws_available_regions(self):
         with patch(
-            "prowler.providers.aws.aws_provider.read_aws_regions_file",
-            return_value={
-                "services": {
-                    "acm": {
-                        "regions": {
-                            "aws": [
-                                "af-south-1",
-                            ],
-                            "aws-cn": [
-                                "cn-north-1",
-                            ],
-                            "aws-us-gov": [
-                                "us-gov-west-1",
-                            ],
+            "prowler.providers.aws.lib.regions.regions.get_aws_regions_index",
+            return_value=AWSRegionsIndex(
+                {
+                    "services": {
+                        "acm": {
+                            "regions": {
+                                "aws": [
+                                    "af-south-1",
+                                ],
+                                "aws-cn": [
+                                    "cn-north-1",
+                                ],
+                                "aws-us-gov": [
+                                    "us-gov-west-1",
+                                ],
+                            }
                         }
                     }
                 }
-            },
+            ),
         ):
             assert get_aws_available_regions() == {
                 "af-south-1",
@@ -1721,10 +1771,14 @@ aws:
         ) - timedelta(seconds=session_duration_in_seconds)
 
         current_credentials = aws_provider._assumed_role_configuration.credentials
+        client = aws_provider.get_client("ec2", AWS_REGION_EU_WEST_1)
 
         # Refresh credentials
         refreshed_credentials = aws_provider.refresh_credentials()
 
+        # The clients are created again with the new credentials
+        assert aws_provider.get_client("ec2", AWS_REGION_EU_WEST_1) is not client
+
         # Assert that the refreshed credentials are different
         access_key = refreshed_credentials.get("access_key")
         assert access_key != current_credentials.aws_access_key_id
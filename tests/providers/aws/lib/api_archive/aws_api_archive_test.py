@@ -0,0 +1,59 @@
+import pytest
+from boto3 import session
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from prowler.lib.api_archive.api_archive import APIArchive, APIArchiveResponseNotFound
+from prowler.providers.aws.lib.api_archive.api_archive import register_api_archive
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1
+
+
+def generate_session(api_archive: APIArchive) -> session.Session:
+    aws_session = session.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name=AWS_REGION_US_EAST_1,
+    )
+    register_api_archive(aws_session, api_archive)
+    return aws_session
+
+
+class TestAWSAPIArchive:
+    def test_record_and_replay(self, tmp_path):
+        archive_path = f"{tmp_path}/scan.zip"
+        api_archive = APIArchive(archive_path, "record")
+        with mock_aws():
+            aws_session = generate_session(api_archive)
+            ec2_client = aws_session.client("ec2", region_name=AWS_REGION_EU_WEST_1)
+            vpc_id = ec2_client.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]["VpcId"]
+            recorded_vpcs = ec2_client.describe_vpcs(VpcIds=[vpc_id])["Vpcs"]
+            recorded_identity = aws_session.client("sts").get_caller_identity()
+            with pytest.raises(ClientError):
+                aws_session.client("iam").get_role(RoleName="not-found")
+        api_archive.close()
+
+        # Outside the mock, every response must be served by the archive
+        api_archive = APIArchive(archive_path, "replay")
+        aws_session = generate_session(api_archive)
+        ec2_client = aws_session.client("ec2", region_name=AWS_REGION_EU_WEST_1)
+        assert ec2_client.describe_vpcs(VpcIds=[vpc_id])["Vpcs"] == recorded_vpcs
+        assert (
+            aws_session.client("sts").get_caller_identity()["Account"]
+            == recorded_identity["Account"]
+        )
+        with pytest.raises(ClientError) as error:
+            aws_session.client("iam").get_role(RoleName="not-found")
+        assert error.value.response["Error"]["Code"] == "NoSuchEntity"
+
+    def test_replay_request_not_recorded(self, tmp_path):
+        archive_path = f"{tmp_path}/scan.zip"
+        api_archive = APIArchive(archive_path, "record")
+        with mock_aws():
+            aws_session = generate_session(api_archive)
+            aws_session.client("ec2", region_name=AWS_REGION_EU_WEST_1).describe_vpcs()
+        api_archive.close()
+
+        api_archive = APIArchive(archive_path, "replay")
+        aws_session = generate_session(api_archive)
+        with pytest.raises(APIArchiveResponseNotFound):
+            aws_session.client("ec2", region_name=AWS_REGION_US_EAST_1).describe_vpcs()
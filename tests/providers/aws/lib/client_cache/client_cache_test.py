@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from boto3 import Session
+from botocore.config import Config
+
+from prowler.providers.aws.lib.client_cache.client_cache import (
+    AWSClientCache,
+    share_data_loader,
+)
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1
+
+
+def create_session() -> Session:
+    return Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name=AWS_REGION_US_EAST_1,
+    )
+
+
+class Test_AWSClientCache:
+    def test_get_client(self):
+        client_cache = AWSClientCache()
+        session = create_session()
+        config = Config()
+
+        client = client_cache.get_client(session, "ec2", AWS_REGION_EU_WEST_1, config)
+
+        assert client.region == AWS_REGION_EU_WEST_1
+        assert client.meta.region_name == AWS_REGION_EU_WEST_1
+        assert (
+            client_cache.get_client(session, "ec2", AWS_REGION_EU_WEST_1, config)
+            is client
+        )
+        assert (
+            client_cache.get_client(session, "ec2", AWS_REGION_US_EAST_1, config)
+            is not client
+        )
+        assert (
+            client_cache.get_client(session, "s3", AWS_REGION_EU_WEST_1, config)
+            is not client
+        )
+
+    def test_get_client_other_session_or_config(self):
+        client_cache = AWSClientCache()
+        session = create_session()
+        config = Config()
+        client = client_cache.get_client(session, "ec2", AWS_REGION_EU_WEST_1, config)
+
+        other_session_client = client_cache.get_client(
+            create_session(), "ec2", AWS_REGION_EU_WEST_1, config
+        )
+        assert other_session_client is not client
+        assert (
+            client_cache.get_client(session, "ec2", AWS_REGION_EU_WEST_1, Config())
+            is not client
+        )
+
+    def test_invalidate(self):
+        client_cache = AWSClientCache()
+        session = create_session()
+        client = client_cache.get_client(session, "ec2", AWS_REGION_EU_WEST_1)
+
+        client_cache.invalidate()
+
+        assert client_cache.generation == 1
+        assert (
+            client_cache.get_client(session, "ec2", AWS_REGION_EU_WEST_1) is not client
+        )
+
+    def test_get_client_from_threads(self):
+        client_cache = AWSClientCache()
+        session = create_session()
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            clients = list(
+                executor.map(
+                    lambda _: client_cache.get_client(
+                        session, "iam", AWS_REGION_US_EAST_1
+                    ),
+                    range(50),
+                )
+            )
+
+        assert all(client is clients[0] for client in clients)
+
+
+class Test_share_data_loader:
+    def test_share_data_loader(self):
+        session = create_session()
+        other_session = create_session()
+
+        share_data_loader(session)
+        share_data_loader(other_session)
+
+        # The first session of the process shares its loader with the next ones
+        assert other_session._session.get_component(
+            "data_loader"
+        ) is session._session.get_component("data_loader")
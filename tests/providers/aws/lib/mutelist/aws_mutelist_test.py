@@ -381,6 +381,81 @@ class TestAWSMutelist:
 
         assert mutelist.is_finding_muted(finding_1, AWS_ACCOUNT_NUMBER)
 
+    def test_mute_findings(self):
+        # Mutelist
+        mutelist_content = {
+            "Accounts": {
+                AWS_ACCOUNT_NUMBER: {
+                    "Checks": {
+                        "check_test": {
+                            "Regions": [AWS_REGION_US_EAST_1],
+                            "Resources": ["prowler"],
+                            "Tags": ["environment=dev"],
+                        },
+                        "*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Exceptions": {"Regions": [AWS_REGION_EU_WEST_1]},
+                        },
+                    }
+                }
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        # Findings of the same resource share its tags
+        resource_tags = [{"Key": "environment", "Value": "dev"}]
+        findings = []
+        for check_id, region, resource_id, tags in (
+            ("check_test", AWS_REGION_US_EAST_1, "prowler", resource_tags),
+            ("check_test", AWS_REGION_US_EAST_1, "prowler-pro", resource_tags),
+            ("check_test", AWS_REGION_EU_WEST_1, "prowler", resource_tags),
+            ("check_test", AWS_REGION_EU_WEST_1, "prowler", []),
+            ("other_check", AWS_REGION_EU_SOUTH_3, "test", []),
+            ("other_check", AWS_REGION_EU_WEST_1, "test", []),
+        ):
+            finding = MagicMock()
+            finding.check_metadata = MagicMock(CheckID=check_id)
+            finding.region = region
+            finding.resource_id = resource_id
+            finding.resource_tags = tags
+            findings.append(finding)
+
+        mutelist.mute_findings(findings, AWS_ACCOUNT_NUMBER)
+
+        assert [finding.muted for finding in findings] == [
+            True,
+            True,
+            False,
+            False,
+            True,
+            False,
+        ]
+        for finding in findings:
+            assert finding.muted == mutelist.is_finding_muted(
+                finding, AWS_ACCOUNT_NUMBER
+            )
+
+    def test_mute_findings_other_account(self):
+        mutelist_content = {
+            "Accounts": {
+                "111122223333": {
+                    "Checks": {"*": {"Regions": ["*"], "Resources": ["*"]}}
+                }
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        finding = MagicMock()
+        finding.check_metadata = MagicMock(CheckID="check_test")
+        finding.region = AWS_REGION_US_EAST_1
+        finding.resource_id = "prowler"
+        finding.resource_tags = []
+
+        mutelist.mute_findings([finding], AWS_ACCOUNT_NUMBER)
+
+        assert finding.muted is False
+
     def test_is_muted_with_everything_excepted(self):
         # Mutelist
         mutelist_content = {
@@ -0,0 +1,46 @@
+from boto3 import session
+from moto import mock_aws
+
+from prowler.lib.profiling.profiling import Profiler
+from prowler.providers.aws.lib.profiling.profiling import register_profiling
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1
+
+
+class TestAWSProfiling:
+    @mock_aws
+    def test_register_profiling(self):
+        profiler = Profiler()
+        aws_session = session.Session(region_name=AWS_REGION_EU_WEST_1)
+        register_profiling(aws_session, profiler)
+        ec2_client = aws_session.client("ec2")
+
+        ec2_client.describe_vpcs()
+        with profiler.profile("service", "VPC", "_describe_vpcs"):
+            ec2_client.describe_vpcs()
+            ec2_client.describe_subnets()
+
+        assert profiler.get_record("api", "ec2", "DescribeVpcs").api_calls == 1
+        assert profiler.get_record("service", "VPC", "_describe_vpcs").api_calls == 2
+
+    @mock_aws
+    def test_register_profiling_throttles(self):
+        profiler = Profiler()
+        aws_session = session.Session(region_name=AWS_REGION_EU_WEST_1)
+        register_profiling(aws_session, profiler)
+        operation = aws_session.client("ec2").meta.service_model.operation_model(
+            "DescribeVpcs"
+        )
+
+        # The session emitter only has the profiling handlers, not the retry ones
+        for error_code in ("RequestLimitExceeded", "UnauthorizedOperation"):
+            aws_session.events.emit(
+                "needs-retry.ec2.DescribeVpcs",
+                response=(None, {"Error": {"Code": error_code}}),
+                endpoint=None,
+                operation=operation,
+                attempts=1,
+                caught_exception=None,
+                request_dict={},
+            )
+
+        assert profiler.get_record("api", "ec2", "DescribeVpcs").throttles == 1
@@ -0,0 +1,92 @@
+import pytest
+
+from prowler.providers.aws.lib.regions.regions import (
+    AWSRegionsIndex,
+    get_aws_regions_index,
+)
+from tests.providers.aws.utils import (
+    AWS_REGION_EU_WEST_1,
+    AWS_REGION_US_EAST_1,
+    AWS_REGION_US_EAST_2,
+)
+
+REGIONS_DATA = {
+    "services": {
+        "ec2": {
+            "regions": {
+                "aws": [
+                    AWS_REGION_EU_WEST_1,
+                    AWS_REGION_US_EAST_1,
+                    AWS_REGION_US_EAST_2,
+                ],
+                "aws-cn": ["cn-north-1"],
+            }
+        },
+        "iam": {"regions": {"aws": [AWS_REGION_US_EAST_1]}},
+    }
+}
+
+
+class Test_AWSRegionsIndex:
+    def test_regions(self):
+        index = AWSRegionsIndex(REGIONS_DATA)
+
+        assert set(index.services) == {"ec2", "iam"}
+        assert index.regions == {
+            AWS_REGION_EU_WEST_1,
+            AWS_REGION_US_EAST_1,
+            AWS_REGION_US_EAST_2,
+            "cn-north-1",
+        }
+        with pytest.raises(TypeError):
+            index.services["s3"] = {}
+
+    def test_get_service_regions(self):
+        index = AWSRegionsIndex(REGIONS_DATA)
+
+        assert index.get_service_regions("ec2", "aws") == {
+            AWS_REGION_EU_WEST_1,
+            AWS_REGION_US_EAST_1,
+            AWS_REGION_US_EAST_2,
+        }
+        assert index.get_service_regions("ec2", "aws-cn") == {"cn-north-1"}
+        assert index.get_service_regions(
+            "ec2", "aws", audited_regions={AWS_REGION_US_EAST_1, "ap-south-1"}
+        ) == {AWS_REGION_US_EAST_1}
+        assert index.get_service_regions(
+            "ec2",
+            "aws",
+            audited_regions=[AWS_REGION_US_EAST_1, AWS_REGION_US_EAST_2],
+            enabled_regions={AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_2},
+        ) == {AWS_REGION_US_EAST_2}
+        assert index.get_service_regions(
+            "ec2", "aws", enabled_regions={AWS_REGION_EU_WEST_1}
+        ) == {AWS_REGION_EU_WEST_1}
+
+    def test_get_service_regions_computed_once(self):
+        index = AWSRegionsIndex(REGIONS_DATA)
+
+        regions = index.get_service_regions(
+            "ec2", "aws", audited_regions={AWS_REGION_US_EAST_1}
+        )
+        assert (
+            index.get_service_regions(
+                "ec2", "aws", audited_regions=[AWS_REGION_US_EAST_1]
+            )
+            is regions
+        )
+
+    def test_get_service_regions_not_present(self):
+        index = AWSRegionsIndex(REGIONS_DATA)
+
+        with pytest.raises(KeyError):
+            index.get_service_regions("s3", "aws")
+        with pytest.raises(KeyError):
+            index.get_service_regions("iam", "aws-cn")
+
+    def test_get_aws_regions_index(self):
+        index = get_aws_regions_index()
+
+        assert get_aws_regions_index() is index
+        assert "ec2" in index.services
+        assert AWS_REGION_US_EAST_1 in index.get_service_regions("ec2", "aws")
@@ -1,6 +1,9 @@
+import threading
+
 from mock import patch
 
-from prowler.providers.aws.lib.service.service import AWSService
+from prowler.lib.profiling.profiling import disable_profiler, enable_profiler
+from prowler.providers.aws.lib.service.service import AWSService, ServiceCollection
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_ARN,
     AWS_ACCOUNT_NUMBER,
@@ -18,6 +21,32 @@ def mock_generate_regional_clients(provider, service):
     return {AWS_REGION_US_EAST_1: regional_client}
 
 
+class Collector(AWSService):
+    items = ServiceCollection("_collect_items")
+    regions_with_items = ServiceCollection("_collect_items")
+    items_summary = ServiceCollection("_collect_items_summary")
+
+    def __init__(self, provider):
+        super().__init__("ec2", provider)
+        self.collector_calls = []
+
+    def _collect_items(self):
+        self.collector_calls.append("_collect_items")
+        self.items = []
+        self.regions_with_items = []
+        self.__threading_call__(self._get_items)
+
+    def _get_items(self, regional_client):
+        # Read by the pool while it is being populated
+        self.items.append(f"item-{regional_client.region}")
+        self.regions_with_items.append(regional_client.region)
+
+    def _collect_items_summary(self):
+        self.collector_calls.append("_collect_items_summary")
+        self.__collect__("_collect_items")
+        self.items_summary = len(self.items)
+
+
 @patch(
     "prowler.providers.aws.aws_provider.AwsProvider.generate_regional_clients",
     new=mock_generate_regional_clients,
@@ -90,3 +119,59 @@ class TestAWSService:
             check_id,
             "arn:aws:ec2:eu-central-1:123456789:security-group/sg-87654321",
         )
+
+    def test_AWSService_collection_is_lazy(self):
+        service = Collector(set_mocked_aws_provider())
+
+        assert service.collector_calls == []
+        assert service.items == [f"item-{AWS_REGION_US_EAST_1}"]
+        assert service.regions_with_items == [AWS_REGION_US_EAST_1]
+        # One collection method populates both attributes, only once
+        assert service.collector_calls == ["_collect_items"]
+
+    def test_AWSService_collection_dependencies(self):
+        service = Collector(set_mocked_aws_provider())
+
+        assert service.items_summary == 1
+        assert service.collector_calls == ["_collect_items_summary", "_collect_items"]
+        assert service.items == [f"item-{AWS_REGION_US_EAST_1}"]
+        assert service.collector_calls == ["_collect_items_summary", "_collect_items"]
+
+    def test_AWSService_collection_assigned(self):
+        service = Collector(set_mocked_aws_provider())
+        service.items = ["item"]
+
+        assert service.items == ["item"]
+        assert service.collector_calls == []
+        assert isinstance(Collector.items, ServiceCollection)
+
+    def test_AWSService_collection_concurrent_reads(self):
+        service = Collector(set_mocked_aws_provider())
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(list(service.items)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [[f"item-{AWS_REGION_US_EAST_1}"]] * 5
+        assert service.collector_calls == ["_collect_items"]
+
+    def test_AWSService_profiled(self):
+        profiler = enable_profiler()
+        try:
+            service = Collector(set_mocked_aws_provider())
+            assert service.items_summary == 1
+        finally:
+            disable_profiler()
+
+        assert profiler.get_record("service", "Collector", "__init__").executions == 1
+        assert (
+            profiler.get_record("service", "Collector", "_collect_items").executions
+            == 1
+        )
+        assert profiler.get_record("service", "Collector", "_get_items").executions == 1
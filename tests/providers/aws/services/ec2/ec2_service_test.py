@@ -1,4 +1,6 @@
+import ast
 import ipaddress
+import os
 import re
 from base64 import b64decode, b64encode
 from datetime import datetime
@@ -11,6 +13,8 @@ from freezegun import freeze_time
 from moto import mock_aws
 
 from prowler.config.config import encoding_format_utf_8
+from prowler.providers.aws.lib.service.service import ServiceCollection
+from prowler.providers.aws.services.ec2 import ec2_service
 from prowler.providers.aws.services.ec2.ec2_service import EC2
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
@@ -68,6 +72,51 @@ class Test_EC2_Service:
         ec2 = EC2(aws_provider)
         assert ec2.service == "ec2"
 
+    # Test EC2 collections are fetched when read
+    @mock_aws
+    def test_collections_are_lazy(self):
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1]
+        )
+        with mock.patch.object(
+            EC2, "_describe_instances", autospec=True
+        ) as describe_instances:
+            ec2 = EC2(aws_provider)
+            describe_instances.assert_not_called()
+
+            assert ec2.network_acls
+            describe_instances.assert_not_called()
+
+            assert ec2.instances == []
+            assert describe_instances.call_count == 2
+
+    # Test the EC2 attributes read by the checks are declared in the service
+    @mock_aws
+    def test_checks_read_declared_attributes(self):
+        ec2 = EC2(set_mocked_aws_provider([AWS_REGION_US_EAST_1]))
+        # dir() does not fetch the collections
+        ec2_attributes = set(dir(ec2))
+        services_directory = os.path.dirname(os.path.dirname(ec2_service.__file__))
+        undeclared = []
+        for root, _, files in os.walk(services_directory):
+            for file_name in files:
+                if not file_name.endswith(".py"):
+                    continue
+                file_path = os.path.join(root, file_name)
+                with open(file_path) as f:
+                    tree = ast.parse(f.read())
+                for node in ast.walk(tree):
+                    if (
+                        isinstance(node, ast.Attribute)
+                        and isinstance(node.value, ast.Name)
+                        and node.value.id == "ec2_client"
+                        and node.attr not in ec2_attributes
+                    ):
+                        undeclared.append(f"{file_path}: {node.attr}")
+
+        assert undeclared == []
+        assert isinstance(EC2.instances, ServiceCollection)
+
     # Test EC2 Client
     @mock_aws
     def test_client(self):
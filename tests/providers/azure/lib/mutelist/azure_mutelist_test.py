@@ -66,3 +66,39 @@ class TestAzureMutelist:
         finding.subscription = "subscription_1"
 
         assert mutelist.is_finding_muted(finding)
+
+    def test_mute_findings(self):
+        # Mutelist
+        mutelist_content = {
+            "Accounts": {
+                "subscription_1": {
+                    "Checks": {
+                        "check_test": {
+                            "Regions": ["*"],
+                            "Resources": ["test_resource"],
+                        }
+                    }
+                }
+            }
+        }
+
+        mutelist = AzureMutelist(mutelist_content=mutelist_content)
+
+        findings = []
+        for subscription, resource_name in (
+            ("subscription_1", "test_resource"),
+            ("subscription_1", "other_resource"),
+            ("subscription_2", "test_resource"),
+        ):
+            finding = MagicMock()
+            finding.check_metadata = MagicMock(CheckID="check_test")
+            finding.location = "West Europe"
+            finding.status = "FAIL"
+            finding.resource_name = resource_name
+            finding.resource_tags = []
+            finding.subscription = subscription
+            findings.append(finding)
+
+        mutelist.mute_findings(findings)
+
+        assert [finding.muted for finding in findings] == [True, False, False]
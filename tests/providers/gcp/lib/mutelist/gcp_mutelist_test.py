@@ -64,3 +64,39 @@ class TestGCPMutelist:
         finding.project_id = "project_1"
 
         assert mutelist.is_finding_muted(finding)
+
+    def test_mute_findings(self):
+        # Mutelist
+        mutelist_content = {
+            "Accounts": {
+                "project_1": {
+                    "Checks": {
+                        "check_test": {
+                            "Regions": ["*"],
+                            "Resources": ["test_resource"],
+                        }
+                    }
+                }
+            }
+        }
+
+        mutelist = GCPMutelist(mutelist_content=mutelist_content)
+
+        findings = []
+        for project_id, resource_name in (
+            ("project_1", "test_resource"),
+            ("project_1", "other_resource"),
+            ("project_2", "test_resource"),
+        ):
+            finding = MagicMock()
+            finding.check_metadata = MagicMock(CheckID="check_test")
+            finding.location = "us-central1"
+            finding.status = "FAIL"
+            finding.resource_name = resource_name
+            finding.resource_tags = []
+            finding.project_id = project_id
+            findings.append(finding)
+
+        mutelist.mute_findings(findings)
+
+        assert [finding.muted for finding in findings] == [True, False, False]
@@ -128,3 +128,42 @@ class TestKubernetesMutelist:
         finding.resource_tags = []
 
         assert mutelist.is_finding_muted(finding, "cluster_1")
+
+    def test_mute_findings(self):
+        # Mutelist
+        mutelist_content = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "apiserver_*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Exceptions": {
+                                "Accounts": ["cluster_1"],
+                                "Regions": ["namespace1"],
+                            },
+                        }
+                    }
+                }
+            }
+        }
+
+        mutelist = KubernetesMutelist(mutelist_content=mutelist_content)
+
+        findings = []
+        for check_id, namespace in (
+            ("apiserver_etcd_cafile_set", "namespace1"),
+            ("apiserver_etcd_cafile_set", "namespace2"),
+            ("kubelet_manage_iptables", "namespace2"),
+        ):
+            finding = MagicMock()
+            finding.check_metadata = MagicMock(CheckID=check_id)
+            finding.status = "FAIL"
+            finding.resource_name = "test_resource"
+            finding.namespace = namespace
+            finding.resource_tags = []
+            findings.append(finding)
+
+        mutelist.mute_findings(findings, "cluster_1")
+
+        assert [finding.muted for finding in findings] == [False, True, False]
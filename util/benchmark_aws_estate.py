@@ -0,0 +1,331 @@
+"""
+Benchmark the AWS services and checks against a synthetic estate mocked with moto.
+
+The estate is generated in memory with the requested number of resources, the selected
+checks are executed against it and the wall time, the API calls and the peak memory of
+the scan, and of each service stage and check, are written to a JSON file. Comparing it
+with the file of a previous version shows the scan-time improvements and regressions.
+
+Usage:
+    python util/benchmark_aws_estate.py --output benchmark.json
+    python util/benchmark_aws_estate.py --scale 0.1 --baseline benchmark.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+
+import boto3
+from moto import mock_aws
+
+from prowler.config.config import (
+    default_config_file_path,
+    load_and_validate_config_file,
+    prowler_version,
+)
+from prowler.lib.check.check import execute, import_check
+from prowler.lib.profiling.profiling import enable_profiler, get_peak_memory
+from prowler.providers.aws.aws_provider import AwsProvider
+from prowler.providers.common.models import Audit_Metadata
+from prowler.providers.common.provider import Provider
+
+# Logging config
+logging.basicConfig(
+    stream=sys.stdout,
+    format="%(asctime)s [File: %(filename)s:%(lineno)d] \t[Module: %(module)s]\t %(levelname)s: %(message)s",
+    datefmt="%m/%d/%Y %I:%M:%S %p",
+    level=logging.ERROR,
+)
+# Only the progress of the benchmark is logged, not the one of every service
+logger = logging.getLogger("benchmark")
+logger.setLevel(logging.INFO)
+
+BENCHMARK_REGION = "us-east-1"
+BENCHMARK_AMI_ID = "ami-12c6146b"
+# Resources created per API call when the API allows creating them in bulk
+BENCHMARK_BATCH_SIZE = 500
+
+DEFAULT_ESTATE = {
+    "instances": 10000,
+    "security_groups": 5000,
+    "buckets": 2000,
+    "roles": 10000,
+    "users": 1000,
+}
+
+DEFAULT_CHECKS = [
+    "ec2_instance_public_ip",
+    "ec2_securitygroup_allow_ingress_from_internet_to_all_ports",
+    "ec2_securitygroup_default_restrict_traffic",
+    "iam_role_administratoraccess_policy",
+    "iam_role_cross_service_confused_deputy_prevention",
+    "iam_user_no_setup_initial_access_key",
+    "s3_bucket_default_encryption",
+    "s3_bucket_level_public_access_block",
+]
+
+# Durations below this number of seconds are too noisy to be compared with the baseline
+MINIMUM_COMPARED_DURATION = 1.0
+
+ROLE_ASSUME_ROLE_POLICY = {
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {"Service": "ec2.amazonaws.com"},
+            "Action": "sts:AssumeRole",
+        }
+    ],
+}
+
+
+def create_estate(estate: dict) -> None:
+    """Create the resources of the estate in the mocked account"""
+    ec2_client = boto3.client("ec2", region_name=BENCHMARK_REGION)
+    s3_client = boto3.client("s3", region_name=BENCHMARK_REGION)
+    iam_client = boto3.client("iam", region_name=BENCHMARK_REGION)
+
+    logger.info(f"Creating {estate['security_groups']} security groups")
+    security_group_ids = []
+    for index in range(estate["security_groups"]):
+        security_group_id = ec2_client.create_security_group(
+            GroupName=f"benchmark-sg-{index}", Description="Benchmark"
+        )["GroupId"]
+        # Every other security group is open to the Internet
+        if index % 2 == 0:
+            ec2_client.authorize_security_group_ingress(
+                GroupId=security_group_id,
+                IpPermissions=[
+                    {
+                        "IpProtocol": "-1",
+                        "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
+                    }
+                ],
+            )
+        security_group_ids.append(security_group_id)
+
+    logger.info(f"Creating {estate['instances']} instances")
+    for index in range(0, estate["instances"], BENCHMARK_BATCH_SIZE):
+        count = min(BENCHMARK_BATCH_SIZE, estate["instances"] - index)
+        run_instances_parameters = {
+            "ImageId": BENCHMARK_AMI_ID,
+            "MinCount": count,
+            "MaxCount": count,
+        }
+        if security_group_ids:
+            run_instances_parameters["SecurityGroupIds"] = [
+                security_group_ids[
+                    (index // BENCHMARK_BATCH_SIZE) % len(security_group_ids)
+                ]
+            ]
+        ec2_client.run_instances(**run_instances_parameters)
+
+    logger.info(f"Creating {estate['buckets']} buckets")
+    for index in range(estate["buckets"]):
+        s3_client.create_bucket(Bucket=f"benchmark-bucket-{index}")
+
+    logger.info(f"Creating {estate['roles']} roles")
+    for index in range(estate["roles"]):
+        iam_client.create_role(
+            RoleName=f"benchmark-role-{index}",
+            AssumeRolePolicyDocument=json.dumps(ROLE_ASSUME_ROLE_POLICY),
+        )
+        # Every tenth role is an administrator
+        if index % 10 == 0:
+            iam_client.attach_role_policy(
+                RoleName=f"benchmark-role-{index}",
+                PolicyArn="arn:aws:iam::aws:policy/AdministratorAccess",
+            )
+
+    logger.info(f"Creating {estate['users']} users")
+    for index in range(estate["users"]):
+        iam_client.create_user(UserName=f"benchmark-user-{index}")
+
+
+def run_benchmark(estate: dict, checks: list) -> dict:
+    """
+    Create the estate and execute the checks against it.
+
+    Returns:
+        dict: The estate, the totals of the scan and the measures of each service stage and check.
+    """
+    # The AWS managed policies are loaded to attach them as in a real account
+    with mock_aws(config={"iam": {"load_aws_managed_policies": True}}):
+        start_time = time.perf_counter()
+        create_estate(estate)
+        estate_creation_time = time.perf_counter() - start_time
+
+        # The profiler must be enabled before creating the provider sessions
+        profiler = enable_profiler()
+        start_memory = get_peak_memory()
+        start_time = time.perf_counter()
+        provider = AwsProvider(
+            regions={BENCHMARK_REGION},
+            audit_config=load_and_validate_config_file("aws", default_config_file_path),
+        )
+        provider.audit_metadata = Audit_Metadata(
+            services_scanned=0,
+            expected_checks=checks,
+            completed_checks=0,
+            audit_progress=0,
+        )
+        Provider.set_global_provider(provider)
+
+        findings = {}
+        for check_name in checks:
+            logger.info(f"Executing {check_name}")
+            service = check_name.split("_")[0]
+            check_module = import_check(
+                f"prowler.providers.aws.services.{service}.{check_name}.{check_name}"
+            )
+            check = getattr(check_module, check_name)()
+            findings[check_name] = len(execute(check, provider, None))
+        wall_time = time.perf_counter() - start_time
+        peak_memory = get_peak_memory() - start_memory
+
+    records = profiler.records
+    return {
+        "prowler_version": prowler_version,
+        "python_version": platform.python_version(),
+        "estate": estate,
+        "estate_creation_time": round(estate_creation_time, 3),
+        "wall_time": round(wall_time, 3),
+        "api_calls": sum(record.api_calls for record in records),
+        "peak_memory": peak_memory,
+        "services": {
+            f"{record.name}.{record.stage}": {
+                "duration": round(record.duration, 3),
+                "api_calls": record.api_calls,
+            }
+            for record in records
+            if record.kind == "service"
+        },
+        "checks": {
+            record.name: {
+                "duration": round(record.duration, 3),
+                "api_calls": record.api_calls,
+                "findings": findings.get(record.name, 0),
+            }
+            for record in records
+            if record.kind == "check"
+        },
+    }
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Return the measures that grew since the baseline.
+
+    The API calls must not grow for the same estate, the durations and the memory
+    vary between runs so they are only reported when they grew more than the tolerance.
+    """
+    regressions = []
+
+    def compare(name: str, value: float, baseline_value: float, allowed_growth: float):
+        if baseline_value is not None and value > baseline_value * (1 + allowed_growth):
+            regressions.append(f"{name}: {baseline_value} -> {value}")
+
+    def compare_duration(name: str, value: float, baseline_value: float):
+        if value >= MINIMUM_COMPARED_DURATION:
+            compare(name, value, baseline_value, tolerance)
+
+    if results["estate"] != baseline.get("estate"):
+        logger.warning(
+            "The estate of the baseline is different, the measures are not comparable"
+        )
+    compare_duration("wall_time", results["wall_time"], baseline.get("wall_time"))
+    compare("api_calls", results["api_calls"], baseline.get("api_calls"), 0)
+    compare(
+        "peak_memory", results["peak_memory"], baseline.get("peak_memory"), tolerance
+    )
+    for kind in ("services", "checks"):
+        for name, measures in results[kind].items():
+            baseline_measures = baseline.get(kind, {}).get(name, {})
+            compare_duration(
+                f"{name}.duration",
+                measures["duration"],
+                baseline_measures.get("duration"),
+            )
+            compare(
+                f"{name}.api_calls",
+                measures["api_calls"],
+                baseline_measures.get("api_calls"),
+                0,
+            )
+    return regressions
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the AWS services and checks against a synthetic estate mocked with moto"
+    )
+    for resource, count in DEFAULT_ESTATE.items():
+        parser.add_argument(
+            f"--{resource.replace('_', '-')}",
+            type=int,
+            default=count,
+            help=f"Number of {resource.replace('_', ' ')} of the estate (default: {count})",
+        )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply the number of resources of the estate, e.g. 0.1 for a quick run",
+    )
+    parser.add_argument(
+        "--checks",
+        nargs="+",
+        default=DEFAULT_CHECKS,
+        help="Checks to execute against the estate",
+    )
+    parser.add_argument(
+        "--output",
+        default="benchmark.json",
+        help="JSON file to write the results to (default: benchmark.json)",
+    )
+    parser.add_argument(
+        "--baseline",
+        help="JSON file with the results of a previous run to compare with, exits with 1 if any measure regressed",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Growth allowed over the baseline before reporting a regression (default: 0.2)",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    # moto must never reach a real account
+    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+    os.environ["AWS_DEFAULT_REGION"] = BENCHMARK_REGION
+    os.environ.pop("AWS_PROFILE", None)
+
+    estate = {
+        resource: int(getattr(arguments, resource) * arguments.scale)
+        for resource in DEFAULT_ESTATE
+    }
+    results = run_benchmark(estate, arguments.checks)
+    with open(arguments.output, "w") as output_file:
+        json.dump(results, output_file, indent=4)
+    logger.info(
+        f"Scan of {estate} in {results['wall_time']}s with {results['api_calls']} API calls and {results['peak_memory']} KiB of peak memory growth, results in {arguments.output}"
+    )
+
+    if arguments.baseline:
+        with open(arguments.baseline) as baseline_file:
+            regressions = compare_with_baseline(
+                results, json.load(baseline_file), arguments.tolerance
+            )
+        if regressions:
+            logger.error("Regressions since the baseline:\n" + "\n".join(regressions))
+            sys.exit(1)
+        logger.info("No regressions since the baseline")